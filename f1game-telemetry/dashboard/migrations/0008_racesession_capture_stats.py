@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0007_telemetrydata_drs_telemetrydata_ers_deploy_mode_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='racesession',
+            name='capture_stats',
+            field=models.JSONField(blank=True, help_text='Dinleyici tarafından ölçülen paket kaybı / jitter özeti', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0008_racesession_capture_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='racesession',
+            name='rig',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='Seansın kaydedildiği simülatör (rig) etiketi', max_length=50),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0009_racesession_rig'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lap',
+            name='drs_ratio',
+            field=models.FloatField(blank=True, help_text="Turdaki telemetri noktalarında DRS'in açık olduğu oran (0.0 - 1.0)", null=True),
+        ),
+        migrations.AddField(
+            model_name='lap',
+            name='ers_deploy_mode',
+            field=models.IntegerField(blank=True, help_text='Turda en sık kullanılan ERS modu (0=yok, 1=medium, 2=hotlap, 3=overtake)', null=True),
+        ),
+    ]
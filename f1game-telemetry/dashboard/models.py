@@ -57,6 +57,22 @@ class RaceSession(models.Model):
         help_text="Oyun Modu (Kariyer, Online, GP vb.)"
     )
     
+    # Birden fazla simülatör dinlenirken seansın geldiği rig'in etiketi (ör. "Rig 2")
+    rig = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text="Seansın kaydedildiği simülatör (rig) etiketi"
+    )
+
+    # Dinleyicinin bu seans için ölçtüğü paket kaybı, sıra dışı varış ve jitter özeti
+    capture_stats = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Dinleyici tarafından ölçülen paket kaybı / jitter özeti"
+    )
+
     # Seansın veritabanına kaydedildiği zaman (otomatik olarak atanır)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -106,6 +122,18 @@ class Lap(models.Model):
     # Turun seans içindeki bitiş zamanı (saniye). Telemetri bağlamak için kritik.
     end_time = models.FloatField(null=True, blank=True)   
 
+    ers_deploy_mode = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="Turda en sık kullanılan ERS modu (0=yok, 1=medium, 2=hotlap, 3=overtake)"
+    )
+
+    drs_ratio = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Turdaki telemetri noktalarında DRS'in açık olduğu oran (0.0 - 1.0)"
+    )
+
     class Meta:
         # Bir seansta aynı tur numarasından sadece bir tane olabilir
         unique_together = ('session', 'lap_number') 
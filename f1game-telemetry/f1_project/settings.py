@@ -123,3 +123,28 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Telemetri dinleyicisi (listen_telemetry)
+# Komut satırı seçenekleri (--host, --port, --rcvbuf, --batch-size) bu değerleri ezer.
+
+TELEMETRY_UDP_HOST = '0.0.0.0'
+
+TELEMETRY_UDP_PORT = 20777
+
+# SO_RCVBUF (bayt). None ise işletim sisteminin varsayılanı kullanılır.
+TELEMETRY_UDP_RCVBUF = 4 * 1024 * 1024
+
+# Her uyanışta soketten okunacak en fazla datagram sayısı.
+TELEMETRY_RECV_BATCH = 64
+
+# Alınan datagramların olduğu gibi iletileceği yerel hedefler, ör. ['127.0.0.1:20778', '127.0.0.1:20779=6,7'].
+# "=id,id" ile hedef başına paket türü filtresi verilebilir. --forward seçenekleri bu listeye eklenir.
+TELEMETRY_FORWARD_TARGETS = []
+
+# Tek süreçte dinlenecek simülatörler (rig), ör. ['Rig 1=20777', 'Rig 2=20778'] ya da 'Rig 3=0.0.0.0:20779'.
+# Boş değilse TELEMETRY_UDP_PORT yerine bu portlar dinlenir; --rig seçenekleri bu listeye eklenir.
+TELEMETRY_RIGS = []
+
+# Ortak porta gönderen rig'lerin kaynak adresleri, ör. ['Rig 1=192.168.1.21', 'Rig 2=192.168.1.22'].
+TELEMETRY_RIG_SOURCES = []
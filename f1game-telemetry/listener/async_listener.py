@@ -0,0 +1,403 @@
+# listener/async_listener.py
+"""
+asyncio ``DatagramProtocol`` tabanlı dinleyici.
+
+Gelen her datagram, paket ID'sine göre o ID'ye kayıtlı tüm sink'lerin
+kuyruklarına dağıtılır. Her sink kendi görevinde (task) bağımsız çalışır;
+yavaş bir sink diğerlerini ya da soketi bekletmez, kuyruğu dolarsa yalnızca
+o sink'in paketleri düşürülür.
+"""
+
+import abc
+import asyncio
+import signal
+import time
+
+from asgiref.sync import sync_to_async
+
+from listener.frames import SESSION_PACKET_ID
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE, PacketHeader, PacketSessionData
+from listener.recorder import CAPTURE_STATS_INTERVAL
+from listener.records import HEADER_SIZE
+from listener.schemas import PACKET_KEY, SCHEMAS
+from listener.sessions import rig_conflict_message
+
+
+class AsyncSink(abc.ABC):
+    """
+    Asenkron tüketicilerin temel sınıfı.
+
+    ``packet_ids`` None ise sink tüm paket türlerini alır. Alt sınıflar
+    ``consume`` metodunu, gerekirse ``tick`` ve ``close`` metotlarını yazar.
+    Bir paketin işlenmesi hata verirse (ör. veritabanı kilitli) hata sayılıp
+    yazılır ve sink sonraki paketlerle devam eder; ``close`` her durumda çağrılır.
+    """
+
+    name = 'sink'
+    tick_interval = 1.0
+
+    def __init__(self, packet_ids=None, queue_size=4096, log=None):
+        self.packet_ids = frozenset(packet_ids) if packet_ids is not None else None
+        self.queue = asyncio.Queue(queue_size)
+        self.log = log or (lambda message, style=None: None)
+        self.consumed = 0
+        self.dropped = 0
+        self.errors = 0
+        self._last_error = None
+        self._stopping = False
+
+    def offer(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def run(self):
+        try:
+            while not (self._stopping and self.queue.empty()):
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), self.tick_interval)
+                except asyncio.TimeoutError:
+                    await self._guard(self.tick())
+                    continue
+                if item is None:
+                    continue
+                if await self._guard(self.consume(*item)):
+                    self.consumed += 1
+        finally:
+            # Tamponlanmış kayıtlar ve bekleyen turlar hata sonrasında da yazılır.
+            await self._guard(self.close())
+
+    async def _guard(self, awaitable):
+        """``awaitable``'ı çalıştırır; hata verirse sayar, yazar ve False döndürür."""
+        try:
+            await awaitable
+            return True
+        except Exception as exc:
+            self.errors += 1
+            message = f"{type(exc).__name__}: {exc}"
+            # Aynı hata her pakette tekrarlanabilir (ör. kilitli veritabanı); yalnızca değiştiğinde yazılır.
+            if message != self._last_error:
+                self._last_error = message
+                self.log(f"{self.name} sink'inde hata ({self.errors}. hata): {message}", 'ERROR')
+            return False
+
+    def stop(self):
+        """Kuyrukta kalan paketler işlendikten sonra sink'i durdurur."""
+        self._stopping = True
+        try:
+            # Boş kuyrukta bekleyen görevi hemen uyandırmak için bitiş işareti.
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    @abc.abstractmethod
+    async def consume(self, data, received_at, packet_id, rig=None):
+        """Tek bir datagramı işler."""
+
+    async def tick(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+class CaptureSink(AsyncSink):
+    """
+    Datagramları ``DatagramEncoder`` ile kodlayıp yazıcı havuzuna ekler.
+    ``session_registry`` verilirse aynı UID'yi bildiren ikinci bir rig'in
+    paketleri ``stream_key`` ile ayrı kayda yazılır.
+    """
+
+    name = 'capture'
+
+    def __init__(self, encoder, writer_pool, listener_stats=None, log=None, verbose=False,
+                 session_registry=None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        self.encoder = encoder
+        self.writer_pool = writer_pool
+        self.session_registry = session_registry
+        self.listener_stats = listener_stats
+        self.verbose = verbose
+
+    async def consume(self, data, received_at, packet_id, rig=None):
+        encoded = self.encoder(data, received_at, rig)
+        if encoded is None or encoded.payload is None:
+            return
+        stream_key = encoded.session_uid
+        if self.session_registry is not None:
+            stream_key = self.session_registry.stream_key(encoded.session_uid, rig)
+        self.writer_pool.write(stream_key, encoded.payload)
+        if self.listener_stats is not None:
+            self.listener_stats.record(packet_id, len(encoded.payload))
+        if self.verbose:
+            packet_name = HEADER_FIELD_TO_PACKET_TYPE[packet_id].__name__
+            self.log(f'Paket {packet_name} -> {self.writer_pool.path_for(stream_key)} dosyasına kaydedildi.')
+
+    async def tick(self):
+        self.writer_pool.tick()
+
+    async def close(self):
+        self.writer_pool.close_all()
+
+
+class SessionSink(AsyncSink):
+    """
+    Seans kayıtlarını veritabanına işler. ORM çağrıları yalnızca önbellekte
+    olmayan seanslarda ve pist bilgisi ilk geldiğinde, ``sync_to_async`` ile
+    olay döngüsünü bloklamadan yapılır.
+    """
+
+    name = 'database'
+
+    def __init__(self, session_registry, sequence_tracker=None, log=None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        self.session_registry = session_registry
+        self.sequence_tracker = sequence_tracker
+        self._stats_saved_at = time.monotonic()
+
+    async def consume(self, data, received_at, packet_id, rig=None):
+        if len(data) < HEADER_SIZE:
+            return
+        header = PacketHeader.from_buffer_copy(data)
+        session_uid = header.m_session_uid
+        if session_uid == 0:
+            return
+        stream_key = self.session_registry.stream_key(session_uid, rig)
+        if self.sequence_tracker is not None:
+            self.sequence_tracker.observe(
+                stream_key, packet_id, header.m_overall_frame_identifier, header.m_session_time, received_at
+            )
+        if stream_key != session_uid:
+            # Aynı UID'yi bildiren ikinci rig: seansın kaydına karıştırılmaz.
+            self._log_rig_conflicts()
+            return
+
+        if self.session_registry.cached(session_uid) is None:
+            _, created = await sync_to_async(self.session_registry.resolve)(session_uid, rig)
+            if created:
+                label = f" [{rig}]" if rig else ""
+                self.log(f"Yeni seans (ID: {session_uid}){label} veritabanına kaydedildi!", 'SUCCESS')
+            self._log_rig_conflicts()
+
+        if packet_id == SESSION_PACKET_ID and self.session_registry.needs_track(session_uid):
+            if len(data) < PacketSessionData.size():
+                return
+            track_id = PacketSessionData.from_buffer_copy(data).m_track_id
+            if await sync_to_async(self.session_registry.apply_track)(session_uid, track_id):
+                self.log(f"Seans (ID: {session_uid}) için pist ID ({track_id}) güncellendi.", 'SUCCESS')
+
+    def _log_rig_conflicts(self):
+        for conflict in self.session_registry.pop_rig_conflicts():
+            self.log(rig_conflict_message(*conflict), 'WARNING')
+
+    async def tick(self):
+        if time.monotonic() - self._stats_saved_at >= CAPTURE_STATS_INTERVAL:
+            await self.save_capture_stats()
+
+    async def close(self):
+        await self.save_capture_stats()
+
+    async def save_capture_stats(self):
+        self._stats_saved_at = time.monotonic()
+        if self.sequence_tracker is None:
+            return
+        for session_uid in self.sequence_tracker.sessions():
+            summary = self.sequence_tracker.summary(session_uid)
+            await sync_to_async(self.session_registry.save_capture_stats)(session_uid, summary)
+
+
+class IngestSink(AsyncSink):
+    """
+    ``LiveIngestor`` ile tur ve telemetri verisini canlı aktarır. Yalnızca
+    aktarımın ihtiyaç duyduğu paket türlerini alır; veritabanı yazımları tur
+    kapandığında ``sync_to_async`` ile yapılır.
+    """
+
+    name = 'ingest'
+
+    def __init__(self, ingestor, **kwargs):
+        kwargs.setdefault('packet_ids', ingestor.packet_ids)
+        super().__init__(**kwargs)
+        self.ingestor = ingestor
+
+    async def consume(self, data, received_at, packet_id, rig=None):
+        # Boyut, dağıtımda paketin şemasına göre denetlendi.
+        session_uid = PacketHeader.from_buffer_copy(data).m_session_uid
+        if session_uid == 0:
+            return
+        if self.ingestor.session_registry.stream_key(session_uid, rig) != session_uid:
+            # Seansın sahibi olmayan rig'in turları seansa yazılmaz.
+            return
+        if self.ingestor.feed(session_uid, packet_id, data):
+            await sync_to_async(self.ingestor.flush)()
+
+    async def close(self):
+        await sync_to_async(self.ingestor.finish)()
+
+
+class BroadcastSink(AsyncSink):
+    """
+    Canlı yayın için datagramları abonelere iletir. Her abone kendi sınırlı
+    kuyruğunu alır; yetişemeyen abonenin paketleri düşürülür.
+    """
+
+    name = 'broadcast'
+
+    def __init__(self, subscriber_queue_size=256, **kwargs):
+        super().__init__(**kwargs)
+        self.subscriber_queue_size = subscriber_queue_size
+        self.subscribers = set()
+        self.subscriber_drops = 0
+
+    def subscribe(self):
+        subscriber = asyncio.Queue(self.subscriber_queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.discard(subscriber)
+
+    async def consume(self, data, received_at, packet_id, rig=None):
+        for subscriber in self.subscribers:
+            try:
+                subscriber.put_nowait((data, received_at, packet_id))
+            except asyncio.QueueFull:
+                self.subscriber_drops += 1
+
+
+class TelemetryProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, dispatch, rig=None, router=None):
+        self.dispatch = dispatch
+        self.rig = rig
+        self.router = router
+
+    def datagram_received(self, data, addr):
+        rig = self.router.route(self.rig, addr, len(data)) if self.router is not None else self.rig
+        self.dispatch(data, time.time(), rig)
+
+
+class AsyncTelemetryListener:
+    """
+    UDP soketlerini birden fazla asenkron sink arasında paylaştırır.
+
+    ``udp_socket`` tek bir soket ya da ``(soket, rig etiketi)`` çiftlerinin
+    listesi olabilir; her soket için ayrı bir uç nokta açılır, sink'ler ortaktır.
+    Datagramlar ``schemas`` kayıt defterinde bulunamazsa ya da boyutu şemayla
+    tutmazsa hiçbir sink'e gönderilmez.
+    """
+
+    def __init__(self, sinks, host='0.0.0.0', port=20777, udp_socket=None, forwarder=None, router=None,
+                 schemas=SCHEMAS):
+        self.sinks = list(sinks)
+        # Datagramlar sink'lere dağıtılmadan önce diğer araçlara olduğu gibi iletilir.
+        self.forwarder = forwarder
+        self.host = host
+        self.port = port
+        # Önceden açılmış (ör. SO_RCVBUF ayarlanmış) soketler verilebilir.
+        if udp_socket is None or isinstance(udp_socket, (list, tuple)):
+            self.sources = list(udp_socket or ())
+        else:
+            self.sources = [(udp_socket, None)]
+        self.router = router
+        if router is not None:
+            for _, rig in self.sources:
+                router.add_label(rig)
+        self.received = 0
+        self.unroutable = 0
+        self.malformed = 0
+        # Şema anahtarı (biçim, sürüm, paket ID) -> (şema, sink listesi); dağıtım
+        # paket başına tek sözlük araması.
+        self._routes = {}
+        for schema in schemas:
+            sinks = [s for s in self.sinks if s.packet_ids is None or schema.packet_id in s.packet_ids]
+            if sinks:
+                self._routes[(schema.packet_format, schema.packet_version, schema.packet_id)] = (schema, sinks)
+
+    def dispatch(self, data, received_at, rig=None):
+        self.received += 1
+        if self.forwarder is not None:
+            self.forwarder.forward(data)
+        if len(data) < HEADER_SIZE:
+            self.malformed += 1
+            return
+        route = self._routes.get(PACKET_KEY.unpack_from(data))
+        if route is None:
+            self.unroutable += 1
+            return
+        schema, sinks = route
+        if len(data) != schema.size:
+            self.malformed += 1
+            return
+        item = (data, received_at, schema.packet_id, rig)
+        for sink in sinks:
+            sink.offer(item)
+
+    async def run(self, on_ready=None, on_interrupt=None, on_tick=None, tick_interval=1.0):
+        """
+        SIGINT gelene kadar dinler, ardından sink kuyruklarını boşaltıp kapatır.
+        ``on_tick`` verilirse (ör. durum satırı) ``tick_interval`` saniyede bir çağrılır.
+        """
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+
+        def interrupt():
+            if on_interrupt:
+                on_interrupt()
+            stop_event.set()
+
+        # Zaman aşımıyla bayrak yoklamak yerine sinyal doğrudan olay döngüsüne bağlanır.
+        try:
+            loop.add_signal_handler(signal.SIGINT, interrupt)
+            previous_handler = None
+        except NotImplementedError:
+            # Windows olay döngüleri add_signal_handler desteklemez; sinyal döngüye elle aktarılır.
+            previous_handler = signal.signal(signal.SIGINT, lambda *args: loop.call_soon_threadsafe(interrupt))
+            # Python dışından kurulmuş bir işleyici None döner; kapanışta varsayılana dönülür.
+            previous_handler = previous_handler or signal.default_int_handler
+        endpoints = [({'sock': sock}, rig) for sock, rig in self.sources]
+        if not endpoints:
+            endpoints = [({'local_addr': (self.host, self.port)}, None)]
+        transports = []
+        for endpoint, rig in endpoints:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda rig=rig: TelemetryProtocol(self.dispatch, rig, self.router), **endpoint
+            )
+            transports.append(transport)
+        tasks = [asyncio.create_task(sink.run()) for sink in self.sinks]
+        ticker = asyncio.create_task(self._tick_loop(on_tick, tick_interval)) if on_tick else None
+        if on_ready:
+            on_ready()
+        try:
+            await stop_event.wait()
+        finally:
+            if ticker is not None:
+                ticker.cancel()
+            for transport in transports:
+                transport.close()
+            if previous_handler is None:
+                loop.remove_signal_handler(signal.SIGINT)
+            else:
+                signal.signal(signal.SIGINT, previous_handler)
+            for sink in self.sinks:
+                sink.stop()
+            # Bir sink'in hatası diğerlerinin kapanmasını engellemez.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _tick_loop(on_tick, interval):
+        while True:
+            await asyncio.sleep(interval)
+            on_tick()
+
+    def stats(self):
+        return {
+            'received': self.received,
+            'unroutable': self.unroutable,
+            'malformed': self.malformed,
+            'sinks': {
+                sink.name: {'consumed': sink.consumed, 'dropped': sink.dropped, 'errors': sink.errors}
+                for sink in self.sinks
+            },
+        }
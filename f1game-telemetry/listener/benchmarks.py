@@ -0,0 +1,615 @@
+# listener/benchmarks.py
+"""
+Dinleyici ve içe aktarma yolları için ölçüm (benchmark) senaryoları.
+
+Her senaryo ``@benchmark`` ile kaydedilir ve ``manage.py benchmark_telemetry
+<senaryo>`` komutuyla çalıştırılır. Senaryolar tablo satırları olarak
+sözlük listesi döndürür.
+"""
+
+import ctypes
+import multiprocessing
+import socket
+import time
+
+from listener.parser24 import PacketCarTelemetryData
+from listener.udp import BatchReceiver, effective_rcvbuf, open_udp_socket
+
+BENCHMARKS = {}
+
+
+def benchmark(name, description):
+    def register(func):
+        func.description = description
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def sample_datagram(packet_type=PacketCarTelemetryData, packet_id=6):
+    packet = packet_type()
+    packet.m_header.m_packet_format = 2024
+    packet.m_header.m_packet_version = 1
+    packet.m_header.m_packet_id = packet_id
+    packet.m_header.m_session_uid = 1
+    return packet.pack()
+
+
+def _blast(port, datagram, duration, sent_counter):
+    """Verilen süre boyunca loopback üzerinden olabildiğince hızlı gönderir."""
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    target = ('127.0.0.1', port)
+    deadline = time.perf_counter() + duration
+    sent = 0
+    while time.perf_counter() < deadline:
+        for _ in range(64):
+            sender.sendto(datagram, target)
+        sent += 64
+    sent_counter.value = sent
+
+
+def _receive_recvfrom(udp_socket, deadline):
+    # Eski dinleyici döngüsü: zaman aşımlı soket ve paket başına recvfrom.
+    udp_socket.setblocking(True)
+    udp_socket.settimeout(1.0)
+    received = 0
+    while time.perf_counter() < deadline:
+        try:
+            packet_data, _ = udp_socket.recvfrom(2048)
+        except socket.timeout:
+            continue
+        received += packet_data[6] >= 0
+    return received
+
+
+def _receive_batch(udp_socket, deadline, batch_size):
+    receiver = BatchReceiver(udp_socket, batch_size)
+    received = 0
+    while time.perf_counter() < deadline:
+        for packet_data, _ in receiver.receive(timeout=0.2):
+            received += packet_data[6] >= 0
+    return received
+
+
+@benchmark('receive', 'Varsayılan soket + recvfrom döngüsü ile SO_RCVBUF + toplu recv_into karşılaştırması.')
+def bench_receive(duration=3.0, rcvbuf=4 * 1024 * 1024, batch_size=64, port=20799, senders=3, **_):
+    datagram = sample_datagram()
+    variants = [
+        ('recvfrom (varsayılan tampon)', None, None),
+        ('recvfrom + SO_RCVBUF', rcvbuf, None),
+        (f'batch x{batch_size} + SO_RCVBUF', rcvbuf, batch_size),
+    ]
+    rows = []
+    context = multiprocessing.get_context()
+    for name, buffer_size, batch in variants:
+        udp_socket = open_udp_socket('127.0.0.1', port, buffer_size)
+        # Alıcıyı doyurmak için birden fazla gönderici süreci kullanılır.
+        sent_counters = [context.Value('q', 0) for _ in range(senders)]
+        sender_procs = [
+            context.Process(target=_blast, args=(port, datagram, duration, counter))
+            for counter in sent_counters
+        ]
+        for sender in sender_procs:
+            sender.start()
+        # Göndericiler bittikten sonra soket tamponunda kalanlar da okunsun diye kısa bir pay bırakılır.
+        deadline = time.perf_counter() + duration + 0.5
+        if batch:
+            received = _receive_batch(udp_socket, deadline, batch)
+        else:
+            received = _receive_recvfrom(udp_socket, deadline)
+        for sender in sender_procs:
+            sender.join()
+        sent = sum(counter.value for counter in sent_counters)
+        rows.append({
+            'senaryo': name,
+            'rcvbuf': effective_rcvbuf(udp_socket),
+            'gönderilen': sent,
+            'alınan': received,
+            'paket/s': round(received / duration),
+            'kayıp %': round(100 * (1 - received / sent), 2) if sent else 0.0,
+        })
+        udp_socket.close()
+    return rows
+
+
+@benchmark('forward', 'Alma yolunda datagram başına iletim maliyeti (0, 1 ve 3 hedef).')
+def bench_forward(duration=3.0, **_):
+    from listener.forwarding import Forwarder
+
+    datagram = sample_datagram()
+    # Alıcı soketler okunmaz; UDP'de dolu alıcı tamponu göndericiyi bekletmez, fazlası çekirdekte düşer.
+    receivers = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(3)]
+    for receiver in receivers:
+        receiver.bind(('127.0.0.1', 0))
+    rows = []
+    for count in (0, 1, 3):
+        forwarder = Forwarder([('127.0.0.1', r.getsockname()[1]) for r in receivers[:count]])
+        iterations = 0
+        deadline = time.perf_counter() + duration / 3
+        started = time.perf_counter()
+        while time.perf_counter() < deadline:
+            for _ in range(256):
+                forwarder.forward(datagram)
+            iterations += 256
+        elapsed = time.perf_counter() - started
+        stats = forwarder.stats().values()
+        rows.append({
+            'hedef': count,
+            'datagram': iterations,
+            'µs/datagram': round(elapsed / iterations * 1e6, 3),
+            'gönderilen': sum(s['sent'] for s in stats),
+            'tampon dolu': sum(s['would_block'] for s in stats),
+        })
+        forwarder.close()
+    for receiver in receivers:
+        receiver.close()
+    return rows
+
+
+@benchmark('decode', 'from_buffer_copy, her pakette from_buffer ve halka slotuna bindirilmiş nesneyle çözme karşılaştırması.')
+def bench_decode(duration=3.0, **_):
+    from listener.parser24 import PacketLapData, PacketMotionData
+    from listener.records import DatagramEncoder
+    from listener.ring import PacketRing
+
+    ring = PacketRing(64)
+    cases = [
+        (PacketMotionData, 0),
+        (PacketCarTelemetryData, 6),
+        (PacketLapData, 2),
+    ]
+    rows = []
+    per_case = duration / (len(cases) + 1) / 3
+
+    def measure(func):
+        iterations = 0
+        deadline = time.perf_counter() + per_case
+        started = time.perf_counter()
+        while time.perf_counter() < deadline:
+            for _ in range(256):
+                func()
+            iterations += 256
+        return round((time.perf_counter() - started) / iterations * 1e9)
+
+    for packet_type, packet_id in cases:
+        datagram = sample_datagram(packet_type, packet_id)
+        slot = ring.acquire()
+        slot.view[:len(datagram)] = datagram
+        slot.fill(len(datagram))
+        # Her varyant paketi çözüp başlıktaki iki alanı okur (dinleyicinin yaptığı kadar iş).
+        variants = [
+            ('from_buffer_copy (mevcut)', len(datagram),
+             lambda: packet_type.from_buffer_copy(slot.data).m_header.m_session_uid),
+            ('from_buffer (her pakette)', 0,
+             lambda: packet_type.view(slot.view).m_header.m_session_uid),
+            ('halka slotu (önbellekli overlay)', 0,
+             lambda: slot.overlay(packet_type).m_header.m_session_uid),
+        ]
+        for name, copied, func in variants:
+            rows.append({
+                'paket': packet_type.__name__,
+                'boyut': len(datagram),
+                'yol': name,
+                'ns/paket': measure(func),
+                'kopyalanan bayt': copied,
+            })
+        slot.release()
+
+    # Dinleyicinin ikili kayıt yolu: kuyruğa bytes() kopyası mı, slotun kendisi mi gidiyor.
+    encoder = DatagramEncoder(binary=True)
+    datagram = sample_datagram()
+    slot = ring.acquire()
+    slot.view[:len(datagram)] = datagram
+    slot.fill(len(datagram))
+    received_at = time.time()
+    for name, copied, func in [
+        ('bytes() kopyası + encoder', 2 * len(datagram), lambda: encoder(bytes(slot.data), received_at)),
+        ('halka slotu + encoder', len(datagram), lambda: encoder(slot, received_at)),
+    ]:
+        rows.append({
+            'paket': 'DatagramEncoder',
+            'boyut': len(datagram),
+            'yol': name,
+            'ns/paket': measure(func),
+            'kopyalanan bayt': copied,
+        })
+    slot.release()
+    return rows
+
+
+def _reflective_value(value):
+    # Üretilmiş serileştiricilerden önceki PacketMixin._format_type (karşılaştırma için).
+    if isinstance(value, ctypes.Array):
+        return [_reflective_value(item) for item in value]
+    class_name = type(value).__name__
+    if class_name == "float":
+        return round(value, 3)
+    if class_name == "bytes":
+        return value.decode()
+    if hasattr(value, "to_dict"):
+        return _reflective_to_dict(value)
+    return value
+
+
+def _reflective_to_dict(packet):
+    return {name: _reflective_value(getattr(packet, name)) for name, _ in packet._fields_}
+
+
+@benchmark('serialize', 'Eski yansımalı to_dict ile sınıf başına üretilmiş serileştiricinin paket türü başına karşılaştırması.')
+def bench_serialize(duration=3.0, **_):
+    from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE
+
+    packet_types = sorted(HEADER_FIELD_TO_PACKET_TYPE.items())
+    per_case = duration / len(packet_types) / 2
+
+    def measure(func, packet):
+        iterations = 0
+        deadline = time.perf_counter() + per_case
+        started = time.perf_counter()
+        while time.perf_counter() < deadline:
+            for _ in range(16):
+                func(packet)
+            iterations += 16
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    rows = []
+    for packet_id, packet_type in packet_types:
+        packet = packet_type.from_buffer_copy(sample_datagram(packet_type, packet_id))
+        old = measure(_reflective_to_dict, packet)
+        new = measure(packet_type.to_dict, packet)
+        rows.append({
+            'paket': packet_type.__name__,
+            'eski µs': round(old, 2),
+            'üretilmiş µs': round(new, 2),
+            'hızlanma': f"{old / new:.1f}x",
+        })
+    return rows
+
+
+@benchmark('bulk', 'Kayıt dosyasından oyuncu aracının kanallarını okuma: read_packets + ctypes ile NumPy toplu çözme karşılaştırması.')
+def bench_bulk(packets=100_000, **_):
+    import os
+    import random
+    import tempfile
+
+    from listener.bulk import load_capture_packets, player_cars
+    from listener.capture import CAPTURE_MAGIC, encode_record, read_packets
+    from listener.filters import PLAYER_INDEX_OFFSET
+
+    datagram = bytearray(sample_datagram())
+    rng = random.Random(0)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.f1cap')
+        with open(path, 'wb') as f:
+            f.write(CAPTURE_MAGIC)
+            for i in range(packets):
+                datagram[PLAYER_INDEX_OFFSET] = rng.randrange(22)
+                f.write(encode_record(i / 60, bytes(datagram)))
+
+        # Bir tur analizinin tipik girdisi: oyuncu aracının birkaç kanalı.
+        channels = ('m_speed', 'm_throttle', 'm_brake', 'm_gear', 'm_engine_rpm', 'm_drs')
+        started = time.perf_counter()
+        columns = {channel: [] for channel in channels}
+        for packet in read_packets(path, {6}):
+            car = packet.m_car_telemetry_data[packet.m_header.m_player_car_index]
+            for channel in channels:
+                columns[channel].append(getattr(car, channel))
+        ctypes_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        array, _ = load_capture_packets(path, 6)
+        cars, _ = player_cars(array, 6)
+        bulk_columns = {channel: cars[channel] for channel in channels}
+        bulk_seconds = time.perf_counter() - started
+
+        for channel in channels:
+            if bulk_columns[channel].tolist() != columns[channel]:
+                raise AssertionError(f"Toplu çözme {channel} kanalında farklı sonuç verdi.")
+        for name, seconds in [('read_packets + ctypes', ctypes_seconds), ('NumPy toplu çözme', bulk_seconds)]:
+            rows.append({
+                'yol': name,
+                'paket': len(cars),
+                'süre (s)': round(seconds, 3),
+                'paket/s': round(len(cars) / seconds),
+                'hızlanma': f"{ctypes_seconds / seconds:.1f}x",
+            })
+    return rows
+
+
+@benchmark('views', 'Tek aracın birkaç alanını okuma: to_dict, ctypes ve tembel görünüm (PacketView) karşılaştırması.')
+def bench_views(duration=3.0, **_):
+    from listener.parser24 import PacketLapData
+
+    cases = [
+        (PacketCarTelemetryData, 6, 'm_car_telemetry_data', ('m_speed', 'm_throttle', 'm_brake', 'm_gear', 'm_engine_rpm', 'm_drs')),
+        (PacketLapData, 2, 'm_lap_data', ('m_current_lap_num', 'm_last_lap_time_in_ms')),
+    ]
+    per_case = duration / len(cases) / 3
+
+    def measure(func):
+        iterations = 0
+        deadline = time.perf_counter() + per_case
+        started = time.perf_counter()
+        while time.perf_counter() < deadline:
+            for _ in range(64):
+                func()
+            iterations += 64
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    rows = []
+    for packet_type, packet_id, array_field, fields in cases:
+        datagram = sample_datagram(packet_type, packet_id)
+        index = 5
+
+        def from_dict():
+            car = packet_type.from_buffer_copy(datagram).to_dict()[array_field][index]
+            return [car[name] for name in fields]
+
+        def from_ctypes():
+            car = getattr(packet_type.from_buffer_copy(datagram), array_field)[index]
+            return [getattr(car, name) for name in fields]
+
+        def from_view():
+            car = packet_type.lazy(datagram).car(index)
+            return [car.field(name) for name in fields]
+
+        baseline = None
+        for name, func in [('to_dict', from_dict), ('ctypes', from_ctypes), ('PacketView', from_view)]:
+            elapsed = measure(func)
+            baseline = baseline or elapsed
+            rows.append({
+                'paket': packet_type.__name__,
+                'alan': len(fields),
+                'yol': name,
+                'µs/paket': round(elapsed, 2),
+                'hızlanma': f"{baseline / elapsed:.1f}x",
+            })
+    return rows
+
+
+@benchmark('channels', 'Seans kaydından kanal çıkarma: paket paket to_dict, extract (ilk çağrı) ve extract (önbellekten).')
+def bench_channels(packets=30_000, **_):
+    import os
+    import tempfile
+
+    from listener.capture import CAPTURE_MAGIC, encode_record, read_packets
+    from listener.channels import extract
+    from listener.parser24 import PacketCarStatusData, PacketLapData
+
+    channels = ['speed', 'throttle', 'brake', 'gear', 'm_lap_distance', 'fuel_in_tank']
+    datagrams = []
+    for packet_type, packet_id in [(PacketCarTelemetryData, 6), (PacketLapData, 2), (PacketCarStatusData, 7)]:
+        packet = packet_type.from_buffer_copy(sample_datagram(packet_type, packet_id))
+        datagrams.append(packet)
+    rows = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        session_dir = os.path.join(data_dir, 'session_1')
+        os.makedirs(session_dir)
+        with open(os.path.join(session_dir, 'telemetry_capture.f1cap'), 'wb') as f:
+            f.write(CAPTURE_MAGIC)
+            for frame in range(packets // len(datagrams)):
+                for packet in datagrams:
+                    packet.m_header.m_overall_frame_identifier = frame
+                    packet.m_header.m_session_time = frame / 60
+                    f.write(encode_record(frame / 60, packet.pack()))
+
+        def per_packet():
+            # Analiz kodunun bugünkü yolu: her paketi sözlüğe çevirip oyuncu aracından değer okumak.
+            values = {channel: [] for channel in channels}
+            for packet in read_packets(os.path.join(session_dir, 'telemetry_capture.f1cap'), {2, 6, 7}):
+                p = packet.to_dict()
+                index = p['m_header']['m_player_car_index']
+                if p['m_header']['m_packet_id'] == 6:
+                    car = p['m_car_telemetry_data'][index]
+                    for channel, field in [('speed', 'm_speed'), ('throttle', 'm_throttle'), ('brake', 'm_brake'), ('gear', 'm_gear')]:
+                        values[channel].append(car[field])
+            return values
+
+        for name, func in [
+            ('paket paket to_dict', per_packet),
+            ('extract (ilk çağrı)', lambda: extract(session_dir, channels)),
+            ('extract (önbellekten)', lambda: extract(session_dir, channels)),
+        ]:
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            rows.append({'yol': name, 'paket': packets, 'kanal': len(channels), 'süre (ms)': round(elapsed * 1000, 1)})
+    return rows
+
+
+def _write_synthetic_session(path, hours, rate, lap_seconds=90.0):
+    """
+    ``hours`` saatlik, saniyede ``rate`` karelik sentetik bir JSONL seans log'u
+    yazar. Dosya boyutu makul kalsın diye araç dizilerinde yalnızca oyuncu
+    aracı (indeks 0) tutulur; içe aktarma yalnızca o aracı okur.
+    """
+    import json
+
+    from listener.parser24 import PacketCarStatusData, PacketLapData, PacketSessionData
+
+    packets = {
+        packet_id: packet_type.from_buffer_copy(sample_datagram(packet_type, packet_id))
+        for packet_type, packet_id in [
+            (PacketSessionData, 1), (PacketLapData, 2), (PacketCarTelemetryData, 6), (PacketCarStatusData, 7),
+        ]
+    }
+    array_fields = {2: 'm_lap_data', 6: 'm_car_telemetry_data', 7: 'm_car_status_data'}
+    packets[1].m_track_id = 10
+    packets[1].m_session_type = 15
+    packets[1].m_game_mode = 3
+    lap, telemetry, status = packets[2].m_lap_data[0], packets[6].m_car_telemetry_data[0], packets[7].m_car_status_data[0]
+    with open(path, 'w') as f:
+        for frame in range(int(hours * 3600 * rate)):
+            session_time = frame / rate
+            lap_number = int(session_time // lap_seconds) + 1
+            lap.m_current_lap_num = lap_number
+            lap.m_last_lap_time_in_ms = int(lap_seconds * 1000) if lap_number > 1 else 0
+            telemetry.m_speed = 100 + frame % 200
+            telemetry.m_engine_rpm = 9000 + frame % 3000
+            status.m_fuel_in_tank = 100 - session_time / 100
+            status.m_visual_tyre_compound = 16 if lap_number < 40 else 17
+            # Oyun seans paketini daha sık gönderir; burada dosyayı büyütmemek için seyrek yazılır.
+            packet_ids = (1, 2, 6, 7) if frame % (rate * 10) == 0 else (2, 6, 7)
+            for packet_id in packet_ids:
+                header = packets[packet_id].m_header
+                header.m_session_time = session_time
+                header.m_frame_identifier = header.m_overall_frame_identifier = frame
+                packet = packets[packet_id].to_dict()
+                if packet_id in array_fields:
+                    packet[array_fields[packet_id]] = packet[array_fields[packet_id]][:1]
+                f.write(json.dumps(packet) + '\n')
+
+
+def _import_process(path, materialize, results):
+    """Ayrı bir süreçte seansı geçici bir veritabanına aktarır ve süre ile en yüksek RSS'i bildirir."""
+    import json
+    import sys
+
+    import django
+    django.setup()
+
+    from django.db import connection, transaction
+
+    from dashboard.models import RaceSession
+    from listener.importer import SessionImporter
+
+    connection.creation.create_test_db(verbosity=0, serialize=False)
+
+    def packets():
+        with open(path) as f:
+            for line in f:
+                yield json.loads(line)
+
+    started = time.perf_counter()
+    with transaction.atomic():
+        importer = SessionImporter(RaceSession.objects.create(session_uid='1'), 0)
+        # Eski içe aktarma gibi tüm paketleri önce listeye almak, akışla karşılaştırma içindir.
+        for packet in (list(packets()) if materialize else packets()):
+            importer.feed(packet)
+        importer.finish()
+    elapsed = time.perf_counter() - started
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux'ta KB, macOS'ta bayt
+        peak_mb = round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024))
+    except ImportError:
+        peak_mb = '-'
+    results.put((elapsed, peak_mb, importer.laps_created, importer.points_created))
+
+
+@benchmark('import', 'Sentetik uzun bir JSONL seansının içe aktarımı: paketler listeye alınarak ve akış halinde; süre ve en yüksek RSS.')
+def bench_import(session_hours=2.0, rate=10, **_):
+    import os
+    import tempfile
+
+    context = multiprocessing.get_context('spawn')
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'telemetry_log.jsonl')
+        _write_synthetic_session(path, session_hours, rate)
+        size_mb = round(os.path.getsize(path) / (1024 * 1024))
+        for name, materialize in [('liste (tüm paketler bellekte)', True), ('akış (tek geçiş)', False)]:
+            # Her yol temiz bir süreçte ölçülür; en yüksek RSS önceki ölçümden etkilenmez.
+            results = context.Queue()
+            process = context.Process(target=_import_process, args=(path, materialize, results))
+            process.start()
+            elapsed, peak_mb, laps, points = results.get()
+            process.join()
+            rows.append({
+                'yol': name, 'seans (saat)': session_hours, 'log (MB)': size_mb, 'tur': laps,
+                'nokta': points, 'süre (s)': round(elapsed, 1), 'en yüksek RSS (MB)': peak_mb,
+            })
+    return rows
+
+
+@benchmark('lap-index', 'Telemetri örneklerinin turlara atanması: turları tek tek taramak ile IntervalIndex (bisect) karşılaştırması.')
+def bench_lap_index(laps=70, rate=50, lap_seconds=90.0, **_):
+    import random
+
+    from listener.importer import LapRecord
+    from listener.intervals import IntervalIndex
+
+    rng = random.Random(0)
+    records = {}
+    end_time = 0.0
+    for lap_number in range(1, laps + 1):
+        # Geri hesaplanan başlangıçlar önceki turun bitişiyle milisaniye düzeyinde çakışır.
+        lap_time_ms = int(lap_seconds * 1000) + rng.randint(-500, 500)
+        end_time += lap_time_ms / 1000.0 + rng.uniform(-0.002, 0.002)
+        records[lap_number] = LapRecord(lap_number, lap_time_ms, end_time - lap_time_ms / 1000.0, end_time)
+    times = [index / rate for index in range(int(end_time * rate))]
+
+    def scan(time):
+        # SessionReader'ın önceki eşleştirmesi
+        for lap_number, lap in sorted(records.items()):
+            if lap.start_time <= time < lap.end_time:
+                return lap
+        return None
+
+    started = time.perf_counter()
+    scanned = [scan(sample) for sample in times]
+    scan_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = IntervalIndex()
+    for lap in records.values():
+        index.add(lap.start_time, lap.end_time, lap, priority=lap.lap_number)
+    found = [index.find(sample) for sample in times]
+    index_seconds = time.perf_counter() - started
+
+    if found != scanned:
+        raise AssertionError("IntervalIndex tarama ile aynı turları bulmadı.")
+    return [
+        {'yöntem': 'tur tarama', 'tur': laps, 'örnek': len(times), 'süre (s)': round(scan_seconds, 2), 'hızlanma': '1.0x'},
+        {'yöntem': 'IntervalIndex', 'tur': laps, 'örnek': len(times), 'süre (s)': round(index_seconds, 2),
+         'hızlanma': f"{scan_seconds / index_seconds:.1f}x"},
+    ]
+
+
+def _import_command_process(directory, workers, results):
+    """Ayrı bir süreçte, geçici bir veritabanına ``import_sessions --full --workers N`` çalıştırır."""
+    import io
+    import os
+
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0, serialize=False)
+    # Komut data/ klasörünü çalışma dizininde arar.
+    os.chdir(directory)
+    started = time.perf_counter()
+    call_command('import_sessions', full=True, workers=workers, stdout=io.StringIO())
+    results.put(time.perf_counter() - started)
+
+
+@benchmark('import-workers', 'Sentetik seansların import_sessions --workers 1, 2, 4 ve 8 ile içe aktarımı; süre ve hızlanma.')
+def bench_import_workers(session_hours=2.0, rate=10, sessions=8, **_):
+    import os
+    import tempfile
+
+    context = multiprocessing.get_context('spawn')
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        # Toplam session_hours saatlik veri, sessions adet seansa bölünür.
+        for session_uid in range(1, sessions + 1):
+            session_dir = os.path.join(directory, 'data', f'session_{session_uid}')
+            os.makedirs(session_dir)
+            _write_synthetic_session(os.path.join(session_dir, 'telemetry_log.jsonl'), session_hours / sessions, rate)
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            results = context.Queue()
+            process = context.Process(target=_import_command_process, args=(directory, workers, results))
+            process.start()
+            elapsed = results.get()
+            process.join()
+            baseline = baseline or elapsed
+            rows.append({
+                'işçi': workers, 'seans': sessions, 'çekirdek': os.cpu_count(),
+                'süre (s)': round(elapsed, 1), 'hızlanma': round(baseline / elapsed, 2),
+            })
+    return rows
@@ -0,0 +1,195 @@
+# listener/bulk.py
+"""
+Aynı türden çok sayıda paketin NumPy ile toplu çözülmesi.
+
+Paketler tek tek ctypes nesnesine çevrilmek yerine ``numpy_dtype()`` ile
+üretilen yapılandırılmış dtype üzerinden tek bir ``np.frombuffer`` çağrısıyla
+kayıt dizisine (record array) dönüştürülür. Ör. 100 bin telemetri paketinde
+oyuncunun hızı tek bir sütun dilimidir::
+
+    packets, received_at = load_capture_packets(path, 6)
+    cars, valid = player_cars(packets, 6)
+    speed = cars['m_speed']
+
+NumPy isteğe bağlıdır ve yalnızca bu modül kullanıldığında içe aktarılır.
+"""
+
+from listener.capture import CAPTURE_MAGIC, FLAG_PLAYER_ONLY, LENGTH_MASK, RECORD_HEADER, CaptureFormatError
+from listener.filters import CAR_ARRAY_LAYOUT, CAR_COUNT, expand_player_car
+from listener.schemas import DEFAULT_PACKET_FORMAT, SCHEMAS
+
+
+def require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Toplu çözme için NumPy gerekli: pip install numpy") from exc
+    return numpy
+
+
+def decode_packets(buffer, packet_type, count=-1):
+    """
+    Art arda dizilmiş aynı türden paketleri yapılandırılmış diziye çevirir.
+    Dizi ``buffer``'ın belleğini kopyalamadan kullanır (``bytes`` için salt okunur).
+    """
+    np = require_numpy()
+    return np.frombuffer(buffer, dtype=packet_type.numpy_dtype(), count=count)
+
+
+def record_offsets(data, packet_ids):
+    """
+    Kayıt dosyasının içeriğinde ``packet_ids`` türlerindeki datagramların
+    gövdelerinin başlangıç konumlarını ``{paket ID: [konum, ...]}`` olarak
+    döndürür. Dosya bir kez taranır ve yalnızca kayıt başlıkları okunur;
+    gövdeler atlanır. Başlığın diğer alanları ``record_headers`` ile vektörel
+    olarak okunur.
+    """
+    if data[:len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+        raise CaptureFormatError("Geçerli bir telemetri kayıt dosyası değil.")
+    unpack_from = RECORD_HEADER.unpack_from
+    header_size = RECORD_HEADER.size
+    end = len(data)
+    position = len(CAPTURE_MAGIC)
+    offsets = {packet_id: [] for packet_id in packet_ids}
+    appenders = {packet_id: starts.append for packet_id, starts in offsets.items()}
+    while position + header_size <= end:
+        _, length, record_id = unpack_from(data, position)
+        position += header_size
+        next_position = position + (length & LENGTH_MASK)
+        if next_position > end:
+            # Yarım yazılmış son kayıt
+            break
+        append = appenders.get(record_id)
+        if append is not None:
+            append(position)
+        position = next_position
+    return offsets
+
+
+def record_headers(raw, starts):
+    """Gövde konumlarından kayıt başlıklarının ``(alım zamanı, uzunluk, bayraklar)`` dizilerini okur."""
+    np = require_numpy()
+    header_size = RECORD_HEADER.size
+    fields = raw[(starts - header_size)[:, None] + np.arange(header_size - 1)]
+    received_at = fields[:, :8].copy().view('<f8').reshape(-1)
+    length = fields[:, 8:10].copy().view('<u2').reshape(-1)
+    masked = length & LENGTH_MASK
+    return received_at, masked, length ^ masked
+
+
+def _schema(packet_id, packet_format):
+    schema = SCHEMAS.get(packet_format, packet_id)
+    if schema is None:
+        raise ValueError(f"Kayıtlı paket şeması yok: biçim {packet_format}, paket ID {packet_id}")
+    return schema
+
+
+def load_capture(path, packet_ids, packet_format=DEFAULT_PACKET_FORMAT):
+    """
+    Kayıttaki ``packet_ids`` türlerinin her birini ``{paket ID: (yapılandırılmış
+    dizi, alım zamanları)}`` olarak döndürür. Dosya bir kez okunur ve taranır.
+    Tam boyutlu datagramlar tek bir birleştirme ile toplanır; yalnızca oyuncu
+    aracıyla kaydedilmiş (``--player-only``) datagramlar önce tam boyuta açılır.
+    ``read_packets`` gibi, başlığı ``packet_format`` yılının şemasıyla ya da
+    boyutu şemayla tutmayan datagramlar atlanır.
+    """
+    np = require_numpy()
+    schemas = {packet_id: _schema(packet_id, packet_format) for packet_id in packet_ids}
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    offsets = record_offsets(data, schemas)
+    return {
+        packet_id: _gather(data, raw, np.array(offsets[packet_id], dtype=np.int64), schema)
+        for packet_id, schema in schemas.items()
+    }
+
+
+def load_capture_packets(path, packet_id, packet_format=DEFAULT_PACKET_FORMAT):
+    """Kayıttaki tek bir paket türünü ``(yapılandırılmış dizi, alım zamanları)`` olarak döndürür."""
+    return load_capture(path, [packet_id], packet_format)[packet_id]
+
+
+def _gather(data, raw, starts, schema):
+    np = require_numpy()
+    packet_id, packet_type, size = schema.packet_id, schema.packet_type, schema.size
+    dtype = packet_type.numpy_dtype()
+    received_at, length, flags = record_headers(raw, starts)
+    # Başlıktaki şema anahtarı: m_packet_format (0-1) ve m_packet_version (5).
+    formats = raw[starts].astype(np.uint16) | (raw[starts + 1].astype(np.uint16) << 8)
+    matches = (formats == schema.packet_format) & (raw[starts + 5] == schema.packet_version)
+    trimmed = matches & (flags & FLAG_PLAYER_ONLY != 0)
+    full = matches & ~trimmed & (length == size)
+    if trimmed.any():
+        _, _, car_size = CAR_ARRAY_LAYOUT[packet_id]
+        trimmed &= length == size - (CAR_COUNT - 1) * car_size
+
+    full_starts = starts[full]
+    strides = np.unique(np.diff(full_starts))
+    if len(full_starts) > 1 and len(strides) == 1:
+        # Kayıtlar eşit aralıklıysa (tek paket türü içeren kayıt) kopyasız, adımlı görünüm yeterli.
+        packets = np.ndarray((len(full_starts),), dtype=dtype, buffer=data,
+                             offset=int(full_starts[0]), strides=(int(strides[0]),))
+    else:
+        view = memoryview(data)
+        packets = decode_packets(b"".join([view[start:start + size] for start in full_starts.tolist()]), packet_type)
+
+    if trimmed.any():
+        expanded = [
+            expand_player_car(data[start:start + n], packet_id)
+            for start, n in zip(starts[trimmed].tolist(), length[trimmed].tolist())
+        ]
+        packets = np.concatenate([packets, decode_packets(b"".join(expanded), packet_type)])
+        # Kayıt sırası korunur.
+        order = np.argsort(np.concatenate([np.flatnonzero(full), np.flatnonzero(trimmed)]), kind='stable')
+        return packets[order], np.concatenate([received_at[full], received_at[trimmed]])[order]
+    return packets, received_at[full]
+
+
+def load_session(session_dir, packet_ids, packet_format=DEFAULT_PACKET_FORMAT):
+    """
+    Seans klasöründeki ``packet_ids`` türlerini ``load_capture`` biçiminde
+    yükler. Seans yalnızca ikili kayıttan oluşuyorsa hızlı yol kullanılır;
+    eski JSONL log'lar bir kez okunup paket paket çözülür.
+    """
+    from listener.capture import CAPTURE_FILENAME
+    from listener.replay import iter_session_packets
+    from listener.session_files import session_log_paths
+
+    np = require_numpy()
+    paths = session_log_paths(session_dir)
+    if len(paths) == 1 and paths[0].endswith(CAPTURE_FILENAME):
+        return load_capture(paths[0], packet_ids, packet_format)
+    packet_types = {packet_id: _schema(packet_id, packet_format).packet_type for packet_id in packet_ids}
+    buffers = {packet_id: [] for packet_id in packet_types}
+    for packet in iter_session_packets(session_dir, set(packet_types)):
+        packet_id = packet.m_header.m_packet_id
+        if type(packet) is packet_types[packet_id]:
+            buffers[packet_id].append(packet.pack())
+    loaded = {}
+    for packet_id, packet_type in packet_types.items():
+        packets = decode_packets(b"".join(buffers[packet_id]), packet_type)
+        # JSONL log'larda alım zamanı tutulmadığından yerine seans zamanı döndürülür.
+        loaded[packet_id] = packets, packets['m_header']['m_session_time'].astype(np.float64)
+    return loaded
+
+
+def load_session_packets(session_dir, packet_id, packet_format=DEFAULT_PACKET_FORMAT):
+    """Seans klasöründeki tek bir paket türünü ``(yapılandırılmış dizi, alım zamanları)`` olarak döndürür."""
+    return load_session(session_dir, [packet_id], packet_format)[packet_id]
+
+
+def player_cars(packets, packet_id):
+    """
+    22 araçlık dizi taşıyan paketlerde her paketin oyuncu aracını seçer.
+    ``(araç kayıtları, geçerli)`` döndürür; ``geçerli`` oyuncu indeksi 255
+    (izleyici modu) olmayan paketlerin maskesidir ve araç kayıtları yalnızca
+    bu paketleri içerir.
+    """
+    np = require_numpy()
+    array_field = CAR_ARRAY_LAYOUT[packet_id][0]
+    index = packets['m_header']['m_player_car_index']
+    valid = index < CAR_COUNT
+    rows = np.flatnonzero(valid)
+    return packets[array_field][rows, index[rows]], valid
@@ -0,0 +1,128 @@
+# listener/capture.py
+"""
+Ham UDP paketleri için sıkıştırılmış ikili kayıt (capture) biçimi.
+
+Dosya ``CAPTURE_MAGIC`` ile başlar; ardından her paket için küçük bir kayıt
+başlığı (alım zamanı, uzunluk, paket ID) ve oyundan gelen datagramın
+baytları olduğu gibi yazılır. Paketler dinleme sırasında çözülmez; çözme
+işi ``CaptureRecord.packet()`` ile okuma anına bırakılır.
+"""
+
+import struct
+
+from listener.filters import expand_player_car
+from listener.schemas import SCHEMAS
+
+CAPTURE_FILENAME = "telemetry_capture.f1cap"
+CAPTURE_MAGIC = b"F1CAP\x00\x01\x00"
+
+# <d: alım zamanı (time.time()), H: datagram uzunluğu + bayraklar, B: m_packet_id
+RECORD_HEADER = struct.Struct("<dHB")
+
+# Datagramlar 2048 baytı geçmediği için uzunluk alanının üst biti bayrak olarak kullanılır.
+LENGTH_MASK = 0x7FFF
+# Kayıt yalnızca oyuncu aracını içerir (bkz. listener.filters.compact_player_car).
+FLAG_PLAYER_ONLY = 0x8000
+
+# PacketHeader içinde m_packet_id alanının bayt konumu.
+PACKET_ID_OFFSET = 6
+
+
+class CaptureFormatError(ValueError):
+    pass
+
+
+def encode_record(received_at, data, flags=0):
+    """Tek bir datagramı kayıt başlığıyla birlikte bayt dizisine çevirir."""
+    return RECORD_HEADER.pack(received_at, len(data) | flags, data[PACKET_ID_OFFSET]) + data
+
+
+class CaptureRecord:
+    __slots__ = ("received_at", "packet_id", "data", "flags", "end")
+
+    def __init__(self, received_at, packet_id, data, flags=0, end=None):
+        self.received_at = received_at
+        self.packet_id = packet_id
+        self.data = data
+        self.flags = flags
+        # Kaydın dosyadaki bitiş konumu; kaldığı yerden okumaya devam etmek için.
+        self.end = end
+
+    def datagram(self):
+        """Oyundan gelen datagramın tam boyutlu halini döndürür."""
+        if self.flags & FLAG_PLAYER_ONLY:
+            return expand_player_car(self.data, self.packet_id)
+        return self.data
+
+    def packet(self):
+        """
+        Datagramı, başlığındaki oyun yılı ve paket sürümüne ait sınıfa
+        (``SCHEMAS``) çözer. Şeması bilinmeyen ya da boyutu tutmayan
+        datagramlar için None döner.
+        """
+        data = self.datagram()
+        schema = SCHEMAS.lookup(data)
+        if schema is None:
+            return None
+        return schema.packet_type.from_buffer_copy(data)
+
+    def view(self):
+        """
+        ``packet`` ile aynı koşullarda datagramın tembel görünümünü
+        (``PacketView``) döndürür; alanlar yalnızca okunduklarında çözülür.
+        """
+        data = self.datagram()
+        schema = SCHEMAS.lookup(data)
+        if schema is None:
+            return None
+        return schema.packet_type.lazy(data)
+
+
+def iter_capture(path, packet_ids=None, offset=None):
+    """
+    Kayıt dosyasındaki ``CaptureRecord`` nesnelerini sırayla üretir.
+
+    ``packet_ids`` verilirse yalnızca o türdeki kayıtlar döndürülür; diğerlerinin
+    gövdesi okunmadan atlanır. ``offset`` verilirse okuma o bayttan (bir kaydın
+    başı, ör. önceki bir kaydın ``end`` değeri) başlar. Yarım yazılmış son kayıt
+    sessizce yok sayılır.
+    """
+    header_size = RECORD_HEADER.size
+    unpack_header = RECORD_HEADER.unpack
+    with open(path, "rb") as f:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise CaptureFormatError(f"{path} geçerli bir telemetri kayıt dosyası değil.")
+        position = len(CAPTURE_MAGIC)
+        if offset is not None and offset > position:
+            position = f.seek(offset)
+        while True:
+            header = f.read(header_size)
+            if len(header) < header_size:
+                return
+            received_at, length, packet_id = unpack_header(header)
+            flags = length & ~LENGTH_MASK
+            length &= LENGTH_MASK
+            position += header_size + length
+            if packet_ids is not None and packet_id not in packet_ids:
+                f.seek(length, 1)
+                continue
+            data = f.read(length)
+            if len(data) < length:
+                return
+            yield CaptureRecord(received_at, packet_id, data, flags, position)
+
+
+def read_packets(path, packet_ids=None):
+    """Kayıt dosyasındaki paketleri parser24 nesneleri olarak tek tek çözer."""
+    for record in iter_capture(path, packet_ids):
+        packet = record.packet()
+        if packet is not None:
+            yield packet
+
+
+def read_views(path, packet_ids=None):
+    """Kayıt dosyasındaki paketleri tembel görünümler (``PacketView``) olarak üretir."""
+    for record in iter_capture(path, packet_ids):
+        view = record.view()
+        if view is not None:
+            yield view
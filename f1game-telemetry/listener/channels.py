@@ -0,0 +1,226 @@
+# listener/channels.py
+"""
+Seans kaydından kanal (sütun) çıkarma.
+
+Analiz kodu paketleri tek tek çözüp ``p['m_car_telemetry_data'][i]`` ile değer
+aramak yerine istediği kanalları tek çağrıyla, bitişik ve tipli NumPy
+dizileri olarak alır::
+
+    data = extract('1234567890', ['speed', 'throttle', 'm_lap_distance'])
+    data.session_time, data['speed'], data['m_lap_distance']
+
+Yalnızca istenen kanalların paket türleri çözülür (``bulk.load_session``).
+Kanallar ilk kanalın paket türünün zaman çizelgesine hizalanır; diğer paket
+türlerinin değerleri aynı ya da daha önceki son oyun karesinden
+(``m_overall_frame_identifier``) alınır. Sonuçlar seans klasöründe önbelleğe
+yazılır; kayıt değişmediği sürece aynı çağrı dosyadan okunur.
+"""
+
+import hashlib
+import json
+import os
+
+from listener.bulk import load_session, player_cars, require_numpy
+from listener.filters import CAR_ARRAY_LAYOUT, CAR_COUNT, CAR_STRUCT_TYPES
+from listener.session_files import find_session_dir, rig_stream_dir, session_log_paths
+from listener.schemas import DEFAULT_PACKET_FORMAT
+
+DATA_DIR = 'data'
+CACHE_DIRNAME = 'channels'
+# Önbellek dosyalarının biçimi değişirse artırılır; eski dosyalar yok sayılır.
+CACHE_VERSION = 1
+
+# TelemetryData alan adlarıyla kanal kısayolları: ad -> (paket ID, araç yapısı alanı)
+CHANNEL_ALIASES = {
+    'speed': (6, 'm_speed'),
+    'throttle': (6, 'm_throttle'),
+    'brake': (6, 'm_brake'),
+    'gear': (6, 'm_gear'),
+    'rpm': (6, 'm_engine_rpm'),
+    'drs': (6, 'm_drs'),
+    'fuel_in_tank': (7, 'm_fuel_in_tank'),
+    'tyre_compound': (7, 'm_visual_tyre_compound'),
+    'ers_store_energy': (7, 'm_ers_store_energy'),
+    'ers_deploy_mode': (7, 'm_ers_deploy_mode'),
+}
+
+
+def resolve_channel(name):
+    """
+    Kanal adını ``(paket ID, alan)`` olarak çözer. Kısayollar, araç yapılarındaki
+    alan adları (``m_lap_distance``) ve birden fazla pakette geçen alanlar için
+    ``'2:m_grid_position'`` biçimi kabul edilir.
+    """
+    if name in CHANNEL_ALIASES:
+        return CHANNEL_ALIASES[name]
+    packet_part, _, field = name.rpartition(':')
+    if packet_part:
+        if not packet_part.isdigit() or int(packet_part) not in CAR_STRUCT_TYPES:
+            raise ValueError(f"Geçersiz kanal: {name} (paket ID araç dizisi taşımıyor)")
+        candidates = [int(packet_part)]
+    else:
+        candidates = sorted(CAR_STRUCT_TYPES)
+    matches = [
+        packet_id for packet_id in candidates
+        if field in dict(CAR_STRUCT_TYPES[packet_id]._fields_)
+    ]
+    if not matches:
+        raise ValueError(f"Bilinmeyen kanal: {name}")
+    if len(matches) > 1:
+        options = ', '.join(f"{packet_id}:{field}" for packet_id in matches)
+        raise ValueError(f"Belirsiz kanal: {name}. Paket ID ile belirtin: {options}")
+    return matches[0], field
+
+
+class ChannelData:
+    """
+    Aynı uzunlukta ``session_time``, ``frame`` ve kanal dizileri. Kanallar
+    istenen adlarıyla ``data['speed']`` biçiminde okunur.
+    """
+
+    __slots__ = ('session_time', 'frame', 'columns', 'cached')
+
+    def __init__(self, session_time, frame, columns, cached=False):
+        self.session_time = session_time
+        self.frame = frame
+        self.columns = columns
+        self.cached = cached
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        return len(self.session_time)
+
+    def keys(self):
+        return self.columns.keys()
+
+
+def session_path(session, data_dir=DATA_DIR):
+    """Seans klasörünü; klasör yolundan, UID'den (ya da başından) veya ``RaceSession`` nesnesinden bulur."""
+    if isinstance(session, str) and os.path.isdir(session):
+        return session
+    key = str(getattr(session, 'session_uid', session))
+    session_dir = find_session_dir(data_dir, key)
+    if session_dir is None:
+        raise ValueError(f"'{key}' için tek bir kayıtlı seans bulunamadı ({data_dir}/).")
+    return session_dir
+
+
+def extract(session, channels, car=None, packet_format=DEFAULT_PACKET_FORMAT, data_dir=DATA_DIR, cache=True,
+            rig=None):
+    """
+    Seansın ``channels`` kanallarını ``ChannelData`` olarak döndürür.
+
+    ``car`` verilmezse her paketin oyuncu aracı (``m_player_car_index``)
+    kullanılır; oyuncu indeksi geçersiz paketler atlanır. ``car`` verilirse
+    dizinin o sıradaki aracı okunur. ``rig`` verilirse seansla aynı UID'yi
+    bildiren ikinci rig'in ayrı kaydedilen akışı okunur.
+    """
+    np = require_numpy()
+    channels = list(channels)
+    if not channels:
+        raise ValueError("En az bir kanal verilmelidir.")
+    if car is not None and not 0 <= car < CAR_COUNT:
+        raise ValueError(f"Geçersiz araç indeksi: {car} (0-{CAR_COUNT - 1} arası olmalı)")
+    resolved = [resolve_channel(name) for name in channels]
+    session_dir = session_path(session, data_dir)
+    if rig is not None:
+        session_dir = rig_stream_dir(session_dir, rig)
+    sources = session_log_paths(session_dir)
+    if not sources:
+        raise ValueError(f"{session_dir} içinde kayıt bulunamadı.")
+
+    cache_path = None
+    if cache:
+        key = json.dumps([CACHE_VERSION, packet_format, car, channels, resolved])
+        cache_name = hashlib.sha1(key.encode()).hexdigest()[:16] + '.npz'
+        cache_path = os.path.join(session_dir, CACHE_DIRNAME, cache_name)
+        data = _read_cache(cache_path, channels, _source_stamp(sources))
+        if data is not None:
+            return data
+
+    packet_ids = list(dict.fromkeys(packet_id for packet_id, _ in resolved))
+    loaded = load_session(session_dir, packet_ids, packet_format)
+
+    streams = {packet_id: _car_stream(loaded[packet_id][0], packet_id, car) for packet_id in packet_ids}
+    frame, session_time, _ = streams[packet_ids[0]]
+    columns = {}
+    for name, (packet_id, field) in zip(channels, resolved):
+        stream_frame, _, cars = streams[packet_id]
+        values = cars[field]
+        if packet_id != packet_ids[0]:
+            values = _align(stream_frame, values, frame)
+        columns[name] = np.ascontiguousarray(values)
+    data = ChannelData(np.ascontiguousarray(session_time), np.ascontiguousarray(frame), columns)
+
+    if cache_path is not None:
+        _write_cache(cache_path, data, channels, _source_stamp(sources))
+    return data
+
+
+def _car_stream(packets, packet_id, car):
+    """Paket türünün kare sırasına dizilmiş ``(kare, seans zamanı, araç kayıtları)`` akışı."""
+    np = require_numpy()
+    header = packets['m_header']
+    if car is None:
+        cars, valid = player_cars(packets, packet_id)
+        header = header[valid]
+    else:
+        cars = packets[CAR_ARRAY_LAYOUT[packet_id][0]][:, car]
+    frame = header['m_overall_frame_identifier']
+    # UDP sırası karışmış olabilir; hizalama kare sırasına göre yapılır.
+    order = np.argsort(frame, kind='stable')
+    return frame[order], header['m_session_time'][order].astype(np.float64), cars[order]
+
+
+def _align(source_frame, values, frame):
+    """``values`` dizisini, her karede o kareye kadar gelen son değeri alacak şekilde ``frame``'e hizalar."""
+    np = require_numpy()
+    if not len(source_frame):
+        # Bu paket türünden hiç paket yok.
+        return np.zeros((len(frame),) + values.shape[1:], dtype=values.dtype)
+    index = np.searchsorted(source_frame, frame, side='right') - 1
+    # İlk paketinden önceki kareler ilk değeri alır.
+    return values[np.maximum(index, 0)]
+
+
+def _source_stamp(sources):
+    """Önbelleğin geçerliliği için kayıt dosyalarının boyut ve değiştirilme zamanları."""
+    stamp = []
+    for path in sources:
+        stat = os.stat(path)
+        stamp.extend([stat.st_size, stat.st_mtime_ns])
+    return stamp
+
+
+def _read_cache(path, channels, stamp):
+    np = require_numpy()
+    try:
+        with np.load(path) as cached:
+            if cached['source'].tolist() != stamp:
+                return None
+            columns = {name: cached[f'channel_{index}'] for index, name in enumerate(channels)}
+            return ChannelData(cached['session_time'], cached['frame'], columns, cached=True)
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_cache(path, data, channels, stamp):
+    np = require_numpy()
+    arrays = {f'channel_{index}': data.columns[name] for index, name in enumerate(channels)}
+    temporary = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary, 'wb') as f:
+            np.savez(f, source=np.array(stamp, dtype=np.int64), session_time=data.session_time,
+                     frame=data.frame, **arrays)
+        # Yarım yazılmış önbellek dosyası okunmasın diye yerine tek adımda taşınır.
+        os.replace(temporary, path)
+    except OSError:
+        # Önbellek isteğe bağlıdır; yazılamazsa sonuç yine döndürülür.
+        if os.path.exists(temporary):
+            os.remove(temporary)
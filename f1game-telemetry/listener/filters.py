@@ -0,0 +1,183 @@
+# listener/filters.py
+"""
+Seçici kayıt: paket türü izin/engel listeleri ve "yalnızca oyuncu aracı" modu.
+
+22 araçlık dizi taşıyan paketlerde oyuncu modu, ``m_player_car_index`` ile
+oyuncunun yapısını (struct) dizinin bayt konumundan doğrudan keser; diğer 21
+araç ne çözülür ne de diske yazılır.
+"""
+
+import ctypes
+from collections import Counter
+
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE, MAX_CARS, PacketHeader
+
+PLAYER_INDEX_OFFSET = PacketHeader.m_player_car_index.offset
+CAR_COUNT = MAX_CARS
+
+# Kaydedilmezlerse log'lar import_sessions ile aktarılamayan paket türleri: ID -> açıklama
+IMPORT_PACKET_IDS = {1: 'seans bilgisi', 2: 'tur verisi'}
+
+# Maliyet tahmini için her türden kaç pakette bir tam yolun ölçüleceği.
+SAMPLE_EVERY = 256
+COST_GAIN = 0.2
+
+
+def _car_array_layout(packet_type):
+    """Paket sınıfındaki 22 araçlık dizinin (alan adı, bayt konumu, eleman boyutu) bilgisi."""
+    name = packet_type.car_array_field()
+    if name is None:
+        return None
+    return name, getattr(packet_type, name).offset, ctypes.sizeof(dict(packet_type._fields_)[name]._type_)
+
+
+# packet_id -> (alan adı, dizi konumu, araç yapısı boyutu)
+CAR_ARRAY_LAYOUT = {
+    packet_id: layout
+    for packet_id, packet_type in HEADER_FIELD_TO_PACKET_TYPE.items()
+    if (layout := _car_array_layout(packet_type)) is not None
+}
+
+# packet_id -> araç yapısının ctypes sınıfı (ör. CarTelemetryData)
+CAR_STRUCT_TYPES = {
+    packet_id: dict(HEADER_FIELD_TO_PACKET_TYPE[packet_id]._fields_)[name]._type_
+    for packet_id, (name, _, _) in CAR_ARRAY_LAYOUT.items()
+}
+
+
+def player_index(data):
+    index = data[PLAYER_INDEX_OFFSET]
+    return index if index < CAR_COUNT else None
+
+
+def player_car(data, packet_id):
+    """Oyuncu aracının yapısını, paketin tamamını çözmeden doğrudan bayt konumundan okur."""
+    index = player_index(data)
+    if index is None:
+        return None
+    _, offset, car_size = CAR_ARRAY_LAYOUT[packet_id]
+    return CAR_STRUCT_TYPES[packet_id].from_buffer_copy(data, offset + index * car_size)
+
+
+def player_car_view(data, packet_id):
+    """``player_car`` gibi, ancak aracı kopyalamadan tembel görünüm (``PacketView``) olarak döndürür."""
+    index = player_index(data)
+    if index is None:
+        return None
+    _, offset, car_size = CAR_ARRAY_LAYOUT[packet_id]
+    return CAR_STRUCT_TYPES[packet_id].lazy(data, offset + index * car_size)
+
+
+def compact_player_car(data, packet_id):
+    """Datagramdan diğer araçları çıkarır: başlık + oyuncu aracı + dizi sonrası alanlar."""
+    _, offset, car_size = CAR_ARRAY_LAYOUT[packet_id]
+    start = offset + player_index(data) * car_size
+    return bytes(data[:offset]) + bytes(data[start:start + car_size]) + bytes(data[offset + CAR_COUNT * car_size:])
+
+
+def expand_player_car(data, packet_id):
+    """``compact_player_car`` çıktısını, diğer araçları sıfırlayarak tam boyuta geri açar."""
+    _, offset, car_size = CAR_ARRAY_LAYOUT[packet_id]
+    index = data[PLAYER_INDEX_OFFSET]
+    return (
+        data[:offset]
+        + bytes(index * car_size)
+        + data[offset:offset + car_size]
+        + bytes((CAR_COUNT - index - 1) * car_size)
+        + data[offset + car_size:]
+    )
+
+
+def player_car_dict(packet, index):
+    """``to_dict`` ile aynı yapıyı üretir; araç dizisinde yalnızca oyuncunun girdisi doludur."""
+    array_field = CAR_ARRAY_LAYOUT[packet.m_header.m_packet_id][0]
+    result = {}
+    for name, _ in packet._fields_:
+        if name == array_field:
+            cars = [None] * CAR_COUNT
+            cars[index] = getattr(packet, name)[index].to_dict()
+            result[name] = cars
+        else:
+            result[name] = packet.get_value(name)
+    return result
+
+
+def parse_packet_ids(value):
+    """'0,2,6' biçimindeki komut satırı değerini paket ID kümesine çevirir."""
+    if not value:
+        return None
+    packet_ids = {int(part) for part in value.split(',') if part.strip()}
+    unknown = packet_ids - set(HEADER_FIELD_TO_PACKET_TYPE)
+    if unknown:
+        raise ValueError(f"Bilinmeyen paket ID'leri: {sorted(unknown)}")
+    return frozenset(packet_ids)
+
+
+class PacketFilter:
+    """
+    Hangi paketlerin kaydedileceğine ve ne kadarının kaydedileceğine karar verir.
+
+    Tasarruf edilen bayt ve CPU süresi, her türden ``SAMPLE_EVERY`` pakette bir
+    tam yolun (filtre yokmuş gibi) ölçülmesiyle tahmin edilir.
+    """
+
+    def __init__(self, allow=None, deny=None, player_only=False):
+        self.allow = frozenset(allow) if allow is not None else None
+        self.deny = frozenset(deny or ())
+        self.player_only = player_only
+        self.skipped_packets = Counter()
+        self.skipped_bytes = 0
+        self.trimmed_packets = 0
+        self.trimmed_bytes = 0
+        self.cpu_saved = 0.0
+        self._seen = Counter()
+        self._full_cost = {}
+        self._full_size = {}
+
+    @property
+    def active(self):
+        return self.allow is not None or bool(self.deny) or self.player_only
+
+    def accepts(self, packet_id):
+        if self.allow is not None and packet_id not in self.allow:
+            return False
+        return packet_id not in self.deny
+
+    def import_gaps(self):
+        """Filtrenin kaydetmediği, log'ların aktarımı için gereken paket türleri: ID -> açıklama."""
+        return {packet_id: name for packet_id, name in IMPORT_PACKET_IDS.items() if not self.accepts(packet_id)}
+
+    def trims(self, packet_id, data):
+        return self.player_only and packet_id in CAR_ARRAY_LAYOUT and player_index(data) is not None
+
+    def should_sample(self, packet_id):
+        self._seen[packet_id] += 1
+        return self._seen[packet_id] % SAMPLE_EVERY == 1
+
+    def record_full_cost(self, packet_id, seconds, payload_size):
+        previous = self._full_cost.get(packet_id)
+        self._full_cost[packet_id] = seconds if previous is None else previous + (seconds - previous) * COST_GAIN
+        self._full_size[packet_id] = payload_size
+
+    def record_skip(self, packet_id):
+        self.skipped_packets[packet_id] += 1
+        self.skipped_bytes += self._full_size.get(packet_id, 0)
+        self.cpu_saved += self._full_cost.get(packet_id, 0.0)
+
+    def record_trim(self, packet_id, seconds, payload_size):
+        self.trimmed_packets += 1
+        self.trimmed_bytes += max(0, self._full_size.get(packet_id, payload_size) - payload_size)
+        self.cpu_saved += max(0.0, self._full_cost.get(packet_id, seconds) - seconds)
+
+    def stats(self):
+        return {
+            'skipped_packets': sum(self.skipped_packets.values()),
+            'skipped_by_type': {
+                HEADER_FIELD_TO_PACKET_TYPE[packet_id].__name__: count
+                for packet_id, count in sorted(self.skipped_packets.items())
+            },
+            'skipped_bytes': self.skipped_bytes,
+            'trimmed_packets': self.trimmed_packets,
+            'trimmed_bytes': self.trimmed_bytes,
+            'cpu_saved_ms': round(self.cpu_saved * 1000, 3),
+        }
@@ -0,0 +1,107 @@
+# listener/forwarding.py
+"""
+Ham datagramların başka yerel araçlara (ikinci kayıtçı, overlay vb.) iletilmesi.
+
+Oyun yalnızca tek bir porta gönderir ve o portu tek bir süreç dinleyebilir.
+Dinleyici, aldığı datagramları çözmeden önce hedeflere olduğu gibi iletir.
+Her hedef kendi bağlı (connected) ve bloklamayan soketini kullanır; hedefin
+tamponu doluysa paket beklenmeden atılır, böylece ana kayıt yavaşlamaz.
+"""
+
+import socket
+
+from listener.capture import PACKET_ID_OFFSET
+from listener.filters import parse_packet_ids
+
+
+def parse_target(value):
+    """
+    'host:port' ya da paket filtresiyle 'host:port=2,6,7' biçimindeki hedefi
+    ``(host, port, packet_ids)`` olarak döndürür.
+    """
+    address, _, ids = value.partition('=')
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"Geçersiz iletim hedefi: {value} (beklenen host:port[=id,id])")
+    return host, int(port), parse_packet_ids(ids)
+
+
+class ForwardTarget:
+    """Tek bir iletim hedefi ve sayaçları."""
+
+    def __init__(self, host, port, packet_ids=None):
+        self.host = host
+        self.port = port
+        self.packet_ids = frozenset(packet_ids) if packet_ids is not None else None
+        self.sent = 0
+        self.bytes_sent = 0
+        self.filtered = 0
+        self.would_block = 0
+        self.errors = 0
+        self.last_error = None
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        # Bağlı soket: hedef başına ayrı olduğundan bir hedefin ICMP hatası diğerine yansımaz.
+        self._socket.connect((host, port))
+        self._send = self._socket.send
+
+    @property
+    def name(self):
+        return f"{self.host}:{self.port}"
+
+    def forward(self, data, packet_id):
+        if self.packet_ids is not None and packet_id not in self.packet_ids:
+            self.filtered += 1
+            return
+        try:
+            self._send(data)
+        except BlockingIOError:
+            self.would_block += 1
+            return
+        except OSError as e:
+            # Ör. hedef port kapalıysa (ECONNREFUSED) paket atılır; dinleyici çalışmaya devam eder.
+            self.errors += 1
+            self.last_error = e.strerror or str(e)
+            return
+        self.sent += 1
+        self.bytes_sent += len(data)
+
+    def close(self):
+        self._socket.close()
+
+    def as_dict(self):
+        return {
+            'sent': self.sent,
+            'bytes_sent': self.bytes_sent,
+            'filtered': self.filtered,
+            'would_block': self.would_block,
+            'errors': self.errors,
+            'last_error': self.last_error,
+        }
+
+
+class Forwarder:
+    """Datagramları filtrelerine göre tüm hedeflere iletir."""
+
+    def __init__(self, targets):
+        self.targets = [
+            target if isinstance(target, ForwardTarget) else ForwardTarget(*target)
+            for target in targets
+        ]
+
+    def forward(self, data):
+        if len(data) <= PACKET_ID_OFFSET:
+            return
+        packet_id = data[PACKET_ID_OFFSET]
+        for target in self.targets:
+            target.forward(data, packet_id)
+
+    def sent(self):
+        return sum(target.sent for target in self.targets)
+
+    def close(self):
+        for target in self.targets:
+            target.close()
+
+    def stats(self):
+        return {target.name: target.as_dict() for target in self.targets}
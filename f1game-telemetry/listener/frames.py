@@ -0,0 +1,207 @@
+# listener/frames.py
+"""
+Paketlerin ``m_overall_frame_identifier`` ile çerçevelere (frame) toplanması.
+
+Oyun aynı kareye ait tüm paketleri aynı çerçeve kimliğiyle gönderir. Araç
+telemetrisi ve araç durumu gibi paketleri ``m_session_time`` değerini
+yuvarlayarak eşleştirmek yerine bu tamsayı anahtar üzerinden birleştiriyoruz.
+``m_overall_frame_identifier`` flashback sonrasında da geri gitmez.
+
+Paket ID sabitleri ve çerçeveden ``TelemetryData`` değerlerini çıkaran
+``frame_values`` canlı aktarım (``ingest``) ile log aktarımının (``importer``)
+ortak kurallarıdır.
+"""
+
+import heapq
+import time
+
+SESSION_PACKET_ID = 1
+LAP_PACKET_ID = 2
+CAR_TELEMETRY_PACKET_ID = 6
+CAR_STATUS_PACKET_ID = 7
+
+# Eksik kalan bir çerçevenin, kaç kare daha yeni çerçeve görüldükten sonra bekletilmeden işleneceği.
+FRAME_MAX_LAG = 8
+
+
+class Frame:
+    """Tek bir oyun karesine ait paketler: paket ID -> yük (çözülmüş paket, sözlük vb.)."""
+
+    __slots__ = ('session_uid', 'frame_id', 'session_time', 'packets', 'complete', 'first_seen')
+
+    def __init__(self, session_uid, frame_id, session_time, first_seen=None):
+        self.session_uid = session_uid
+        self.frame_id = frame_id
+        self.session_time = session_time
+        self.packets = {}
+        self.complete = False
+        self.first_seen = first_seen
+
+    def __repr__(self):
+        return f"Frame({self.session_uid}, {self.frame_id}, {sorted(self.packets)}, complete={self.complete})"
+
+
+class _SessionFrames:
+    __slots__ = ('pending', 'order', 'latest', 'released_upto')
+
+    def __init__(self):
+        self.pending = {}
+        self.order = []
+        self.latest = -1
+        self.released_upto = -1
+
+
+class FrameAssembler:
+    """
+    Seans başına çerçeveleri biriktirir ve çerçeve sırasıyla serbest bırakır.
+
+    Bir çerçeve şu durumlardan biri gerçekleştiğinde (ve kendisinden önceki
+    çerçeveler çıktıktan sonra) serbest bırakılır:
+      - ``required`` içindeki tüm paket türleri geldiyse (tamamlanmış),
+      - aynı seansta ``max_lag`` kareden daha yeni bir çerçeve görüldüyse,
+      - ``timeout`` verildiyse, ilk paketinden bu yana o kadar saniye geçtiyse.
+
+    Serbest bırakılmış bir çerçeveye sonradan gelen paketler geç sayılır ve atılır.
+    """
+
+    def __init__(self, packet_ids=None, required=None, max_lag=4, timeout=None, clock=time.monotonic):
+        self.packet_ids = frozenset(packet_ids) if packet_ids is not None else None
+        self.required = frozenset(required) if required else None
+        self.max_lag = max_lag
+        self.timeout = timeout
+        self.clock = clock
+        self._sessions = {}
+        self.frames_complete = 0
+        self.frames_incomplete = 0
+        self.late_packets = 0
+        self.duplicate_packets = 0
+
+    def add(self, session_uid, packet_id, frame_id, session_time, payload):
+        """Paketi çerçevesine ekler; serbest kalan çerçeveleri sırayla döndürür."""
+        if self.packet_ids is not None and packet_id not in self.packet_ids:
+            return []
+        frames = self._sessions.get(session_uid)
+        if frames is None:
+            frames = self._sessions[session_uid] = _SessionFrames()
+        if frame_id <= frames.released_upto:
+            self.late_packets += 1
+            return []
+
+        frame = frames.pending.get(frame_id)
+        if frame is None:
+            frame = Frame(session_uid, frame_id, session_time, self.clock() if self.timeout else None)
+            frames.pending[frame_id] = frame
+            heapq.heappush(frames.order, frame_id)
+        elif packet_id in frame.packets:
+            self.duplicate_packets += 1
+        frame.packets[packet_id] = payload
+        if frame_id > frames.latest:
+            frames.latest = frame_id
+        return self._release(frames)
+
+    def expire(self):
+        """Zaman aşımına uğrayan çerçeveleri döndürür (paket gelmediği anlarda çağrılır)."""
+        released = []
+        for frames in self._sessions.values():
+            released.extend(self._release(frames))
+        return released
+
+    def flush(self):
+        """Bekleyen tüm çerçeveleri, tamamlanmamış olsalar da sırayla döndürür."""
+        released = []
+        for frames in self._sessions.values():
+            while frames.order:
+                released.append(self._pop(frames))
+        return released
+
+    def pending(self):
+        return sum(len(frames.pending) for frames in self._sessions.values())
+
+    def snapshot(self, session_uid, encode=None):
+        """
+        Seansın bekleyen çerçevelerini ve sıra bilgisini JSON'a yazılabilir bir
+        sözlük olarak döndürür; ``encode`` yükleri dönüştürür (ör. ``to_dict``).
+        """
+        frames = self._sessions.get(session_uid) or _SessionFrames()
+        encode = encode or (lambda payload: payload)
+        return {
+            'latest': frames.latest,
+            'released_upto': frames.released_upto,
+            'frames': [
+                [frame.frame_id, frame.session_time, [[packet_id, encode(payload)] for packet_id, payload in frame.packets.items()]]
+                for frame in (frames.pending[frame_id] for frame_id in sorted(frames.order))
+            ],
+        }
+
+    def restore(self, session_uid, snapshot):
+        """``snapshot`` ile alınmış durumu geri yükler; çerçeveler kaldıkları yerden birleştirilmeye devam eder."""
+        frames = self._sessions[session_uid] = _SessionFrames()
+        frames.released_upto = snapshot['released_upto']
+        for frame_id, session_time, packets in snapshot['frames']:
+            frame = frames.pending[frame_id] = Frame(session_uid, frame_id, session_time, self.clock() if self.timeout else None)
+            heapq.heappush(frames.order, frame_id)
+            frame.packets.update((packet_id, payload) for packet_id, payload in packets)
+        frames.latest = snapshot['latest']
+
+    def stats(self):
+        return {
+            'frames_complete': self.frames_complete,
+            'frames_incomplete': self.frames_incomplete,
+            'late_packets': self.late_packets,
+            'duplicate_packets': self.duplicate_packets,
+            'pending': self.pending(),
+        }
+
+    def _release(self, frames):
+        released = []
+        now = None
+        while frames.order:
+            head = frames.pending[frames.order[0]]
+            if self.required is not None and self.required.issubset(head.packets):
+                head.complete = True
+            elif head.frame_id >= frames.latest - self.max_lag:
+                if self.timeout is None:
+                    break
+                now = self.clock() if now is None else now
+                if now - head.first_seen < self.timeout:
+                    break
+            released.append(self._pop(frames))
+        return released
+
+    def _pop(self, frames):
+        frame_id = heapq.heappop(frames.order)
+        frame = frames.pending.pop(frame_id)
+        frames.released_upto = frame_id
+        if frame.complete:
+            self.frames_complete += 1
+        else:
+            self.frames_incomplete += 1
+        return frame
+
+
+def frame_values(frame):
+    """
+    Çerçevedeki oyuncu aracının telemetri ve durum verisini ``TelemetryData``
+    alan adlarıyla tek sözlükte birleştirir. Paketler ``to_dict`` sözlüğü ya da
+    aynı alanları okuyan ``PacketView`` olabilir.
+    """
+    values = {}
+    telemetry = frame.packets.get(CAR_TELEMETRY_PACKET_ID)
+    if telemetry is not None:
+        values.update({
+            'speed': telemetry.get('m_speed'),
+            'throttle': telemetry.get('m_throttle'),
+            'brake': telemetry.get('m_brake'),
+            'gear': telemetry.get('m_gear'),
+            'rpm': telemetry.get('m_engine_rpm'),
+            'drs': telemetry.get('m_drs') == 1,
+        })
+    status = frame.packets.get(CAR_STATUS_PACKET_ID)
+    if status is not None:
+        values.update({
+            'fuel_in_tank': status.get('m_fuel_in_tank'),
+            'tyre_compound': status.get('m_visual_tyre_compound'),
+            'ers_store_energy': status.get('m_ers_store_energy'),
+            'ers_deploy_mode': status.get('m_ers_deploy_mode'),
+        })
+    return values
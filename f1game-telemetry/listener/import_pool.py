@@ -0,0 +1,148 @@
+# listener/import_pool.py
+"""
+Seans loglarının süreç havuzunda paralel okunması.
+
+    görevler -> [N işçi süreci: log okuma + SessionReader] -> sonuç kuyruğu -> [ana süreç: SessionWriter]
+
+JSON çözme, çerçeve birleştirme ve tur eşleştirme her seans için bağımsızdır
+ve CPU'ya bağlıdır; bunlar işçilerde yapılır. SQLite tek yazarla çalıştığı için
+veritabanı yazımları ``ListenerPipeline``'da olduğu gibi ana süreçte, tek
+noktadan yürütülür. Sonuç kuyruğu sınırlıdır: yazar geride kalırsa işçiler
+bekler ve bellekte seans başına en fazla birkaç turluk nokta bulunur.
+
+Bitiş işareti göndermeden ölen bir işçi (ör. belleği tükenip sonlandırılan bir
+süreç) bitmiş sayılır; sonucu gelmeyen seanslar hata olarak bildirilir.
+"""
+
+import multiprocessing
+import queue
+import signal
+import time
+from collections import namedtuple
+
+# Sonuç beklenirken ölen işçilerin denetlenme aralığı (saniye)
+WORKER_CHECK_INTERVAL = 0.5
+
+# state None ise seans baştan okunur; değilse SessionReader.checkpoint durumundan
+# ve laps (LapRecord listesi) turlarından devam edilir.
+ImportTask = namedtuple('ImportTask', [
+    'session_uid', 'paths', 'start_index', 'start_offset', 'player_car_index', 'state', 'laps',
+])
+
+
+def _import_worker(worker_id, tasks, results, ignore_sigint, done):
+    if ignore_sigint:
+        # Ctrl+C'yi yalnızca ana süreç yakalar.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # spawn ile başlatılan süreçlerde (Windows, macOS) uygulamalar henüz yüklenmemiştir.
+    import django
+    django.setup()
+    from listener.importer import SessionReader, feed_logs
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        started = time.perf_counter()
+        try:
+            if task.state is None:
+                reader = SessionReader(task.session_uid, task.player_car_index)
+            else:
+                reader = SessionReader.restore(task.session_uid, task.player_car_index, task.state, task.laps)
+
+            def feed(packet):
+                closed = reader.feed(packet)
+                if closed is not None:
+                    results.put(('lap', task.session_uid, closed))
+
+            read = feed_logs(feed, task.paths, task.start_index, task.start_offset)
+            state = reader.checkpoint()
+            points = reader.finish()
+            results.put(('done', task.session_uid, {
+                'points': points,
+                'summaries': reader.lap_summaries(),
+                'state': state,
+                'read': read,
+                'session_info': reader.session_info,
+                'player_car_index': reader.player_car_index,
+                'worker': worker_id,
+                'packets': reader.packets,
+                'seconds': time.perf_counter() - started,
+            }))
+        except Exception as exc:
+            results.put(('error', task.session_uid, str(exc)))
+    done.value = 1
+    # Ana süreç, bu işaretlerden işçi sayısı kadar aldığında tüm görevlerin bittiğini anlar.
+    results.put(None)
+
+
+class ImportPool:
+    """
+    ``workers`` adet süreçle seansları okuyan havuz. ``run`` sonuç mesajlarını
+    geldikleri sırayla üretir; aynı seansın mesajları kendi içinde sıralıdır:
+
+      - ``('lap', uid, (LapRecord, noktalar))``: bir tur kapandı,
+      - ``('done', uid, sonuç)``: kalan noktalar, tur özetleri, devam durumu
+        okunan dosyalar, seans bilgisi ve oyuncu indeksi,
+      - ``('error', uid, mesaj)``: seans okunamadı ya da okuyan işçi öldü.
+    """
+
+    def __init__(self, workers, queue_size=64):
+        context = multiprocessing.get_context()
+        self._tasks = context.Queue()
+        self._results = context.Queue(queue_size)
+        # İşçi bitiş işaretini göndermeden önce kendi bayrağını kaldırır.
+        self._done = [context.RawValue('b', 0) for _ in range(max(1, workers))]
+        self._workers = [
+            context.Process(
+                target=_import_worker,
+                args=(worker_id, self._tasks, self._results, True, done),
+                daemon=True,
+            )
+            for worker_id, done in enumerate(self._done, start=1)
+        ]
+
+    def run(self, tasks):
+        for worker in self._workers:
+            worker.start()
+        # Sonucu ('done' ya da 'error') henüz gelmemiş seanslar
+        pending = set()
+        for task in tasks:
+            self._tasks.put(task)
+            pending.add(task.session_uid)
+        for _ in self._workers:
+            self._tasks.put(None)
+
+        finished = 0
+        dead = set()
+        try:
+            while finished < len(self._workers):
+                try:
+                    item = self._results.get(timeout=WORKER_CHECK_INTERVAL)
+                except queue.Empty:
+                    finished += self._reap_dead_workers(dead)
+                    continue
+                if item is None:
+                    finished += 1
+                    continue
+                if item[0] != 'lap':
+                    pending.discard(item[1])
+                yield item
+            # Ölen işçilerin yarıda kalan ya da hiç başlanamayan seansları
+            for session_uid in sorted(pending):
+                yield ('error', session_uid, "Seansı okuyan işçi süreci beklenmedik şekilde durdu.")
+        finally:
+            for worker in self._workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+    def _reap_dead_workers(self, dead):
+        """Bitiş işareti göndermeden ölen işçileri bulur; kaç işçinin yeni bittiğini döndürür."""
+        reaped = 0
+        for number, (worker, done) in enumerate(zip(self._workers, self._done)):
+            # Bitiş işaretini gönderip çıkan işçinin işareti kuyrukta olabilir.
+            if number in dead or done.value or worker.exitcode is None:
+                continue
+            dead.add(number)
+            reaped += 1
+        return reaped
@@ -0,0 +1,422 @@
+# listener/importer.py
+"""
+Kayıtlı bir seansın veritabanına akış halinde aktarımı.
+
+``import_sessions`` seansın tüm paketlerini bir listeye alıp üç kez dolaşmak
+yerine log'u bir kez okur ve her paketi ``SessionImporter.feed`` ile iki
+tüketiciye verir: biten turları çıkaran ``LapConsumer`` ve telemetri/durum
+paketlerini aynı oyun karesinde birleştiren ``TelemetryConsumer``. Telemetri
+satırları, ``LiveIngestor``'da olduğu gibi, bitişleri ondan sonra olan tur
+kapanana kadar bekletilir ve tur kapandığında toplu eklenir. Böylece bellekte
+seansın tamamı değil, en fazla kapanmamış turun satırları tutulur.
+
+Oyun ``m_current_lap_num`` değerini seans içinde geri almadığından turlar
+artan numarayla kapanır ve bir satırın turu, onu kapsayan ilk tur kapandığında
+kesinleşir; sonuç tüm log okunduktan sonra yapılan eşleştirmeyle aynıdır.
+
+Paketlerden tur ve nokta üreten ``SessionReader`` veritabanına dokunmaz;
+yazımları ``SessionWriter`` yapar. ``SessionImporter`` ikisini aynı süreçte
+birleştirir, ``import_pool`` ise okuyucuları işçi süreçlerinde çalıştırıp
+yazımları ana süreçte toplar. Canlı aktarım (``LiveIngestor``) da turları,
+satırları ve noktaları bu modülün tüketicileri ve yazarıyla üretir.
+
+Oyuncu indeksi log'un ilk paketinin başlığından, seans bilgisi (pist, tür,
+mod) ilk seans paketinden aynı geçişte okunur; log bunlar için ayrıca
+taranmaz.
+
+Aktarım yarıda bırakılıp log büyüdükçe sürdürülebilir: ``checkpoint`` okunan
+son paketten sonraki durumu JSON olarak döndürür, ``resume`` bu durumu geri
+yükler ve ``iter_log`` dosyayı kaldığı bayttan okur.
+"""
+
+import json
+import os
+from collections import namedtuple
+
+from dashboard.models import Lap, TelemetryData
+from listener.capture import CAPTURE_FILENAME, iter_capture
+from listener.frames import (
+    CAR_STATUS_PACKET_ID, CAR_TELEMETRY_PACKET_ID, FRAME_MAX_LAG, LAP_PACKET_ID, SESSION_PACKET_ID, FrameAssembler,
+    frame_values,
+)
+from listener.intervals import IntervalIndex
+from listener.lap_summary import LAP_SUMMARY_FIELDS, LapSummary
+
+CAR_FIELDS = {CAR_TELEMETRY_PACKET_ID: 'm_car_telemetry_data', CAR_STATUS_PACKET_ID: 'm_car_status_data'}
+BATCH_SIZE = 500
+
+LapRecord = namedtuple('LapRecord', ['lap_number', 'lap_time_ms', 'start_time', 'end_time'])
+
+
+def iter_log(path, offset=0):
+    """
+    Log dosyasındaki paketleri ``(paket, bitiş konumu)`` olarak üretir; bitiş
+    konumu sonraki okumanın başlayacağı bayttır. İkili kayıttaki paketler tembel
+    görünüm olarak döner; şeması bilinmeyen kayıtlar için paket None'dır.
+    Dinleyicinin henüz yazmayı bitirmediği son satır ya da kayıt okunmaz.
+    """
+    if path.endswith(CAPTURE_FILENAME):
+        for record in iter_capture(path, offset=offset):
+            yield record.view(), record.end
+        return
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                return
+            offset += len(line)
+            yield json.loads(line), offset
+
+
+def feed_logs(feed, paths, start_index=0, start_offset=0):
+    """
+    ``paths`` loglarındaki paketleri, ``start_index``. dosyanın ``start_offset``
+    baytından itibaren ``feed``'e verir. Okunan her dosya için ``(yol, okumadan
+    önceki stat, bitiş baytı)`` döndürür; boyut okumadan önce alındığından okuma
+    sırasında büyüyen dosya bir sonraki aktarımda büyümüş görünür.
+    """
+    read = []
+    for index in range(start_index, len(paths)):
+        path, offset = paths[index], (start_offset if index == start_index else 0)
+        stat = os.stat(path)
+        for packet, offset in iter_log(path, offset):
+            if packet is not None:
+                feed(packet)
+        read.append((path, stat, offset))
+    return read
+
+
+def assign_laps(rows, lap_index, summaries=None):
+    """
+    ``(seans zamanı, değerler, son bilinen değerler)`` satırlarını ``lap_index``
+    dizinindeki (``LapRecord``) turlarına atar ve ``(seans zamanı, tur no, tur
+    zamanı, değerler, son bilinen değerler)`` noktalarına çevirir. ``summaries``
+    verilirse (tur no -> ``LapSummary``) noktalar turlarının özetine eklenir.
+    """
+    points = []
+    for time, values, last_known in rows:
+        lap = lap_index.find(time)
+        if lap is None:
+            points.append((time, None, time, values, last_known))
+            continue
+        if summaries is not None:
+            summary = summaries.get(lap.lap_number)
+            if summary is None:
+                summary = summaries[lap.lap_number] = LapSummary()
+            summary.add(values, last_known)
+        points.append((time, lap.lap_number, time - lap.start_time, values, last_known))
+    return points
+
+
+def _payload_dict(payload):
+    # Çerçevede bekleyen oyuncu aracı: JSONL'den sözlük, ikili kayıttan PacketView.
+    return payload.to_dict() if hasattr(payload, 'to_dict') else payload
+
+
+class LapConsumer:
+    """Tur paketlerinden biten turları ``LapRecord`` olarak çıkarır."""
+
+    def __init__(self, player_car_index=None):
+        self.player_car_index = player_car_index
+        self.recorded = set()
+
+    def feed(self, header, packet):
+        """Bu paketle biten ve daha önce kaydedilmemiş bir tur varsa döndürür."""
+        return self.feed_car(packet['m_lap_data'][self.player_car_index], header.get('m_session_time', 0))
+
+    def feed_car(self, lap_data, session_time):
+        """``feed`` gibi, ancak oyuncu aracının tur verisini (sözlük ya da ``PacketView``) alır."""
+        lap_number = lap_data.get('m_current_lap_num', 1) - 1
+        last_lap_ms = lap_data.get('m_last_lap_time_in_ms', 0)
+        if lap_number > 0 and last_lap_ms > 0 and lap_number not in self.recorded:
+            self.recorded.add(lap_number)
+            return LapRecord(lap_number, last_lap_ms, session_time - (last_lap_ms / 1000.0), session_time)
+        return None
+
+
+class TelemetryConsumer:
+    """
+    Telemetri ve durum paketlerini ``m_overall_frame_identifier`` ile birleştirir
+    ve çerçeve sırasıyla ``(seans zamanı, değerler, son bilinen değerler)``
+    satırları üretir. Yakıt, lastik ve ERS için son bilinen değer taşınır.
+    """
+
+    def __init__(self, session_uid, player_car_index=None):
+        self.session_uid = session_uid
+        self.player_car_index = player_car_index
+        sample_ids = tuple(CAR_FIELDS)
+        self.frames = FrameAssembler(sample_ids, required=sample_ids, max_lag=FRAME_MAX_LAG)
+        self.last_known = {'fuel': None, 'compound': None, 'ers_store': None, 'ers_mode': None}
+
+    def feed(self, header, packet):
+        packet_id = header.get('m_packet_id')
+        if header.get('m_session_time') is None:
+            return []
+        return self._rows(self.frames.add(
+            self.session_uid, packet_id, header.get('m_overall_frame_identifier'),
+            header.get('m_session_time'), packet[CAR_FIELDS[packet_id]][self.player_car_index],
+        ))
+
+    def finish(self):
+        return self._rows(self.frames.flush())
+
+    def row(self, frame):
+        """Çerçevenin satırını döndürür; telemetri verisi olmayan çerçevelerde yalnızca son bilinen değerler güncellenir."""
+        values = frame_values(frame)
+        last_known = self.last_known
+        # Mevcut çerçevede veri yoksa son bilinen değer kullanılır.
+        last_known['fuel'] = values.get('fuel_in_tank', last_known['fuel'])
+        last_known['compound'] = values.get('tyre_compound', last_known['compound'])
+        last_known['ers_store'] = values.get('ers_store_energy', last_known['ers_store'])
+        last_known['ers_mode'] = values.get('ers_deploy_mode', last_known['ers_mode'])
+        # Sadece telemetri verisi (hız, rpm vb.) olan çerçeveler kaydedilir.
+        if 'speed' in values or 'rpm' in values:
+            return frame.session_time, values, dict(last_known)
+        return None
+
+    def _rows(self, frames):
+        rows = []
+        for frame in frames:
+            row = self.row(frame)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+
+class SessionReader:
+    """
+    Seansın paketlerini turlara ve telemetri noktalarına dönüştürür; veritabanına
+    dokunmaz, bu yüzden işçi süreçlerinde de çalışabilir. Bir tur kapandığında
+    ``feed`` ``(tur, noktalar)`` döndürür; noktalar ``(seans zamanı, tur no,
+    tur zamanı, değerler, son bilinen değerler)`` biçimindedir.
+
+    ``player_car_index`` verilmezse ilk paketin başlığından alınır; orada da
+    yoksa seansın paketleri işlenmez.
+    """
+
+    def __init__(self, session_uid, player_car_index=None):
+        self.session_uid = session_uid
+        self.player_car_index = player_car_index
+        self.lap_consumer = LapConsumer(player_car_index)
+        self.telemetry_consumer = TelemetryConsumer(session_uid, player_car_index)
+        # İlk seans paketindeki pist, tür ve mod (ör. {'track_id': 10, ...}); görülmediyse None
+        self.session_info = None
+        # Kapanmış turlar: tur no -> LapRecord
+        self.laps = {}
+        # Satırların turunu bulmak için; çakışmada küçük tur numarası kazanır.
+        self.lap_index = IntervalIndex()
+        # Turu henüz kesinleşmemiş satırlar
+        self.rows = []
+        # Tur no -> turdaki noktaların sayaçları (LapSummary)
+        self.summaries = {}
+        self.packets = 0
+
+    def feed(self, packet):
+        self.packets += 1
+        header = packet.get('m_header', {})
+        if self.packets == 1 and self.player_car_index is None:
+            self._set_player_car_index(header.get('m_player_car_index'))
+        packet_id = header.get('m_packet_id')
+        if packet_id == SESSION_PACKET_ID:
+            if self.session_info is None:
+                self.session_info = {
+                    'track_id': packet.get('m_track_id'),
+                    'session_type': packet.get('m_session_type'),
+                    'game_mode': packet.get('m_game_mode'),
+                }
+        elif self.player_car_index is None:
+            return None
+        elif packet_id == LAP_PACKET_ID:
+            lap = self.lap_consumer.feed(header, packet)
+            if lap is not None:
+                self._add_lap(lap)
+                # Bu turun bitişinden önceki satırların turu artık değişmez.
+                rows = [row for row in self.rows if row[0] < lap.end_time]
+                self.rows = [row for row in self.rows if row[0] >= lap.end_time]
+                return lap, self._points(rows)
+        elif packet_id in CAR_FIELDS:
+            self.rows.extend(self.telemetry_consumer.feed(header, packet))
+        return None
+
+    def finish(self):
+        """Bekleyen çerçeveleri ve kalan satırları (tamamlanmamış tur) nokta olarak döndürür."""
+        self.rows.extend(self.telemetry_consumer.finish())
+        rows, self.rows = self.rows, []
+        return self._points(rows)
+
+    def lap_summaries(self):
+        """Tur no -> ``Lap`` alanlarıyla tur özeti (lastik, ERS modu, DRS oranı)."""
+        return {lap_number: summary.fields() for lap_number, summary in sorted(self.summaries.items())}
+
+    def checkpoint(self):
+        """Verilen son paketten sonraki durumu JSON'a yazılabilir bir sözlük olarak döndürür."""
+        return {
+            'frames': self.telemetry_consumer.frames.snapshot(self.session_uid, encode=_payload_dict),
+            'last_known': dict(self.telemetry_consumer.last_known),
+            'rows': list(self.rows),
+            'summaries': {lap_number: summary.to_state() for lap_number, summary in self.summaries.items()},
+        }
+
+    @classmethod
+    def restore(cls, session_uid, player_car_index, state, laps):
+        """``checkpoint`` durumundan ve önceden kapanmış ``laps`` turlarından devam eden bir okuyucu döndürür."""
+        reader = cls(session_uid, player_car_index)
+        for lap in laps:
+            reader._add_lap(LapRecord(*lap))
+        reader.lap_consumer.recorded.update(reader.laps)
+        reader.telemetry_consumer.frames.restore(session_uid, state['frames'])
+        reader.telemetry_consumer.last_known.update(state['last_known'])
+        reader.rows = [tuple(row) for row in state['rows']]
+        # JSON anahtarları metne dönüştüğünden tur numaraları geri çevrilir.
+        reader.summaries = {
+            int(lap_number): LapSummary.from_state(summary) for lap_number, summary in state['summaries'].items()
+        }
+        return reader
+
+    def _set_player_car_index(self, player_car_index):
+        self.player_car_index = player_car_index
+        self.lap_consumer.player_car_index = player_car_index
+        self.telemetry_consumer.player_car_index = player_car_index
+
+    def _add_lap(self, lap):
+        self.laps[lap.lap_number] = lap
+        self.lap_index.add(lap.start_time, lap.end_time, lap, priority=lap.lap_number)
+
+    def _points(self, rows):
+        return assign_laps(rows, self.lap_index, self.summaries)
+
+
+class SessionWriter:
+    """``SessionReader``'ın ürettiği turları ve telemetri noktalarını bir seansa yazar."""
+
+    def __init__(self, session, laps=None, batch_size=BATCH_SIZE):
+        self.session = session
+        self.batch_size = batch_size
+        # Yazılmış turlar: tur no -> Lap
+        self.laps = laps or {}
+        self.laps_created = 0
+        # Devam eden aktarımda önceki aktarımın son noktası; ``rollback`` bunun sonrasını siler.
+        self.provisional_after = None
+        self._created_laps = []
+        self.points_created = 0
+
+    @classmethod
+    def resume(cls, session, state, batch_size=BATCH_SIZE):
+        """
+        ``checkpoint`` sonrasında ``finish``'in geçici olarak yazdığı noktaları
+        siler ve seansın yazılmış turlarıyla bir yazar döndürür.
+        """
+        TelemetryData.objects.filter(session=session, pk__gt=state['provisional_after']).delete()
+        writer = cls(session, {lap.lap_number: lap for lap in Lap.objects.filter(session=session)}, batch_size)
+        writer.provisional_after = state['provisional_after']
+        return writer
+
+    def rollback(self):
+        """
+        ``resume`` ile devam eden yazarın eklediği turları ve noktaları siler;
+        önceki aktarımın turları ve manifestoları korunur. Özetler bir sonraki
+        aktarımda devam durumundan yeniden hesaplanır.
+        """
+        TelemetryData.objects.filter(session=self.session, pk__gt=self.provisional_after).delete()
+        Lap.objects.filter(pk__in=self._created_laps).delete()
+
+    def lap_records(self):
+        return [
+            LapRecord(lap.lap_number, lap.lap_time_ms, lap.start_time, lap.end_time)
+            for lap in self.laps.values()
+        ]
+
+    def last_point(self):
+        """Şu ana kadar yazılmış son telemetri noktasının birincil anahtarı."""
+        return TelemetryData.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+
+    def write_lap(self, lap, summary=None):
+        """``LapRecord`` turunu yazar; ``summary`` verilirse (``LapSummary.fields``) özetiyle birlikte."""
+        self.laps[lap.lap_number] = Lap.objects.create(
+            session=self.session, lap_number=lap.lap_number, lap_time_ms=lap.lap_time_ms,
+            start_time=lap.start_time, end_time=lap.end_time, **(summary or {}),
+        )
+        self._created_laps.append(self.laps[lap.lap_number].pk)
+        self.laps_created += 1
+
+    def write_points(self, points):
+        laps = self.laps
+        objects = [
+            TelemetryData(
+                session=self.session, lap=laps[lap_number] if lap_number is not None else None,
+                session_time=time, lap_time=lap_time,
+                speed=values.get('speed', 0),
+                throttle=values.get('throttle', 0.0),
+                brake=values.get('brake', 0.0),
+                gear=values.get('gear', 0),
+                rpm=values.get('rpm', 0),
+                fuel_in_tank=last_known['fuel'],
+                drs=values.get('drs', False),
+                ers_store_energy=last_known['ers_store'],
+                ers_deploy_mode=last_known['ers_mode'],
+            )
+            for time, lap_number, lap_time, values, last_known in points
+        ]
+        if objects:
+            TelemetryData.objects.bulk_create(objects, batch_size=self.batch_size)
+            self.points_created += len(objects)
+
+    def write_summaries(self, summaries):
+        """Tur özetlerini tüm turlar için tek bir ``bulk_update`` ile yazar."""
+        laps = []
+        for lap_number, fields in summaries.items():
+            lap = self.laps[lap_number]
+            for field, value in fields.items():
+                setattr(lap, field, value)
+            laps.append(lap)
+        if laps:
+            Lap.objects.bulk_update(laps, list(LAP_SUMMARY_FIELDS), batch_size=self.batch_size)
+
+
+class SessionImporter:
+    """
+    Tek bir seansın paketlerini sırayla alıp turları ve telemetri noktalarını
+    aynı süreçte yazar (``SessionReader`` + ``SessionWriter``). ``feed`` ile
+    tüm paketler verildikten sonra ``finish`` çağrılmalıdır; kalan satırlar
+    (tamamlanmamış tur) yazılır ve tur özetleri (lastik, ERS, DRS) güncellenir.
+    """
+
+    def __init__(self, session, player_car_index=None, batch_size=BATCH_SIZE, reader=None, writer=None):
+        self.session = session
+        self.reader = reader or SessionReader(session.session_uid, player_car_index)
+        self.writer = writer or SessionWriter(session, batch_size=batch_size)
+
+    @property
+    def laps_created(self):
+        return self.writer.laps_created
+
+    @property
+    def points_created(self):
+        return self.writer.points_created
+
+    def feed(self, packet):
+        closed = self.reader.feed(packet)
+        if closed is not None:
+            lap, points = closed
+            self.writer.write_lap(lap)
+            self.writer.write_points(points)
+
+    def checkpoint(self):
+        """
+        ``SessionReader.checkpoint`` durumunu döndürür; ``finish``'ten önce
+        çağrılmalıdır. ``finish`` bekleyen satırları turları kesinleşmeden
+        yazdığından bu satırlar geçicidir ve ``resume`` tarafından silinip
+        yeniden işlenir.
+        """
+        return dict(self.reader.checkpoint(), provisional_after=self.writer.last_point())
+
+    @classmethod
+    def resume(cls, session, player_car_index, state, batch_size=BATCH_SIZE):
+        """``checkpoint`` ile alınmış durumdan, yazılmış turları veritabanından okuyarak devam eden bir aktarıcı döndürür."""
+        writer = SessionWriter.resume(session, state, batch_size)
+        reader = SessionReader.restore(session.session_uid, player_car_index, state, writer.lap_records())
+        return cls(session, player_car_index, reader=reader, writer=writer)
+
+    def finish(self):
+        self.writer.write_points(self.reader.finish())
+        self.writer.write_summaries(self.reader.lap_summaries())
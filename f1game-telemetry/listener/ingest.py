@@ -0,0 +1,202 @@
+# listener/ingest.py
+"""
+Seans sürerken tur ve telemetri verisinin veritabanına canlı aktarımı.
+
+``import_sessions`` ile aynı kurallar uygulanır (aynı çerçevedeki telemetri ve
+durum paketlerinin birleştirilmesi, son bilinen yakıt/ERS/lastik değerlerinin
+taşınması, ``lap_summary`` ile tur özetleri), ancak tüm log'u yeniden okumak yerine
+``PacketLapData`` içinde ``m_current_lap_num`` arttığı anda biten tur kaydedilir
+ve o tura ait telemetri noktaları tek bir toplu ekleme ile yazılır. Biten turlar
+``LapConsumer``, satırlar ``TelemetryConsumer``, noktalar ``assign_laps`` ve
+veritabanı kayıtları ``SessionWriter`` ile aktarımdakiyle aynı kodla üretilir.
+"""
+
+from django.db.models import Max
+
+from dashboard.models import Lap, TelemetryData
+from listener.filters import player_car_view
+from listener.frames import (
+    CAR_STATUS_PACKET_ID, CAR_TELEMETRY_PACKET_ID, FRAME_MAX_LAG, LAP_PACKET_ID, SESSION_PACKET_ID, FrameAssembler,
+)
+from listener.importer import LapConsumer, SessionWriter, TelemetryConsumer, assign_laps
+from listener.intervals import IntervalIndex
+from listener.lap_summary import LapSummary
+from listener.parser24 import PacketHeader, PacketSessionData
+
+FRAME_PACKET_IDS = frozenset({LAP_PACKET_ID, CAR_TELEMETRY_PACKET_ID, CAR_STATUS_PACKET_ID})
+INGEST_PACKET_IDS = FRAME_PACKET_IDS | {SESSION_PACKET_ID}
+
+
+class SessionIngestState:
+    """Tek bir seansın henüz veritabanına yazılmamış telemetri satırları ve turları."""
+
+    def __init__(self, session_uid):
+        # Çerçeveler canlı aktarımda birleştirildiğinden tüketicilere oyuncu aracının verisi verilir.
+        self.lap_consumer = LapConsumer()
+        self.telemetry_consumer = TelemetryConsumer(session_uid)
+        # (seans zamanı, değerler, son bilinen değerler); çerçeve sırasıyla eklenir.
+        self.rows = []
+        # Görülen ama henüz yazılmamış turlar (LapRecord)
+        self.pending_laps = []
+        # Seansın yazarı; yazılmış turları (tur no -> Lap) tutar ve ilk yazımda oluşturulur.
+        self.writer = None
+        # Yazılmış turların LapRecord dizini; çakışmada küçük tur numarası kazanır.
+        self.lap_index = IntervalIndex()
+        # Dinleme başlamadan önce seansa yazılmış son noktanın zamanı (yoksa None)
+        self.stored_until = None
+        self.session_info = None
+        self.session_info_saved = False
+
+
+class LiveIngestor:
+    """
+    Ana döngüden beslenen canlı aktarım aşaması.
+
+    Paketler önce ``FrameAssembler`` ile çerçevelere toplanır; çerçeveler sırayla
+    işlendiğinden geç gelen telemetri de doğru tura düşer. ``feed`` yalnızca
+    bellekteki durumu günceller ve yazılmaya hazır bir tur olduğunda True
+    döner; veritabanı yazımları ``flush`` içinde toplu yapılır. Böylece asenkron
+    dinleyici ``flush``'ı ``sync_to_async`` ile ayrıca çalıştırabilir.
+    """
+
+    packet_ids = INGEST_PACKET_IDS
+
+    def __init__(self, session_registry, log=None, max_lag=FRAME_MAX_LAG):
+        self.session_registry = session_registry
+        self.log = log or (lambda message, style=None: None)
+        self.frames = FrameAssembler(FRAME_PACKET_IDS, required=FRAME_PACKET_IDS, max_lag=max_lag)
+        self._states = {}
+        self.laps_written = 0
+        self.points_written = 0
+        self.flushes = 0
+
+    def feed(self, session_uid, packet_id, data):
+        state = self._state(session_uid)
+        if packet_id == SESSION_PACKET_ID:
+            if state.session_info is None:
+                packet = PacketSessionData.from_buffer_copy(data)
+                state.session_info = {'session_type': packet.m_session_type, 'game_mode': packet.m_game_mode}
+            return False
+
+        car = player_car_view(data, packet_id)
+        if car is None:
+            return False
+        # Paket çözülmez; çerçeve anahtarları başlıktan, değerler (frame_values)
+        # oyuncu aracının görünümünden okundukları anda çözülür.
+        header = PacketHeader.lazy(data)
+        frames = self.frames.add(
+            session_uid, packet_id, header.field('m_overall_frame_identifier'),
+            header.field('m_session_time'), car,
+        )
+        for frame in frames:
+            self._apply_frame(state, frame)
+        return bool(state.pending_laps)
+
+    def flush(self):
+        """Kapanan turları ve bitişlerine kadar biriken telemetri noktalarını yazar."""
+        for session_uid, state in self._states.items():
+            if not state.pending_laps:
+                continue
+            session = self.session_registry.resolve(session_uid)[0]
+            self._save_session_info(session, state)
+            pending, state.pending_laps = state.pending_laps, []
+            for lap in pending:
+                self._write_lap(session, state, lap)
+
+    def finish(self):
+        """Dinleyici kapanırken bekleyen çerçeveleri, turları ve kalan noktaları (tamamlanmamış tur) yazar."""
+        for frame in self.frames.flush():
+            self._apply_frame(self._state(frame.session_uid), frame)
+        self.flush()
+        for session_uid, state in self._states.items():
+            if not state.rows and (state.session_info is None or state.session_info_saved):
+                continue
+            session = self.session_registry.resolve(session_uid)[0]
+            self._save_session_info(session, state)
+            if state.rows:
+                writer = self._writer(session, state)
+                rows = self._unstored(state, self._drain(state, until=None))
+                self._write_points(writer, assign_laps(rows, state.lap_index))
+
+    def stats(self):
+        return {
+            'sessions': len(self._states),
+            'laps_written': self.laps_written,
+            'points_written': self.points_written,
+            'flushes': self.flushes,
+            'frames': self.frames.stats(),
+        }
+
+    def _state(self, session_uid):
+        state = self._states.get(session_uid)
+        if state is None:
+            state = self._states[session_uid] = SessionIngestState(session_uid)
+        return state
+
+    def _apply_frame(self, state, frame):
+        lap_data = frame.packets.get(LAP_PACKET_ID)
+        if lap_data is not None:
+            lap = state.lap_consumer.feed_car(lap_data, frame.session_time)
+            if lap is not None:
+                state.pending_laps.append(lap)
+        row = state.telemetry_consumer.row(frame)
+        if row is not None:
+            state.rows.append(row)
+
+    def _save_session_info(self, session, state):
+        if state.session_info is None or state.session_info_saved:
+            return
+        state.session_info_saved = True
+        for field, value in state.session_info.items():
+            setattr(session, field, value)
+        session.save(update_fields=list(state.session_info))
+
+    def _writer(self, session, state):
+        # Dinleyici seans ortasında yeniden başlatıldıysa önceden yazılmış turlar atlanır.
+        if state.writer is None:
+            state.writer = SessionWriter(session, {lap.lap_number: lap for lap in Lap.objects.filter(session=session)})
+            for lap in state.writer.lap_records():
+                state.lap_index.add(lap.start_time, lap.end_time, lap, priority=lap.lap_number)
+            stored = TelemetryData.objects.filter(session=session).aggregate(Max('session_time'))
+            state.stored_until = stored['session_time__max']
+        return state.writer
+
+    def _write_lap(self, session, state, lap):
+        writer = self._writer(session, state)
+        rows = self._unstored(state, self._drain(state, until=lap.end_time))
+        existing = writer.laps.get(lap.lap_number)
+        if existing is not None:
+            # Tur zaten yazılmış (ör. aktarılmış seans yeniden oynatılıyor); turun
+            # aralığındaki satırlar ikinci kez eklenmez.
+            if existing.start_time is not None and existing.end_time is not None:
+                rows = [row for row in rows if not existing.start_time <= row[0] < existing.end_time]
+            self._write_points(writer, assign_laps(rows, state.lap_index))
+            return
+
+        state.lap_index.add(lap.start_time, lap.end_time, lap, priority=lap.lap_number)
+        summaries = {}
+        points = assign_laps(rows, state.lap_index, summaries)
+        writer.write_lap(lap, summaries.get(lap.lap_number, LapSummary()).fields())
+        self.laps_written += 1
+        self._write_points(writer, points)
+        self.log(f"Tur {lap.lap_number} (seans {session.session_uid}) canlı aktarıldı: {len(points)} telemetri noktası.", 'SUCCESS')
+
+    def _unstored(self, state, rows):
+        """Seansa dinleme başlamadan önce yazılmış noktalarla örtüşen satırları ayıklar."""
+        if state.stored_until is None:
+            return rows
+        return [row for row in rows if row[0] > state.stored_until]
+
+    def _drain(self, state, until):
+        """``until`` öncesindeki satırları ayırıp döndürür; kalanlar sonraki tura bırakılır."""
+        if until is None:
+            rows, state.rows = state.rows, []
+            return rows
+        rows = [row for row in state.rows if row[0] < until]
+        state.rows = [row for row in state.rows if row[0] >= until]
+        return rows
+
+    def _write_points(self, writer, points):
+        writer.write_points(points)
+        self.points_written += len(points)
+        self.flushes += 1
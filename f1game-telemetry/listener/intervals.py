@@ -0,0 +1,75 @@
+# listener/intervals.py
+"""
+Telemetri örneklerinin turlara atanması için aralık dizini.
+
+Her örnek için tüm turları tek tek denemek (örnek × tur karşılaştırma) yerine
+tur başlangıç ve bitişleri sıralı sınırlar olarak tutulur ve örneğin zamanı
+``bisect`` ile aranır. Turlar az, örnekler çok olduğundan dizin yalnızca yeni
+bir tur eklendiğinde yeniden kurulur::
+
+    index = IntervalIndex()
+    index.add(lap.start_time, lap.end_time, lap, priority=lap.lap_number)
+    index.find(session_time)  # start_time <= t < end_time olan tur ya da None
+
+Aralıklar çakışırsa (tur süresinden geri hesaplanan başlangıç, önceki turun
+bitişinden biraz önce kalabilir) önceliği küçük olan, eşitse önce eklenen
+aralık döner; yani sonuç aralıkları bu sırayla tek tek denemekle aynıdır.
+"""
+
+import heapq
+from bisect import bisect_right
+
+
+class IntervalIndex:
+    """``[başlangıç, bitiş)`` aralıklarından bir zamanı kapsayan değeri bulan dizin."""
+
+    def __init__(self):
+        # (öncelik, ekleme sırası, başlangıç, bitiş, değer)
+        self._intervals = []
+        self._bounds = None
+        self._values = None
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def add(self, start, end, value, priority=0):
+        # Başlangıcı/bitişi bilinmeyen ya da boş aralıklar hiçbir zamanı kapsamaz.
+        if start is None or end is None or not start < end:
+            return
+        self._intervals.append((priority, len(self._intervals), start, end, value))
+        self._bounds = None
+
+    def find(self, time, default=None):
+        """``başlangıç <= time < bitiş`` olan aralıkların en öncelikli değerini döndürür."""
+        if self._bounds is None:
+            self._build()
+        position = bisect_right(self._bounds, time) - 1
+        if position < 0:
+            return default
+        winner = self._values[position]
+        return default if winner is None else winner[0]
+
+    def _build(self):
+        """
+        Sınırları sıralar ve ardışık iki sınır arasındaki her parçanın değerini
+        bir kez hesaplar. Tüm uçlar sınır olduğundan bir aralık bir parçayı ya
+        tamamen kapsar ya da hiç kapsamaz; parçanın değeri, onu kapsayan
+        aralıkların en öncelikli olanıdır.
+        """
+        bounds = sorted({point for interval in self._intervals for point in interval[2:4]})
+        by_start = sorted(self._intervals, key=lambda interval: interval[2])
+        values = []
+        heap = []
+        next_interval = 0
+        for bound in bounds:
+            while next_interval < len(by_start) and by_start[next_interval][2] == bound:
+                priority, order, _, end, value = by_start[next_interval]
+                heapq.heappush(heap, (priority, order, end, value))
+                next_interval += 1
+            # Bitmiş aralıklar yalnızca en üste çıktıklarında atılır.
+            while heap and heap[0][2] <= bound:
+                heapq.heappop(heap)
+            # Değer bir demet içinde tutulur; None değerli aralıklar da bulunabilir.
+            values.append((heap[0][3],) if heap else None)
+        self._bounds = bounds
+        self._values = values
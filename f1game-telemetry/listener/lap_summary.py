@@ -0,0 +1,63 @@
+# listener/lap_summary.py
+"""
+Telemetri noktalarından tur özetlerinin (lastik, ERS modu, DRS kullanımı) çıkarılması.
+
+Noktalar turlarına atanırken aynı geçişte her tur için sayaçlar güncellenir;
+böylece tur bittiğinde noktaları yeniden taramaya ya da listede ``count``
+çağırmaya gerek kalmaz ve özetler tek bir ``bulk_update`` ile yazılır.
+
+Her ``Lap`` alanı bir özet türüne ve noktadan değeri seçen fonksiyona
+bağlanır. Yeni bir tur özeti için ``Lap``'e alanı eklemek ve
+``LAP_SUMMARY_FIELDS``'e bir satır eklemek yeterlidir:
+
+  - ``majority``: turda en sık görülen değer (boş değerler sayılmaz; eşitlikte
+    turda ilk görülen),
+  - ``ratio``: değeri doğru olan noktaların turdaki tüm noktalara oranı.
+"""
+
+from collections import Counter
+
+# Lap alanı -> (özet türü, (değerler, son bilinen değerler) -> sayılacak değer)
+LAP_SUMMARY_FIELDS = {
+    'tyre_compound': ('majority', lambda values, last_known: last_known['compound']),
+    'ers_deploy_mode': ('majority', lambda values, last_known: last_known['ers_mode']),
+    'drs_ratio': ('ratio', lambda values, last_known: values.get('drs', False)),
+}
+
+
+class LapSummary:
+    """Tek bir turun noktalarındaki değerlerin sayaçları: Lap alanı -> Counter."""
+
+    __slots__ = ('counts',)
+
+    def __init__(self, counts=None):
+        self.counts = counts or {field: Counter() for field in LAP_SUMMARY_FIELDS}
+
+    def add(self, values, last_known):
+        for field, (_, select) in LAP_SUMMARY_FIELDS.items():
+            self.counts[field][select(values, last_known)] += 1
+
+    def fields(self):
+        """Özetleri ``Lap`` alan adlarıyla döndürür."""
+        summary = {}
+        for field, (kind, _) in LAP_SUMMARY_FIELDS.items():
+            counts = self.counts[field]
+            if kind == 'majority':
+                known = [value for value in counts if value is not None]
+                summary[field] = max(known, key=counts.__getitem__) if known else None
+            else:
+                total = sum(counts.values())
+                summary[field] = sum(count for value, count in counts.items() if value) / total if total else None
+        return summary
+
+    def to_state(self):
+        # JSON nesne anahtarları metne dönüştüğünden sayaçlar [değer, sayı] çiftleri olarak yazılır.
+        return {field: [[value, count] for value, count in counts.items()] for field, counts in self.counts.items()}
+
+    @classmethod
+    def from_state(cls, state):
+        summary = cls()
+        for field, pairs in state.items():
+            if field in summary.counts:
+                summary.counts[field].update(dict(pairs))
+        return summary
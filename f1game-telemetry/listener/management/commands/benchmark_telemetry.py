@@ -0,0 +1,44 @@
+# listener/management/commands/benchmark_telemetry.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from listener.benchmarks import BENCHMARKS
+
+
+class Command(BaseCommand):
+    help = 'Dinleyici ve içe aktarma yolları için ölçüm senaryolarını çalıştırır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('suite', nargs='?', help='Çalıştırılacak senaryo. Boş bırakılırsa liste gösterilir.')
+        parser.add_argument('--duration', type=float, default=3.0, help='Zamana bağlı senaryoların süresi (saniye).')
+        parser.add_argument('--rcvbuf', type=int, default=4 * 1024 * 1024, help='Denenecek SO_RCVBUF değeri (bayt).')
+        parser.add_argument('--batch-size', type=int, default=64, help='Toplu alma boyutu.')
+        parser.add_argument('--session-hours', type=float, default=2.0, help='İçe aktarma senaryosundaki sentetik seansın süresi (saat).')
+
+    def handle(self, *args, **options):
+        suite = options['suite']
+        if not suite:
+            for name, func in sorted(BENCHMARKS.items()):
+                self.stdout.write(f"{self.style.SUCCESS(name):<30} {func.description}")
+            return
+        if suite not in BENCHMARKS:
+            raise CommandError(f"Bilinmeyen senaryo: {suite}. Seçenekler: {', '.join(sorted(BENCHMARKS))}")
+
+        func = BENCHMARKS[suite]
+        self.stdout.write(self.style.HTTP_INFO(f"\n>> {suite}: {func.description}\n"))
+        try:
+            rows = func(**options)
+        except ImportError as exc:
+            raise CommandError(str(exc))
+        self._print_table(rows)
+
+    def _print_table(self, rows):
+        if not rows:
+            self.stdout.write(self.style.WARNING("Sonuç yok."))
+            return
+        columns = list(rows[0])
+        widths = {c: max(len(str(c)), *(len(str(row.get(c, ''))) for row in rows)) for c in columns}
+        self.stdout.write("  ".join(str(c).ljust(widths[c]) for c in columns))
+        self.stdout.write("  ".join("-" * widths[c] for c in columns))
+        for row in rows:
+            self.stdout.write("  ".join(str(row.get(c, '')).ljust(widths[c]) for c in columns))
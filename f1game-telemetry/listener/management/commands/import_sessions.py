@@ -1,14 +1,59 @@
+import hashlib
 import os
-import json
-from collections import defaultdict
+import time
 from django.core.management.base import BaseCommand
 from dashboard.models import RaceSession, Lap, TelemetryData
 # Gerekli sabitleri ve modelleri import ediyoruz
 from django.db import transaction
 from dashboard.constants import TRACK_NAMES
+from listener.import_pool import ImportPool, ImportTask
+from listener.importer import SessionImporter, SessionWriter, feed_logs
+from listener.models import ImportManifest
+from listener.session_files import session_log_paths
+
+# Seans baştan aktarılır (yeni ya da log'u değişmiş seans, --full).
+FULL_IMPORT = 'full'
+
+
+# Manifest özetine katılan pencere boyutu (bayt): okunan kısmın başı ve sonu.
+HASH_WINDOW = 64 * 1024
+
+
+def _file_hash(path, length):
+    """
+    Dosyanın ilk ``length`` baytının başındaki ve sonundaki ``HASH_WINDOW``
+    baytlık pencerelerin SHA-1 özeti. Okunan kısmın tamamı özetlenmediğinden
+    maliyet log boyutundan bağımsızdır; yeniden yazılan ya da başka bir seansla
+    değiştirilen log başından, kesilip yeniden büyüyen log ise kaldığı yerin
+    hemen öncesinden yakalanır.
+    """
+    digest = hashlib.sha1(str(length).encode())
+    with open(path, 'rb') as f:
+        head = f.read(min(length, HASH_WINDOW))
+        digest.update(head)
+        tail_start = max(len(head), length - HASH_WINDOW)
+        f.seek(tail_start)
+        digest.update(f.read(length - tail_start))
+    return digest.hexdigest()
+
 
 class Command(BaseCommand):
-    help = 'data/ klasöründeki tüm seans loglarını okur, eski veriyi temizler ve yeniden veritabanına aktarır.'
+    help = ('data/ klasöründeki seans loglarını veritabanına aktarır. Değişmeyen loglar atlanır, büyüyen '
+            'logların yalnızca yeni kısmı okunur; --full ile eski veri temizlenip her şey yeniden aktarılır. '
+            'Aynı UID\'yi bildiren ikinci bir rig\'in rig_<etiket>/ klasörüne yazılan akışı aktarılmaz '
+            '(seans kaydı ilk rig\'indir); bu akış replay_telemetry --rig ile oynatılabilir ya da '
+            'channels.extract(..., rig=...) ile okunabilir.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full', action='store_true',
+            help='Veritabanını tamamen temizler ve tüm seansları baştan aktarır.',
+        )
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help='Seans loglarını okuyacak süreç sayısı. 1\'den büyükse seanslar paralel okunur; '
+                 'veritabanı yazımları yine tek süreçte yapılır.',
+        )
 
     def print_header(self, text):
         """Ana başlıklar için şık bir çıktı oluşturur."""
@@ -28,196 +73,300 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"'{data_dir}' klasörü bulunamadı. Script durduruluyor."))
             return
 
-        # --- 1. Veritabanını Temizleme ---
-        self.print_subheader("1. Eski Veritabanı Kayıtları Temizleniyor")
-        TelemetryData.objects.all().delete()
-        Lap.objects.all().delete()
-        RaceSession.objects.all().delete()
-        self.stdout.write(self.style.SUCCESS('✓ Veritabanı başarıyla temizlendi.'))
+        session_folders = [d for d in os.listdir(data_dir) if d.startswith('session_')]
+        if options['full']:
+            # --- 1. Veritabanını Temizleme ---
+            self.print_subheader("1. Eski Veritabanı Kayıtları Temizleniyor")
+            TelemetryData.objects.all().delete()
+            Lap.objects.all().delete()
+            RaceSession.objects.all().delete()
+            self.stdout.write(self.style.SUCCESS('✓ Veritabanı başarıyla temizlendi.'))
+            plans = {folder_name: FULL_IMPORT for folder_name in session_folders}
+        else:
+            # --- 1. Değişen Logları Belirleme ---
+            self.print_subheader("1. Seans Logları Önceki Aktarımla Karşılaştırılıyor")
+            plans = self._plan_sessions(data_dir, session_folders)
 
         # --- 2. Seans Dosyalarını İşleme ---
         self.print_subheader("2. Seans Log Dosyaları Okunuyor ve İşleniyor")
-        session_folders = [d for d in os.listdir(data_dir) if d.startswith('session_')]
 
         if not session_folders:
             self.stdout.write(self.style.WARNING("İşlenecek seans dosyası bulunamadı."))
             return
             
         # ID'leri isimlere çevirmek için sözlükler oluşturalım
-        session_type_map = dict(RaceSession.SESSION_TYPE_CHOICES)
-        game_mode_map = dict(RaceSession.GAME_MODE_CHOICES)
+        self.session_type_map = dict(RaceSession.SESSION_TYPE_CHOICES)
+        self.game_mode_map = dict(RaceSession.GAME_MODE_CHOICES)
 
+        if options['workers'] > 1:
+            self._import_parallel(data_dir, session_folders, plans, options['workers'])
+        else:
+            for folder_name, session_uid_str, paths, plan in self._pending(data_dir, session_folders, plans):
+                try:
+                    # Log okunurken işlendiğinden, bozuk bir satırda seansın yarım kalan kayıtları geri alınır.
+                    with transaction.atomic():
+                        if plan == FULL_IMPORT:
+                            self._import_session(session_uid_str, paths)
+                        else:
+                            self._resume_session(session_uid_str, paths, *plan)
+
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"Hata oluştu {session_uid_str} seansı işlenirken: {e}"))
+                    continue 
+        
+        self.print_header("Tüm Seanslar Başarıyla Veritabanına Aktarıldı!")
+
+    def _plan_sessions(self, data_dir, session_folders):
+        """
+        Her seans klasörü için yapılacak işi belirler: None (değişmemiş, atlanır),
+        ``FULL_IMPORT`` ya da kaldığı yerden devam için ``(dosya sırası, bayt, durum)``.
+        Logları silinmiş seanslar veritabanından da silinir.
+        """
+        plans, counts = {}, {'yeni': 0, 'büyüyen': 0, 'değişen': 0, 'değişmemiş': 0}
+        current_uids = set()
         for folder_name in session_folders:
+            paths = self._session_log_paths(os.path.join(data_dir, folder_name))
+            if not paths:
+                continue
             session_uid_str = folder_name.split('_')[1]
-            log_file_path = os.path.join(data_dir, folder_name, "telemetry_log.jsonl")
+            current_uids.add(session_uid_str)
+            plans[folder_name], status = self._plan_session(session_uid_str, paths)
+            counts[status] += 1
+
+        removed_uids = set(
+            ImportManifest.objects.exclude(session_id__in=current_uids).values_list('session_id', flat=True)
+        )
+        if removed_uids:
+            RaceSession.objects.filter(session_uid__in=removed_uids).delete()
+        summary = ', '.join(f"{count} {status}" for status, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"✓ Seanslar: {summary}."))
+        if removed_uids:
+            self.stdout.write(self.style.WARNING(f"  -> ↳ Logları bulunamayan {len(removed_uids)} seans silindi."))
+        return plans
+
+    def _plan_session(self, session_uid_str, paths):
+        """Seansın manifestolarını dosyalarla karşılaştırır; ``(plan, durum)`` döndürür."""
+        manifests = {manifest.path: manifest for manifest in ImportManifest.objects.filter(session_id=session_uid_str)}
+        if not manifests:
+            # Daha önce aktarılmamış (ya da canlı aktarımla yazılmış) seans
+            return FULL_IMPORT, 'yeni'
+        state = next((manifest.state for manifest in manifests.values() if manifest.state is not None), None)
+        if state is None or not state['session_info_found'] or set(manifests) - set(paths):
+            return FULL_IMPORT, 'değişen'
+        if 'summaries' not in state['importer']:
+            # Tur özetlerinden önceki bir sürümün durumu; özetler baştan hesaplansın.
+            return FULL_IMPORT, 'değişen'
 
-            if not os.path.exists(log_file_path):
+        resume_at = None
+        for index, path in enumerate(paths):
+            manifest = manifests.get(path)
+            if manifest is None:
+                # Seansa sonradan eklenen log dosyası baştan okunur.
+                resume_at = resume_at or (index, 0)
                 continue
-            
+            if resume_at is not None:
+                # Paket sırası ancak yalnızca son dosyalar büyüdüyse korunur.
+                return FULL_IMPORT, 'değişen'
+            stat = os.stat(path)
+            if (stat.st_size, stat.st_mtime) == (manifest.size, manifest.mtime):
+                continue
+            if stat.st_size < manifest.offset or _file_hash(path, manifest.offset) != manifest.content_hash:
+                return FULL_IMPORT, 'değişen'
+            if stat.st_size > manifest.offset:
+                resume_at = (index, manifest.offset)
+            else:
+                # Yalnızca değiştirilme zamanı değişmiş; bir dahaki sefere özet yeniden hesaplanmasın.
+                ImportManifest.objects.filter(pk=manifest.pk).update(size=stat.st_size, mtime=stat.st_mtime)
+
+        if resume_at is None:
+            return None, 'değişmemiş'
+        return (*resume_at, state), 'büyüyen'
+
+    def _pending(self, data_dir, session_folders, plans):
+        """İşlenecek seansları ``(klasör, UID, log yolları, plan)`` olarak üretir."""
+        for folder_name in session_folders:
+            session_dir = os.path.join(data_dir, folder_name)
+            paths = self._session_log_paths(session_dir)
+            plan = plans.get(folder_name)
+            if paths and plan is not None:
+                yield folder_name, folder_name.split('_')[1], paths, plan
+
+    def _prepare_import(self, session_uid_str):
+        """Seansı baştan aktarmak için hazırlar ve seans kaydını döndürür."""
+        # Seans önceden aktarılmışsa (ya da canlı aktarımla yazılmışsa) turları ve
+        # noktaları silinir; dinleyicinin yazdığı rig ve yakalama istatistikleri korunur.
+        self._clear_session(session_uid_str)
+        session, _ = RaceSession.objects.get_or_create(session_uid=session_uid_str)
+        return session
+
+    def _apply_session_info(self, session, session_info):
+        """
+        Aktarım sırasında ilk seans paketinden okunan pist, tür ve mod bilgisini
+        seans kaydına yazar; seans paketi yoksa varsayılanlar yazılır. Devam
+        durumunu döndürür.
+        """
+        fields = session_info or {'track_id': -1, 'session_type': 0, 'game_mode': None}
+        for field, value in fields.items():
+            setattr(session, field, value)
+        session.save(update_fields=list(fields))
+        return {'session_info_found': session_info is not None}
+
+    def _clear_session(self, session_uid_str):
+        """Seansın aktarımla yazılan kayıtlarını (noktalar, turlar, manifestolar) siler."""
+        TelemetryData.objects.filter(session_id=session_uid_str).delete()
+        Lap.objects.filter(session_id=session_uid_str).delete()
+        ImportManifest.objects.filter(session_id=session_uid_str).delete()
+
+    def _import_session(self, session_uid_str, paths):
+        session = self._prepare_import(session_uid_str)
+        # Log tek geçişte okunur; her paket tur ve telemetri tüketicilerine verilir.
+        # Oyuncu indeksi ilk paketten, seans bilgisi ilk seans paketinden alınır.
+        importer = SessionImporter(session)
+        read = feed_logs(importer.feed, paths)
+        state = self._apply_session_info(session, importer.reader.session_info)
+        self._print_session(session, "seansı aktarıldı.")
+        state['player_car_index'] = importer.reader.player_car_index
+        if state['player_car_index'] is None:
+            self.stdout.write(self.style.WARNING("  -> ↳ Oyuncu indeksi bulunamadı, bu seans atlanıyor."))
+            return
+        self._finish(importer, paths, read, state)
+
+    def _resume_session(self, session_uid_str, paths, index, offset, state):
+        """Büyüyen log'un yalnızca önceki aktarımdan sonra eklenen kısmını okur."""
+        session = RaceSession.objects.get(session_uid=session_uid_str)
+        self._print_session(session, "seansına yeni veriler ekleniyor...")
+        importer = SessionImporter.resume(session, state['player_car_index'], state['importer'])
+        read = feed_logs(importer.feed, paths, index, offset)
+        self._finish(importer, paths, read, {
+            'player_car_index': state['player_car_index'],
+            'session_info_found': state['session_info_found'],
+        })
+
+    def _finish(self, importer, paths, read, state):
+        state['importer'] = importer.checkpoint()
+        importer.finish()
+        self._save_manifests(importer.session, paths, read, state)
+        self._print_counts(importer.writer)
+
+    def _import_parallel(self, data_dir, session_folders, plans, workers):
+        """
+        Seansları ``workers`` süreçte okur; turlar ve noktalar bu süreçte, geldikleri
+        sırayla yazılır. Seansların mesajları birbirine karıştığından tüm seansı
+        kapsayan bir kayıt noktası (savepoint) açılamaz; her mesaj kendi kayıt
+        noktasında yazılır. Hata veren seans yeni aktarılıyorsa turları ve
+        noktaları silinir ve bir sonraki aktarımda baştan okunur; devam ediyorsa yalnızca bu aktarımda
+        eklenen turlar ve noktalar silinir, manifestolar değişmediğinden bir
+        sonraki aktarım aynı yerden devam eder.
+        """
+        tasks, sessions = [], {}
+        for folder_name, session_uid_str, paths, plan in self._pending(data_dir, session_folders, plans):
             try:
-                # Önce paketleri okuyup temel bilgileri alalım
-                with open(log_file_path, 'r') as f:
-                    packets = [json.loads(line) for line in f]
-                
-                # Geçici olarak session bilgilerini alalım, henüz kaydetmiyoruz
-                temp_session_info = self._get_session_info(packets)
-                
-                # --- KULLANICI DOSTU MESAJ BURADA OLUŞTURULUYOR ---
-                track_name = TRACK_NAMES.get(temp_session_info['track_id'], "Bilinmeyen Pist")
-                game_mode_name = game_mode_map.get(temp_session_info['game_mode'], "Bilinmiyor")
-                session_type_name = session_type_map.get(temp_session_info['session_type'], "Bilinmiyor")
-
-                self.stdout.write("-" * 50)
-                self.stdout.write(f"🏎️  {self.style.WARNING(track_name)} pistindeki {self.style.SUCCESS(game_mode_name)} seansı işleniyor...")
-                self.stdout.write(f"   ({self.style.NOTICE(session_type_name)} - UID: {session_uid_str[:12]}...)")
-                
-                # Şimdi veritabanı işlemlerini yapabiliriz
-                session = RaceSession.objects.create(
-                    session_uid=session_uid_str,
-                    track_id=temp_session_info['track_id'],
-                    session_type=temp_session_info['session_type'],
-                    game_mode=temp_session_info['game_mode']
-                )
-
-                player_car_index = self._get_player_car_index(packets)
-                if player_car_index is None:
-                    self.stdout.write(self.style.WARNING("  -> ↳ Oyuncu indeksi bulunamadı, bu seans atlanıyor."))
-                    continue
-
-                laps_info = self._process_laps(packets, session, player_car_index)
-                self._process_combined_data(packets, session, player_car_index, laps_info)
+                with transaction.atomic():
+                    if plan == FULL_IMPORT:
+                        # Oyuncu indeksi ve seans bilgisi işçinin okuma geçişinden gelir.
+                        session = self._prepare_import(session_uid_str)
+                        writer, start_index, start_offset, reader_state = SessionWriter(session), 0, 0, None
+                        player_car_index, state = None, {}
+                    else:
+                        start_index, start_offset, previous = plan
+                        session = RaceSession.objects.get(session_uid=session_uid_str)
+                        writer, reader_state = SessionWriter.resume(session, previous['importer']), previous['importer']
+                        player_car_index = previous['player_car_index']
+                        state = {'player_car_index': player_car_index, 'session_info_found': previous['session_info_found']}
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"Hata oluştu {session_uid_str} seansı işlenirken: {e}"))
+                continue
+            sessions[session_uid_str] = (writer, paths, state, plan == FULL_IMPORT)
+            tasks.append(ImportTask(
+                session_uid_str, paths, start_index, start_offset, player_car_index, reader_state, writer.lap_records(),
+            ))
 
+        # İşçi no -> [seans, paket, saniye]
+        throughput = {}
+        started = time.perf_counter()
+        for kind, session_uid_str, payload in ImportPool(workers).run(tasks):
+            if session_uid_str not in sessions:
+                # Daha önce hata veren seansın kalan mesajları
+                continue
+            writer, paths, state, fresh = sessions[session_uid_str]
+            try:
+                if kind == 'error':
+                    raise RuntimeError(payload)
+                # Yazım hatası dış işlemi bozmasın; temizlik bu bloğun dışında yapılır.
+                with transaction.atomic():
+                    if kind == 'lap':
+                        lap, points = payload
+                        writer.write_lap(lap)
+                        writer.write_points(points)
+                    else:
+                        if fresh:
+                            state = self._apply_session_info(writer.session, payload['session_info'])
+                            state['player_car_index'] = payload['player_car_index']
+                        if state['player_car_index'] is not None:
+                            state['importer'] = dict(payload['state'], provisional_after=writer.last_point())
+                            writer.write_points(payload['points'])
+                            writer.write_summaries(payload['summaries'])
+                            self._save_manifests(writer.session, paths, payload['read'], state)
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"Hata oluştu {session_uid_str} seansı işlenirken: {e}"))
-                continue 
-        
-        self.print_header("Tüm Seanslar Başarıyla Veritabanına Aktarıldı!")
+                if fresh:
+                    self._clear_session(session_uid_str)
+                else:
+                    writer.rollback()
+                del sessions[session_uid_str]
+                continue
+            if kind == 'lap':
+                continue
+            del sessions[session_uid_str]
+            self._print_session(writer.session, "seansı aktarıldı." if fresh else "seansına yeni veriler eklendi.")
+            if state['player_car_index'] is None:
+                self.stdout.write(self.style.WARNING("  -> ↳ Oyuncu indeksi bulunamadı, bu seans atlanıyor."))
+            else:
+                self._print_counts(writer)
+            totals = throughput.setdefault(payload['worker'], [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += payload['packets']
+            totals[2] += payload['seconds']
+        self._print_throughput(throughput, time.perf_counter() - started)
 
+    def _print_throughput(self, throughput, elapsed):
+        if not throughput:
+            return
+        self.print_subheader("İşçi Başına Okuma Hızı")
+        for worker_id, (sessions, packets, seconds) in sorted(throughput.items()):
+            rate = packets / seconds if seconds else 0
+            self.stdout.write(f"  İşçi {worker_id}: {sessions} seans, {packets:,} paket, {seconds:.1f} s ({rate:,.0f} paket/s)")
+        packets = sum(totals[1] for totals in throughput.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Toplam: {packets:,} paket {elapsed:.1f} s'de aktarıldı ({packets / elapsed if elapsed else 0:,.0f} paket/s)."
+        ))
 
-    def _get_session_info(self, packets):
-        """Paketleri okuyarak pist, tür ve mod ID'lerini döndürür."""
-        info = {'track_id': -1, 'session_type': 0, 'game_mode': None}
-        for p in packets:
-            if p.get('m_header', {}).get('m_packet_id') == 1:
-                info['track_id'] = p.get('m_track_id')
-                info['session_type'] = p.get('m_session_type')
-                info['game_mode'] = p.get('m_game_mode')
-                return info
-        return info
-
-    def _get_player_car_index(self, packets):
-        if packets: return packets[0].get('m_header', {}).get('m_player_car_index')
-        return None
-
-    def _process_laps(self, packets, session, player_car_index):
-        laps_info, recorded_laps, laps_to_create = {}, set(), []
-        for p in packets:
-            h = p.get('m_header', {})
-            if h.get('m_packet_id') == 2:
-                lap_data = p['m_lap_data'][player_car_index]
-                lap_to_record, last_lap_ms, session_time = lap_data.get('m_current_lap_num', 1) - 1, lap_data.get('m_last_lap_time_in_ms', 0), h.get('m_session_time', 0)
-                if lap_to_record > 0 and last_lap_ms > 0 and lap_to_record not in recorded_laps:
-                    start_time = session_time - (last_lap_ms / 1000.0)
-                    laps_info[lap_to_record] = {'start_time': start_time, 'end_time': session_time}
-                    # Lastik bilgisi olmadan Lap nesnesi oluşturuyoruz
-                    laps_to_create.append(Lap(session=session, lap_number=lap_to_record, lap_time_ms=last_lap_ms, start_time=start_time, end_time=session_time))
-                    recorded_laps.add(lap_to_record)
-        if laps_to_create:
-            Lap.objects.bulk_create(laps_to_create)
-            self.stdout.write(f"  -> ↳ {self.style.SUCCESS(f'{len(laps_to_create)} tur verisi')} eklendi.")
-        return laps_info
-
-    def _process_combined_data(self, packets, session, player_car_index, laps_info):
-        """
-        Tüm telemetri ve durum verilerini (ERS ve DRS dahil) birleştirir,
-        TelemetryData nesneleri oluşturur ve Lap nesnelerinin lastik bilgisini günceller.
-        """
-        time_data = defaultdict(dict)
-        for p in packets:
-            h = p.get('m_header', {})
-            t = h.get('m_session_time')
-            if t is None: continue
-            
-            key = round(t * 50) / 50 
-            
-            if h.get('m_packet_id') == 6: # CarTelemetryData
-                tel = p['m_car_telemetry_data'][player_car_index]
-                time_data[key].update({
-                    'speed': tel.get('m_speed'), 
-                    'throttle': tel.get('m_throttle'), 
-                    'brake': tel.get('m_brake'), 
-                    'gear': tel.get('m_gear'), 
-                    'rpm': tel.get('m_engine_rpm'),
-                    'drs': tel.get('m_drs') == 1 # <-- YENİ: DRS verisi (1 ise True, değilse False)
-                })
-            elif h.get('m_packet_id') == 7: # CarStatusData
-                stat = p['m_car_status_data'][player_car_index]
-                time_data[key].update({
-                    'fuel_in_tank': stat.get('m_fuel_in_tank'),
-                    'tyre_compound': stat.get('m_visual_tyre_compound'),
-                    'ers_store_energy': stat.get('m_ers_store_energy'), # <-- YENİ: ERS Batarya
-                    'ers_deploy_mode': stat.get('m_ers_deploy_mode')    # <-- YENİ: ERS Modu
-                })
-
-        # 1. Adım: Tüm TelemetryData nesnelerini oluştur
-        telemetry_to_create = []
-        laps_in_session = {lap.lap_number: lap for lap in Lap.objects.filter(session=session)}
-        sorted_laps = sorted(laps_info.items())
-        
-        # Son bilinen değerleri saklamak için değişkenler
-        last_known_data = {
-            'fuel': None,
-            'compound': None,
-            'ers_store': None,
-            'ers_mode': None
-        }
-
-        for time, data in sorted(time_data.items()):
-            # Mevcut zaman diliminde veri yoksa, son bilinen değeri kullan
-            last_known_data['fuel'] = data.get('fuel_in_tank', last_known_data['fuel'])
-            last_known_data['compound'] = data.get('tyre_compound', last_known_data['compound'])
-            last_known_data['ers_store'] = data.get('ers_store_energy', last_known_data['ers_store'])
-            last_known_data['ers_mode'] = data.get('ers_deploy_mode', last_known_data['ers_mode'])
-
-            # Sadece telemetri verisi (hız, rpm vb.) olan zaman noktalarını kaydet
-            if 'speed' in data or 'rpm' in data:
-                lap_obj, lap_time = None, None
-                for num, times in sorted_laps:
-                    if times['start_time'] <= time < times['end_time']:
-                        lap_obj = laps_in_session.get(num)
-                        lap_time = time - times['start_time']
-                        break
-                
-                td = TelemetryData(
-                    session=session, lap=lap_obj, session_time=time, 
-                    lap_time=lap_time if lap_time is not None else time,
-                    speed=data.get('speed', 0), 
-                    throttle=data.get('throttle', 0.0), 
-                    brake=data.get('brake', 0.0), 
-                    gear=data.get('gear', 0), 
-                    rpm=data.get('rpm', 0), 
-                    fuel_in_tank=last_known_data['fuel'],
-                    # --- YENİ ALANLARI EKLE ---
-                    drs=data.get('drs', False),
-                    ers_store_energy=last_known_data['ers_store'],
-                    ers_deploy_mode=last_known_data['ers_mode']
-                )
-                # Geçici lastik verisini ekle
-                td._tyre_compound = last_known_data['compound'] 
-                telemetry_to_create.append(td)
-        
-        if telemetry_to_create:
-            TelemetryData.objects.bulk_create([td for td in telemetry_to_create], batch_size=500)
-            self.stdout.write(f"  -> ↳ {self.style.SUCCESS(f'{len(telemetry_to_create)} telemetri noktası')} birleştirildi.")
-
-        # 2. Adım: Her bir turun lastik bilgisini güncelle
-        for lap_num, lap_obj in laps_in_session.items():
-            compounds_in_lap = [
-                td._tyre_compound for td in telemetry_to_create 
-                if td.lap and td.lap.lap_number == lap_num and hasattr(td, '_tyre_compound') and td._tyre_compound is not None
-            ]
-            
-            if compounds_in_lap:
-                most_common_compound = max(set(compounds_in_lap), key=compounds_in_lap.count)
-                lap_obj.tyre_compound = most_common_compound
-                lap_obj.save()
\ No newline at end of file
+    def _print_session(self, session, action):
+        # --- KULLANICI DOSTU MESAJ BURADA OLUŞTURULUYOR ---
+        track_name = TRACK_NAMES.get(session.track_id, "Bilinmeyen Pist")
+        game_mode_name = self.game_mode_map.get(session.game_mode, "Bilinmiyor")
+        session_type_name = self.session_type_map.get(session.session_type, "Bilinmiyor")
+
+        self.stdout.write("-" * 50)
+        self.stdout.write(f"🏎️  {self.style.WARNING(track_name)} pistindeki {self.style.SUCCESS(game_mode_name)} {action}")
+        self.stdout.write(f"   ({self.style.NOTICE(session_type_name)} - UID: {session.session_uid[:12]}...)")
+
+    def _print_counts(self, writer):
+        if writer.laps_created:
+            self.stdout.write(f"  -> ↳ {self.style.SUCCESS(f'{writer.laps_created} tur verisi')} eklendi.")
+        if writer.points_created:
+            self.stdout.write(f"  -> ↳ {self.style.SUCCESS(f'{writer.points_created} telemetri noktası')} birleştirildi.")
+
+    def _save_manifests(self, session, paths, read, state):
+        """Okunan dosyaların manifestolarını yazar; devam durumu son dosyada tutulur."""
+        ImportManifest.objects.filter(session=session).update(state=None)
+        for path, stat, offset in read:
+            ImportManifest.objects.update_or_create(path=path, defaults={
+                'session': session, 'size': stat.st_size, 'mtime': stat.st_mtime,
+                'content_hash': _file_hash(path, offset), 'offset': offset,
+                'state': state if path == paths[-1] else None,
+            })
+
+    def _session_log_paths(self, session_dir):
+        """Seans klasöründeki log dosyalarını (önce eski JSONL, sonra ikili kayıt) döndürür."""
+        return session_log_paths(session_dir)
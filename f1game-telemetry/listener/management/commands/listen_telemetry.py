@@ -1,16 +1,31 @@
 # listener/management/commands/listen_telemetry.py
 
-import socket
-import os
-import json
+import asyncio
+import time
 import signal # Sinyal yakalama için bu modülü import ediyoruz
 import sys
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
-from listener.parser24 import PacketHeader, HEADER_FIELD_TO_PACKET_TYPE, PacketSessionData
-from dashboard.models import RaceSession
+from listener.async_listener import AsyncTelemetryListener, CaptureSink, IngestSink, SessionSink
+from listener.capture import CAPTURE_FILENAME, CAPTURE_MAGIC
+from listener.filters import PacketFilter, parse_packet_ids
+from listener.forwarding import Forwarder, parse_target
+from listener.frames import FRAME_MAX_LAG
+from listener.ingest import INGEST_PACKET_IDS, LiveIngestor
+from listener.pipeline import DROP_POLICIES, WORKER_MODES, ListenerPipeline
+from listener.recorder import TelemetryRecorder
+from listener.records import DatagramEncoder
+from listener.reporting import ListenerStats, StatusReporter
+from listener.ring import PacketRing
+from listener.rigs import UNKNOWN_RIG, RigRouter, parse_rig_port, parse_rig_source
+from listener.sequencing import SequenceTracker
+from listener.sessions import SessionRegistry
+from listener.udp import BatchReceiver, effective_rcvbuf, open_udp_socket
+from listener.writers import LogWriterPool
 
 DATA_DIR = 'data'
+JSONL_FILENAME = 'telemetry_log.jsonl'
 
 # Programın durması gerektiğini belirten bir global bayrak (flag)
 shutdown_flag = False
@@ -26,61 +41,402 @@ def signal_handler(sig, frame):
 class Command(BaseCommand):
     help = 'F1 24 UDP telemetri verilerini dinler ve seansları otomatik olarak veritabanına ve dosyalara kaydeder.'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default=getattr(settings, 'TELEMETRY_UDP_HOST', '0.0.0.0'),
+                            help='Dinlenecek adres.')
+        parser.add_argument('--port', type=int, default=getattr(settings, 'TELEMETRY_UDP_PORT', 20777),
+                            help='Dinlenecek UDP portu.')
+        parser.add_argument('--rig', type=parse_rig_port, action='append', default=[],
+                            help='Ayrı portta dinlenecek rig: ETİKET=port ya da ETİKET=host:port '
+                                 '(birden fazla kez verilebilir). Verilirse --port yerine bu portlar dinlenir.')
+        parser.add_argument('--rig-source', type=parse_rig_source, action='append', default=[],
+                            help='Ortak porta gönderen rig\'i kaynak adresinden tanı: ETİKET=IP '
+                                 '(birden fazla kez verilebilir).')
+        parser.add_argument('--rcvbuf', type=int, default=getattr(settings, 'TELEMETRY_UDP_RCVBUF', None),
+                            help='Soket alma tamponu boyutu (SO_RCVBUF, bayt).')
+        parser.add_argument('--batch-size', type=int, default=getattr(settings, 'TELEMETRY_RECV_BATCH', 64),
+                            help='Her uyanışta soketten okunacak en fazla datagram sayısı.')
+        parser.add_argument('--forward', type=parse_target, action='append', default=[],
+                            help='Datagramları olduğu gibi bu hedefe de ilet: host:port ya da host:port=2,6,7 '
+                                 '(birden fazla kez verilebilir).')
+        parser.add_argument('--format', choices=['binary', 'jsonl'], default='binary',
+                            help='Kayıt biçimi: ham datagramlar (binary) ya da çözülmüş JSON satırları (jsonl).')
+        parser.add_argument('--only', type=parse_packet_ids,
+                            help='Yalnızca bu paket ID\'lerini kaydet (ör. 1,2,6,7). 1 ve 2 kaydedilmezse '
+                                 'log\'lar import_sessions ile aktarılamaz.')
+        parser.add_argument('--skip', type=parse_packet_ids,
+                            help='Bu paket ID\'lerini kaydetme (ör. 5,9,12,14).')
+        parser.add_argument('--player-only', action='store_true',
+                            help='22 araçlık dizilerde yalnızca oyuncu aracını kaydet.')
+        parser.add_argument('--max-open-files', type=int, default=8,
+                            help='Aynı anda açık tutulacak en fazla seans dosyası sayısı.')
+        parser.add_argument('--buffer-size', type=int, default=64 * 1024,
+                            help='Seans başına yazma tamponu boyutu (bayt).')
+        parser.add_argument('--flush-interval', type=float, default=1.0,
+                            help='Tamponların en geç kaç saniyede bir diske yazılacağı.')
+        parser.add_argument('--idle-timeout', type=float, default=30.0,
+                            help='Bu kadar saniye paket gelmeyen seansın dosyası kapatılır.')
+        parser.add_argument('--ingest', action='store_true',
+                            help='Biten turları ve telemetrilerini seans sürerken veritabanına aktarır.')
+        parser.add_argument('--frame-lag', type=int, default=FRAME_MAX_LAG,
+                            help='Canlı aktarımda eksik bir çerçevenin en fazla kaç kare bekletileceği.')
+        parser.add_argument('--async', action='store_true',
+                            help='asyncio tabanlı dinleyiciyi kullanır; kayıt ve veritabanı sink\'leri bağımsız çalışır.')
+        parser.add_argument('--pipeline', choices=WORKER_MODES,
+                            help='Alma ve çözmeyi ayırır; çözme işçileri thread ya da süreç olarak çalışır.')
+        parser.add_argument('--workers', type=int, default=2,
+                            help='Hat modunda çözme işçisi sayısı.')
+        parser.add_argument('--queue-size', type=int, default=4096,
+                            help='Hat modunda aşama kuyruklarının kapasitesi (paket).')
+        parser.add_argument('--drop-policy', choices=DROP_POLICIES, default='drop-oldest',
+                            help='Çözme kuyruğu dolduğunda uygulanacak politika.')
+        parser.add_argument('--status-interval', type=float, default=2.0,
+                            help='Durum satırının kaç saniyede bir yazılacağı (0: kapalı). '
+                                 'Paket başına satırlar için -v 2 kullanın.')
+        parser.add_argument('--status-file',
+                            help='Her durum satırında sayaçların JSON olarak yazılacağı dosya.')
+
     def handle(self, *args, **options):
         # Program başlarken, Ctrl+C sinyali için kendi fonksiyonumuzu kaydediyoruz.
         signal.signal(signal.SIGINT, signal_handler)
 
-        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
-        udp_socket.bind(('', 20777))
-        udp_socket.settimeout(1.0)
+        # İkili biçimde paketler çözülmeden, olduğu gibi kaydedilir.
+        binary_capture = options['format'] == 'binary'
+        writer_pool = LogWriterPool(
+            DATA_DIR, CAPTURE_FILENAME if binary_capture else JSONL_FILENAME,
+            file_header=CAPTURE_MAGIC if binary_capture else b'',
+            max_open=options['max_open_files'],
+            buffer_size=options['buffer_size'],
+            flush_interval=options['flush_interval'],
+            idle_timeout=options['idle_timeout'],
+        )
+        # Seanslar her pakette veritabanından değil, bu kayıt defterinden çözülür.
+        session_registry = SessionRegistry()
+        # Çerçeve kimliklerinden seans/paket türü başına kayıp ve jitter takibi.
+        sequence_tracker = SequenceTracker()
 
-        self.stdout.write(self.style.SUCCESS('UDP Dinleyici başlatıldı. Port 20777 dinleniyor...'))
-        self.stdout.write(self.style.NOTICE('Durdurmak için CTRL+C\'ye basın.'))
+        packet_filter = PacketFilter(options['only'], options['skip'], options['player_only'])
+        import_gaps = packet_filter.import_gaps()
+        if import_gaps:
+            skipped = ', '.join(f"{packet_id} ({name})" for packet_id, name in import_gaps.items())
+            self.stdout.write(self.style.WARNING(
+                f"Uyarı: {skipped} paketleri kaydedilmeyecek; bu log'lar import_sessions ile aktarılamaz. "
+                "Seans kaydı ve pist bilgisi yine de tutulur."
+            ))
+        # Canlı aktarımda tur ve telemetri hesapları ana döngüde yapılır (veritabanı tek noktadan yazılır).
+        ingestor = LiveIngestor(session_registry, log=self._log, max_lag=options['frame_lag']) if options['ingest'] else None
+        encoder = DatagramEncoder(
+            binary=binary_capture, packet_filter=packet_filter,
+            forward_ids=INGEST_PACKET_IDS if ingestor is not None else None,
+        )
+
+        # Birden fazla rig aynı süreçte dinlenir; yazıcı havuzu ve veritabanı yazıcısı ortaktır.
+        listen_addresses, rig_router = self._build_rigs(options)
+        forwarder = self._build_forwarder(options, listen_addresses)
+
+        udp_sockets = [
+            (open_udp_socket(host, port, options['rcvbuf']), rig) for host, port, rig in listen_addresses
+        ]
+        self.udp_addresses = [(sock.getsockname(), rig) for sock, rig in udp_sockets]
+        self.stdout.write(self.style.NOTICE(f"Soket alma tamponu: {effective_rcvbuf(udp_sockets[0][0])} bayt."))
+
+        # Konsola paket başına değil, belirli aralıklarla tek bir durum satırı yazılır.
+        listener_stats = ListenerStats()
+        listener_stats.add_gauge('active_sessions', lambda: len(writer_pool.open_sessions), 'aktif seans')
+        listener_stats.add_gauge('lost', lambda: sequence_tracker.lost, 'kayıp')
+        if forwarder is not None:
+            listener_stats.add_gauge('forwarded', forwarder.sent, 'iletilen')
+        if rig_router is not None:
+            listener_stats.add_gauge('rigs', rig_router.packets, 'rig')
+        reporter = StatusReporter(
+            listener_stats, self._log, options['status_interval'], status_file=options['status_file'],
+        )
+        verbose = options['verbosity'] >= 2
+
+        if options['async']:
+            self._run_async(udp_sockets, encoder, writer_pool, session_registry, sequence_tracker,
+                            listener_stats, reporter, verbose, ingestor, forwarder, rig_router)
+            self._print_writer_stats(writer_pool.stats)
+            self._print_session_stats(session_registry.stats())
+            self._print_sequence_stats(sequence_tracker.totals())
+            self._print_filter_stats(packet_filter, options)
+            self._print_ingest_stats(ingestor)
+            self._print_forward_stats(forwarder)
+            self._print_rig_stats(rig_router, session_registry, sequence_tracker)
+            if forwarder is not None:
+                forwarder.close()
+            return
+
+        recorder = TelemetryRecorder(
+            writer_pool, session_registry, sequence_tracker, log=self._log,
+            listener_stats=listener_stats, reporter=reporter, verbose=verbose, ingestor=ingestor,
+        )
+
+        self._print_started()
 
+        # Datagramlar önceden ayrılmış halka slotlarına okunur ve kopyalanmadan çözülür.
+        receiver = BatchReceiver(
+            udp_sockets, options['batch_size'], router=rig_router, ring=self._build_ring(options),
+        )
+        if options['pipeline']:
+            self._run_pipeline(receiver, encoder, recorder, listener_stats, forwarder, options)
+        else:
+            self._run_serial(receiver, encoder, recorder, forwarder)
+        
+        # Döngü bittikten sonra (shutdown_flag True olduğunda) soketleri kapat.
+        for udp_socket, _ in udp_sockets:
+            udp_socket.close()
+        if forwarder is not None:
+            forwarder.close()
+        self.stdout.write(self.style.SUCCESS('Soket başarıyla kapatıldı.'))
+
+        recorder.close()
+        self._print_writer_stats(writer_pool.stats)
+        if options['pipeline'] != 'processes':
+            # Süreç işçilerinde sayaçlar işçide kalır.
+            self._print_schema_stats(encoder.stats())
+        self._print_session_stats(session_registry.stats())
+        self._print_sequence_stats(sequence_tracker.totals())
+        self._print_filter_stats(packet_filter, options)
+        self._print_ingest_stats(ingestor)
+        self._print_forward_stats(forwarder)
+        self._print_rig_stats(rig_router, session_registry, sequence_tracker)
+
+    def _build_ring(self, options):
+        """
+        Seri modda ve süreç işçilerinde slotlar aynı döngüde bırakıldığından bir
+        alma partisi yeterlidir. Thread işçilerinde slotlar çözme kuyruğunda
+        bekler; halka kuyruk, işçiler ve bir parti kadar slot taşır.
+        """
+        slots = options['batch_size']
+        if options['pipeline'] == 'threads':
+            slots += options['queue_size'] + options['workers']
+        return PacketRing(slots)
+
+    def _build_rigs(self, options):
+        """
+        Dinlenecek ``(host, port, rig etiketi)`` listesini ve rig tanımlıysa
+        ``RigRouter``'ı döndürür. Rig yoksa yalnızca --host/--port dinlenir.
+        """
+        rigs = [parse_rig_port(value) for value in getattr(settings, 'TELEMETRY_RIGS', [])] + options['rig']
+        sources = [parse_rig_source(value) for value in getattr(settings, 'TELEMETRY_RIG_SOURCES', [])]
+        sources += options['rig_source']
+
+        addresses = [(host or options['host'], port, label) for label, host, port in rigs]
+        if not addresses:
+            addresses = [(options['host'], options['port'], None)]
+        ports = [port for _, port, _ in addresses]
+        if len(set(ports)) != len(ports):
+            raise CommandError("Aynı port birden fazla rig için verilemez; ortak portta --rig-source kullanın.")
+        labels = [label for _, _, label in addresses if label is not None]
+        if len(set(labels)) != len(labels):
+            raise CommandError("Rig etiketleri benzersiz olmalıdır.")
+        if not rigs and not sources:
+            return addresses, None
+        return addresses, RigRouter(sources, labels)
+
+    def _build_forwarder(self, options, listen_addresses):
+        targets = [parse_target(value) for value in getattr(settings, 'TELEMETRY_FORWARD_TARGETS', [])]
+        targets += options['forward']
+        if not targets:
+            return None
+        local_hosts = {'0.0.0.0', '127.0.0.1', 'localhost'} | {host for host, _, _ in listen_addresses}
+        listen_ports = {port for _, port, _ in listen_addresses}
+        for host, port, _ in targets:
+            # Kendi portumuza iletmek paketleri sonsuz döngüye sokar.
+            if port in listen_ports and host in local_hosts:
+                raise CommandError(f"İletim hedefi dinleyicinin kendi adresi olamaz: {host}:{port}")
+        forwarder = Forwarder(targets)
+        self.stdout.write(self.style.NOTICE(
+            "İletim hedefleri: " + ", ".join(target.name for target in forwarder.targets) + "."
+        ))
+        return forwarder
+
+    def _run_serial(self, receiver, encoder, recorder, forwarder=None):
+        """Alma, çözme ve yazmanın aynı döngüde yapıldığı varsayılan mod."""
         # Ana döngü artık "shutdown_flag" false olduğu sürece çalışacak.
         while not shutdown_flag:
             try:
-                packet_data, addr = udp_socket.recvfrom(2048)
-                
-                header = PacketHeader.from_buffer_copy(packet_data)
-                packet_id = header.m_packet_id
-
-                if packet_id in HEADER_FIELD_TO_PACKET_TYPE:
-                    packet = HEADER_FIELD_TO_PACKET_TYPE[packet_id].from_buffer_copy(packet_data)
-                    session_uid = header.m_session_uid
-
-                    if session_uid == 0:
-                        continue 
-
-                    session_obj, created = RaceSession.objects.get_or_create(session_uid=str(session_uid))
-
-                    if created:
-                        self.stdout.write(self.style.SUCCESS(f"Yeni seans (ID: {session_uid}) veritabanına kaydedildi!"))
-                    
-                    if isinstance(packet, PacketSessionData) and session_obj.track_id is None:
-                        session_obj.track_id = packet.m_track_id
-                        session_obj.save()
-                        self.stdout.write(self.style.SUCCESS(f"Seans (ID: {session_uid}) için pist ID ({packet.m_track_id}) güncellendi."))
-
-                    session_dir = os.path.join(DATA_DIR, f"session_{session_uid}")
-                    os.makedirs(session_dir, exist_ok=True)
-                    log_file_path = os.path.join(session_dir, "telemetry_log.jsonl")
-                    
-                    with open(log_file_path, "a") as log_file:
-                        packet_dict = packet.to_dict()
-                        log_file.write(json.dumps(packet_dict) + "\n")
-                    
-                    self.stdout.write(f'Paket {packet.__class__.__name__} -> {log_file_path} dosyasına kaydedildi.')
-            
-            except socket.timeout:
-                # Zaman aşımı olduğunda hiçbir şey yapma, döngü devam etsin.
-                # Bu sayede "shutdown_flag" kontrol edilebilir.
-                continue
+                # Her uyanışta soketteki tüm hazır paketler tek seferde okunur.
+                # En fazla 1 saniye beklenir; bu sayede "shutdown_flag" kontrol edilebilir.
+                batch = receiver.receive(timeout=1.0)
+                received_at = time.time()
+                for slot, rig in batch:
+                    if forwarder is not None:
+                        forwarder.forward(slot.data)
+                    encoded = encoder(slot, received_at, rig)
+                    # Kodlanan kayıt slota referans tutmaz; slot hemen geri verilir.
+                    slot.release()
+                    if encoded is not None:
+                        recorder.commit(encoded)
+                recorder.tick()
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f'Döngü içinde bir hata oluştu: {e}'))
                 # Ciddi bir hata varsa döngüyü kır.
                 break
-        
-        # Döngü bittikten sonra (shutdown_flag True olduğunda) soketi kapat.
-        udp_socket.close()
-        self.stdout.write(self.style.SUCCESS('Soket başarıyla kapatıldı.'))
\ No newline at end of file
+
+    def _run_pipeline(self, receiver, encoder, recorder, listener_stats, forwarder, options):
+        """Alıcı thread, çözme işçileri ve tek yazıcıdan oluşan hat modu."""
+        pipeline = ListenerPipeline(
+            receiver, encoder, recorder,
+            workers=options['workers'],
+            mode=options['pipeline'],
+            queue_size=options['queue_size'],
+            drop_policy=options['drop_policy'],
+            forwarder=forwarder,
+            log=self._log,
+        )
+        listener_stats.add_gauge('dropped', lambda: pipeline.dropped, 'düşürülen')
+        self.stdout.write(self.style.NOTICE(
+            f"Hat modu: {options['workers']} işçi ({options['pipeline']}), "
+            f"kuyruk {options['queue_size']}, politika {options['drop_policy']}."
+        ))
+        try:
+            pipeline.run(lambda: shutdown_flag)
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'Hat içinde bir hata oluştu: {e}'))
+        self._print_pipeline_stats(pipeline.metrics())
+
+    def _run_async(self, udp_sockets, encoder, writer_pool, session_registry, sequence_tracker,
+                   listener_stats, reporter, verbose, ingestor, forwarder, rig_router):
+        """
+        asyncio modu: rig başına bir uç nokta, paket ID'lerine göre kayıtlı bağımsız sink'ler.
+        Kapanış sinyali doğrudan olay döngüsüne bağlı olduğundan zaman aşımı beklenmez.
+        """
+        sinks = [
+            CaptureSink(encoder, writer_pool, listener_stats=listener_stats, log=self._log, verbose=verbose,
+                        session_registry=session_registry),
+            SessionSink(session_registry, sequence_tracker, log=self._log),
+        ]
+        if ingestor is not None:
+            sinks.append(IngestSink(ingestor, log=self._log))
+        listener = AsyncTelemetryListener(sinks, udp_socket=udp_sockets, forwarder=forwarder, router=rig_router)
+        listener_stats.add_gauge('dropped', lambda: sum(sink.dropped for sink in listener.sinks), 'düşürülen')
+        try:
+            asyncio.run(listener.run(
+                on_ready=self._print_started,
+                on_interrupt=lambda: signal_handler(signal.SIGINT, None),
+                on_tick=reporter.maybe_report,
+            ))
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'Asenkron dinleyicide bir hata oluştu: {e}'))
+        finally:
+            # Sink'ler başlamadan çıkılsa da tamponlardaki kayıtlar diske yazılır.
+            writer_pool.close_all()
+        self.stdout.write(self.style.SUCCESS('Soket başarıyla kapatıldı.'))
+        self._print_async_stats(listener.stats())
+
+    def _print_started(self):
+        addresses = ", ".join(
+            f"{host}:{port}" + (f" ({rig})" if rig else "") for (host, port), rig in self.udp_addresses
+        )
+        self.stdout.write(self.style.SUCCESS(f'UDP Dinleyici başlatıldı. {addresses} dinleniyor...'))
+        self.stdout.write(self.style.NOTICE('Durdurmak için CTRL+C\'ye basın.'))
+
+    def _log(self, message, style=None):
+        self.stdout.write(getattr(self.style, style)(message) if style else message)
+
+    def _print_writer_stats(self, stats):
+        self.stdout.write(
+            f"Yazılan: {stats.packets_written} paket, {stats.bytes_written} bayt, "
+            f"{stats.flushes} boşaltma (ort. {stats.flush_seconds_avg * 1000:.2f} ms, "
+            f"en fazla {stats.flush_seconds_max * 1000:.2f} ms)."
+        )
+
+    def _print_schema_stats(self, stats):
+        if stats['unknown_schema'] or stats['malformed']:
+            self.stdout.write(self.style.WARNING(
+                f"Şema: {stats['unknown_schema']} datagram bilinmeyen oyun yılı/paket sürümü, "
+                f"{stats['malformed']} datagram beklenmeyen boyut nedeniyle çözülmedi."
+            ))
+
+    def _print_session_stats(self, stats):
+        self.stdout.write(
+            f"Seans önbelleği: {stats['sessions']} seans, {stats['hits']} isabet, "
+            f"{stats['misses']} ıskalama, {stats['db_writes']} veritabanı yazımı."
+        )
+
+    def _print_sequence_stats(self, totals):
+        self.stdout.write(
+            f"Sıra takibi: {totals['received']} paket, {totals['lost']} kayıp "
+            f"(%{totals['loss_ratio'] * 100:.2f}), {totals['out_of_order']} sıra dışı."
+        )
+
+    def _print_filter_stats(self, packet_filter, options):
+        if not packet_filter.active:
+            return
+        if options['pipeline'] == 'processes':
+            # Süreç modunda filtre sayaçları işçi süreçlerinde kalır.
+            self.stdout.write("Filtre: sayaçlar işçi süreçlerinde tutulduğu için gösterilemiyor.")
+            return
+        stats = packet_filter.stats()
+        self.stdout.write(
+            f"Filtre: {stats['skipped_packets']} paket atlandı ({stats['skipped_bytes']} bayt), "
+            f"{stats['trimmed_packets']} paket oyuncu aracına indirildi ({stats['trimmed_bytes']} bayt), "
+            f"tahmini CPU tasarrufu {stats['cpu_saved_ms']:.1f} ms."
+        )
+
+    def _print_ingest_stats(self, ingestor):
+        if ingestor is None:
+            return
+        stats = ingestor.stats()
+        frames = stats['frames']
+        self.stdout.write(
+            f"Canlı aktarım: {stats['laps_written']} tur, {stats['points_written']} telemetri noktası "
+            f"({stats['sessions']} seans, {stats['flushes']} toplu yazım). "
+            f"Çerçeveler: {frames['frames_complete']} tam, {frames['frames_incomplete']} eksik, "
+            f"{frames['late_packets']} geç paket."
+        )
+
+    def _print_forward_stats(self, forwarder):
+        if forwarder is None:
+            return
+        for name, stats in forwarder.stats().items():
+            line = (
+                f"İletim {name}: {stats['sent']} gönderildi ({stats['bytes_sent']} bayt), "
+                f"{stats['filtered']} filtrelendi, {stats['would_block']} tampon dolu, {stats['errors']} hata"
+            )
+            self.stdout.write(f"{line} (son hata: {stats['last_error']})." if stats['last_error'] else f"{line}.")
+
+    def _print_rig_stats(self, rig_router, session_registry, sequence_tracker):
+        if rig_router is None:
+            return
+        sessions = session_registry.sessions_by_rig()
+        lost = {}
+        for session_uid in sequence_tracker.sessions():
+            rig = session_registry.rig_of(session_uid)
+            lost[rig] = lost.get(rig, 0) + sequence_tracker.summary(session_uid)['lost']
+        for label, stats in rig_router.stats().items():
+            rig = None if label == UNKNOWN_RIG else label
+            self.stdout.write(
+                f"Rig {label}: {stats['packets']} paket, {stats['bytes']} bayt, "
+                f"{sessions.get(rig, 0)} seans, {lost.get(rig, 0)} kayıp."
+            )
+
+    def _print_pipeline_stats(self, metrics):
+        decode_queue, write_queue = metrics['decode_queue'], metrics['write_queue']
+        self.stdout.write(
+            f"Hat: {metrics['received']} alındı, {metrics['dropped']} düşürüldü, "
+            f"{metrics['committed']} yazıldı, {metrics['decode_errors']} çözme hatası, "
+            f"{metrics['backpressure_waits']} geri basınç beklemesi. "
+            f"Kuyruk doluluğu (en fazla): çözme {decode_queue['max_depth']}/{decode_queue['capacity']}, "
+            f"yazma {write_queue['max_depth']}/{write_queue['capacity']}, "
+            f"sıralama tamponu {metrics['reorder_max']}."
+        )
+        ring = metrics['ring']
+        if ring is not None:
+            self.stdout.write(
+                f"Halka tampon: en fazla {ring['max_in_use']}/{ring['capacity']} slot kullanımda, "
+                f"{ring['exhausted']} kez boş slot bulunamadı."
+            )
+
+    def _print_async_stats(self, stats):
+        sinks = ", ".join(
+            f"{name}: {sink['consumed']} işlendi / {sink['dropped']} düşürüldü"
+            + (f" / {sink['errors']} hata" if sink['errors'] else "")
+            for name, sink in stats['sinks'].items()
+        )
+        self.stdout.write(
+            f"Asenkron dinleyici: {stats['received']} alındı, {stats['unroutable']} yönlendirilemedi, "
+            f"{stats['malformed']} hatalı boyutta. {sinks}."
+        )
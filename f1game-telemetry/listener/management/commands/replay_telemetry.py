@@ -0,0 +1,98 @@
+# listener/management/commands/replay_telemetry.py
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from listener.filters import parse_packet_ids
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE
+from listener.replay import Replayer, iter_datagrams, iter_session_packets
+from listener.session_files import find_session_dir, rig_stream_dir, session_dirs, session_log_paths, session_rigs
+
+
+class Command(BaseCommand):
+    help = 'data/ altındaki kayıtlı bir seansı UDP üzerinden yeniden oynatır (dinleyici yük testi için).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('session', nargs='?',
+                            help='Seans UID\'si (ya da başı) veya klasör adı. Boş bırakılırsa seanslar listelenir.')
+        parser.add_argument('--data-dir', default='data', help='Seans klasörlerinin bulunduğu dizin.')
+        parser.add_argument('--rig',
+                            help='Seansla aynı UID\'yi bildiren ikinci rig\'in ayrı kaydedilen akışını '
+                                 '(rig_<etiket>/ klasörü) oynatır.')
+        parser.add_argument('--host', default='127.0.0.1', help='Hedef adres.')
+        parser.add_argument('--port', type=int, default=getattr(settings, 'TELEMETRY_UDP_PORT', 20777),
+                            help='Hedef UDP portu.')
+        parser.add_argument('--speed', type=float, default=1.0,
+                            help='Oynatma hızı: 1 gerçek zamanlı, 4 dört kat hızlı.')
+        parser.add_argument('--max-rate', action='store_true',
+                            help='Zamanlamayı yok sayıp olabildiğince hızlı gönderir.')
+        parser.add_argument('--repeat', type=int, default=1, help='Seansın kaç kez art arda oynatılacağı.')
+        parser.add_argument('--only', type=parse_packet_ids, help='Yalnızca bu paket ID\'lerini gönder (ör. 2,6,7).')
+        parser.add_argument('--skip', type=parse_packet_ids, help='Bu paket ID\'lerini gönderme.')
+        parser.add_argument('--preload', action='store_true',
+                            help='Datagramları göndermeden önce belleğe hazırlar; tam hız ölçümünde okuma maliyeti dışarıda kalır.')
+
+    def handle(self, *args, **options):
+        data_dir = options['data_dir']
+        if not options['session']:
+            self._list_sessions(data_dir)
+            return
+
+        session_dir = find_session_dir(data_dir, options['session'])
+        if session_dir is None or not session_log_paths(session_dir):
+            raise CommandError(f"'{options['session']}' için tek bir kayıtlı seans bulunamadı ({data_dir}/).")
+        if options['rig']:
+            rig_dir = rig_stream_dir(session_dir, options['rig'])
+            if not session_log_paths(rig_dir):
+                rigs = ', '.join(session_rigs(session_dir)) or '-'
+                raise CommandError(f"{os.path.basename(session_dir)} içinde '{options['rig']}' rig akışı yok "
+                                   f"(kayıtlı rig akışları: {rigs}).")
+            session_dir = rig_dir
+
+        packet_ids = set(options['only'] or HEADER_FIELD_TO_PACKET_TYPE) - set(options['skip'] or ())
+        speed = None if options['max_rate'] else options['speed']
+
+        def datagrams():
+            for _ in range(max(1, options['repeat'])):
+                yield from iter_datagrams(iter_session_packets(session_dir, packet_ids))
+
+        source = datagrams()
+        if options['preload']:
+            source = list(source)
+            self.stdout.write(self.style.NOTICE(f"{len(source)} datagram belleğe hazırlandı."))
+
+        replayer = Replayer(options['host'], options['port'], speed=speed)
+        mode = 'tam hız' if speed is None else f'{speed:g}x'
+        name = os.path.relpath(session_dir, data_dir)
+        self.stdout.write(self.style.SUCCESS(
+            f"{name} -> {options['host']}:{options['port']} oynatılıyor ({mode})..."
+        ))
+        try:
+            stats = replayer.run(source)
+        except KeyboardInterrupt:
+            stats = replayer.stats
+            self.stdout.write(self.style.WARNING('\nOynatma durduruldu.'))
+
+        result = stats.as_dict()
+        self.stdout.write(
+            f"Gönderilen: {result['sent']} paket, {result['bytes_sent']} bayt, {result['errors']} hata. "
+            f"Süre: {result['elapsed']} s (seans zamanı {result['session_seconds']} s), "
+            f"{result['packets_per_second']} paket/s, {result['megabytes_per_second']} MB/s, "
+            f"en fazla gecikme {result['max_behind_ms']} ms."
+        )
+
+    def _list_sessions(self, data_dir):
+        paths = session_dirs(data_dir)
+        if not paths:
+            self.stdout.write(self.style.WARNING(f"'{data_dir}' altında kayıtlı seans bulunamadı."))
+            return
+        for path in paths:
+            logs = session_log_paths(path)
+            size = sum(os.path.getsize(log) for log in logs)
+            names = ', '.join(os.path.basename(log) for log in logs) or '-'
+            self.stdout.write(f"{self.style.SUCCESS(os.path.basename(path))}  {size / 1024:.0f} KB  ({names})")
+            for rig in session_rigs(path):
+                size = sum(os.path.getsize(log) for log in session_log_paths(rig_stream_dir(path, rig)))
+                self.stdout.write(f"  ↳ rig akışı: {rig}  {size / 1024:.0f} KB  (--rig {rig})")
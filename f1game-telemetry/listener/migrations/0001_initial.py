@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-18 16:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('dashboard', '0009_racesession_rig'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportManifest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500, unique=True)),
+                ('size', models.BigIntegerField()),
+                ('mtime', models.FloatField()),
+                ('content_hash', models.CharField(max_length=40)),
+                ('offset', models.BigIntegerField()),
+                ('state', models.JSONField(blank=True, null=True)),
+                ('imported_at', models.DateTimeField(auto_now=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_manifests', to='dashboard.racesession')),
+            ],
+            options={
+                'verbose_name': 'Aktarım Manifestosu',
+                'verbose_name_plural': 'Aktarım Manifestoları',
+            },
+        ),
+    ]
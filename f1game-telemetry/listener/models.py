@@ -1,3 +1,41 @@
 from django.db import models
 
-# Create your models here.
+from dashboard.models import RaceSession
+
+
+class ImportManifest(models.Model):
+    """
+    ``import_sessions`` ile aktarılmış bir seans log dosyasının durumu. Sonraki
+    çalıştırmada değişmeyen dosyalar atlanır, büyüyen dosyalar kaldığı bayttan
+    okunur, değişen dosyaların seansı yeniden aktarılır.
+    """
+
+    # Log dosyasının ait olduğu seans; seans silinince manifest de silinir.
+    session = models.ForeignKey(RaceSession, on_delete=models.CASCADE, related_name='import_manifests')
+
+    # Dosyanın proje klasörüne göre yolu (ör. data/session_123/telemetry_log.jsonl)
+    path = models.CharField(max_length=500, unique=True)
+
+    # Okumaya başlamadan önceki boyut ve değiştirilme zamanı; ikisi de aynıysa dosya okunmaz.
+    size = models.BigIntegerField()
+    mtime = models.FloatField()
+
+    # Dosyanın okunan kısmının (offset'e kadar) başındaki ve sonundaki pencerelerin SHA-1
+    # özeti. Boyut değiştiğinde dosyanın yalnızca sonuna ekleme yapıldığı bu özetle doğrulanır.
+    content_hash = models.CharField(max_length=40)
+
+    # Okunan son tam satırın/kaydın bittiği bayt; sonraki aktarım buradan devam eder.
+    offset = models.BigIntegerField()
+
+    # Aktarıcının kaldığı yerden devam etmesi için durumu (SessionImporter.checkpoint).
+    # Yalnızca seansın son okunan log dosyasında tutulur.
+    state = models.JSONField(null=True, blank=True)
+
+    imported_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Aktarım Manifestosu"
+        verbose_name_plural = "Aktarım Manifestoları"
+
+    def __str__(self):
+        return f"{self.path} ({self.offset} bayt)"
@@ -1,12 +1,20 @@
 import ctypes
 import socket
 import pprint
+import struct
 
 pp = pprint.PrettyPrinter()
 
 class PacketMixin(object):
     """A base set of helper methods for ctypes based packets"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every class gets its own lazily generated serializer; without this a
+        # subclass would inherit the one generated for its parent's fields.
+        if "to_dict" not in cls.__dict__:
+            cls.to_dict = PacketMixin.to_dict
+
     def get_value(self, field):
         """Returns the field's value and formats the types value"""
         return self._format_type(getattr(self, field))
@@ -36,14 +44,115 @@ class PacketMixin(object):
         """
         return cls.from_buffer_copy(buffer)
 
+    @classmethod
+    def view(cls, buffer, offset=0):
+        """Overlays the structure on ``buffer`` without copying
+
+        Args:
+            buffer (bytearray, memoryview):
+                - A writable buffer at least ``size()`` bytes long
+
+        The result reads the buffer's memory directly, so it only holds the
+        packet for as long as the buffer does. Keep a copy (``unpack``) if
+        the buffer is going to be reused.
+        """
+        return cls.from_buffer(buffer, offset)
+
+    @classmethod
+    def lazy(cls, buffer, offset=0):
+        """Returns a ``PacketView`` that decodes fields from ``buffer`` on demand
+
+        Args:
+            buffer (bytes, bytearray, memoryview):
+                - The encoded packet, at least ``size()`` bytes from ``offset``
+
+        Unlike ``view`` the buffer may be read-only. Only the fields that
+        are read get unpacked; see ``PacketView``.
+        """
+        return PacketView(cls, buffer, offset)
+
+    @classmethod
+    def car_array_field(cls):
+        """Name of the per-car array field (``CarTelemetryData * 22`` etc.), or ``None``"""
+        layout = _car_array(cls)
+        return layout[0] if layout is not None else None
+
     def to_dict(self):
-        """Returns a ``dict`` with key-values derived from _fields_"""
-        return {k: self.get_value(k) for k, _ in self._fields_}
+        """Returns a ``dict`` with key-values derived from _fields_
+
+        The output is the same as formatting every field with ``get_value``,
+        but the work is done by a function generated once per class from
+        ``_fields_`` (see ``_build_serializer``). The first call installs it
+        as the class's ``to_dict``; overrides reach it through ``super()``.
+        """
+        cls = type(self)
+        serializer = _SERIALIZERS.get(cls)
+        if serializer is None:
+            serializer = _SERIALIZERS[cls] = _build_serializer(cls)
+            if cls.__dict__.get("to_dict") is PacketMixin.to_dict:
+                cls.to_dict = serializer
+        return serializer(self)
+
+    @classmethod
+    def numpy_dtype(cls):
+        """Returns a NumPy structured dtype with the same memory layout
+
+        Offsets and the item size are taken from ctypes, so ``_pack_ = 1``
+        and the little-endian byte order carry over and ``np.frombuffer``
+        can read packets straight from received or recorded bytes. Union
+        members share offset 0 as they do in ctypes. NumPy is only
+        imported when this is first called.
+        """
+        dtype = _DTYPES.get(cls)
+        if dtype is None:
+            import numpy as np
+
+            dtype = _DTYPES[cls] = np.dtype({
+                "names": [name for name, _ in cls._fields_],
+                "formats": [_numpy_format(field_type) for _, field_type in cls._fields_],
+                "offsets": [getattr(cls, name).offset for name, _ in cls._fields_],
+                "itemsize": ctypes.sizeof(cls),
+            })
+        return dtype
 
     def to_json(self):
         """Returns a ``str`` of sorted JSON derived from _fields_"""
         return str(self.to_dict())
 
+    @classmethod
+    def from_dict(cls, values):
+        """Builds the structure back from the output of ``to_dict``
+
+        Args:
+            values (dict):
+                - Field values as produced by ``to_dict``. Missing fields and
+                  ``None`` array entries are left zeroed.
+
+        Floats were rounded to 3 decimals by ``to_dict``, so they are only
+        restored to that precision.
+        """
+        packet = cls()
+        packet.assign(values)
+        return packet
+
+    def assign(self, values):
+        """Copies ``to_dict`` style values into this structure in place"""
+        for name, field_type in self._fields_:
+            if name in values:
+                self._assign_field(name, field_type, values[name])
+
+    def _assign_field(self, name, field_type, value):
+        if value is None:
+            return
+        if issubclass(field_type, ctypes.Array) and field_type._type_ is not ctypes.c_char:
+            _assign_array(getattr(self, name), value)
+        elif hasattr(field_type, "_fields_"):
+            getattr(self, name).assign(value)
+        elif isinstance(value, str):
+            setattr(self, name, value.encode())
+        else:
+            setattr(self, name, value)
+
     # listener/parser.py dosyasının içindeki PacketMixin sınıfında...
 
     def _format_type(self, value):
@@ -70,6 +179,275 @@ class PacketMixin(object):
         return value
 
 
+# class -> generated ``to_dict`` function
+_SERIALIZERS = {}
+
+
+def _value_expression(field_type, expr, depth=0):
+    """Source for formatting ``expr`` the way ``_format_type`` would, decided from the ctypes type"""
+    if issubclass(field_type, ctypes.Array):
+        if field_type._type_ is ctypes.c_char:
+            # char arrays read back as bytes
+            return f"{expr}.decode()"
+        item = f"v{depth}"
+        return f"[{_value_expression(field_type._type_, item, depth + 1)} for {item} in {expr}]"
+    code = getattr(field_type, "_type_", None)
+    if isinstance(code, str):
+        if code in "fdg":
+            return f"round({expr}, 3)"
+        if code == "c":
+            return f"{expr}.decode()"
+        return expr
+    if hasattr(field_type, "to_dict"):
+        return f"{expr}.to_dict()"
+    return expr
+
+
+def _build_serializer(cls):
+    """Generates a ``to_dict`` specialised to the field types of ``cls``
+
+    Each field is read once and formatted by an inline expression, so
+    there are no per-value type name comparisons or ``hasattr`` probes.
+    """
+    items = ",\n".join(
+        f"        {name!r}: {_value_expression(field_type, 'self.' + name)}"
+        for name, field_type in cls._fields_
+    )
+    source = f"def to_dict(self):\n    return {{\n{items}\n    }}\n"
+    namespace = {}
+    exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+    serializer = namespace["to_dict"]
+    serializer.__qualname__ = f"{cls.__name__}.to_dict"
+    serializer.__doc__ = PacketMixin.to_dict.__doc__
+    return serializer
+
+
+# class -> NumPy structured dtype
+_DTYPES = {}
+
+
+def _numpy_format(field_type):
+    """The NumPy dtype of a single ctypes field type"""
+    import numpy as np
+
+    if issubclass(field_type, ctypes.Array):
+        if field_type._type_ is ctypes.c_char:
+            return np.dtype(f"S{field_type._length_}")
+        return np.dtype((_numpy_format(field_type._type_), (field_type._length_,)))
+    code = getattr(field_type, "_type_", None)
+    if isinstance(code, str):
+        size = ctypes.sizeof(field_type)
+        if code == "c":
+            return np.dtype("S1")
+        if code == "?":
+            return np.dtype("?")
+        kind = "f" if code in "fdg" else "i" if code.islower() else "u"
+        return np.dtype(f"<{kind}{size}")
+    return field_type.numpy_dtype()
+
+
+# Length of the per-car arrays in packets that carry every car on track
+MAX_CARS = 22
+
+
+class PacketView(object):
+    """Lazy, read-only access to a packet's fields straight from its bytes
+
+    Nothing is decoded up front: every field is unpacked from its offset
+    when it is read, so reading a few fields of one car never builds the
+    other 21 cars or the rest of the ``to_dict`` tree. Scalars come back
+    formatted as in ``to_dict``; nested structures and arrays of
+    structures come back as views, so code written against ``to_dict``
+    output (``p['m_lap_data'][i].get('m_current_lap_num')``) reads a view
+    unchanged.
+
+    The view keeps a reference to the buffer and is only valid as long as
+    its contents are.
+    """
+
+    __slots__ = ("packet_type", "_buffer", "_offset", "_readers")
+
+    def __init__(self, packet_type, buffer, offset=0):
+        self.packet_type = packet_type
+        self._buffer = buffer
+        self._offset = offset
+        self._readers = _view_readers(packet_type)
+
+    def field(self, name):
+        """Returns a single field, formatted as ``get_value`` would"""
+        return self._readers[name](self._buffer, self._offset)
+
+    __getitem__ = field
+
+    def get(self, name, default=None):
+        reader = self._readers.get(name)
+        if reader is None:
+            return default
+        return reader(self._buffer, self._offset)
+
+    def __contains__(self, name):
+        return name in self._readers
+
+    def keys(self):
+        return self._readers.keys()
+
+    def car(self, index):
+        """Returns a view of car ``index`` in the packet's per-car array"""
+        _, offset, item_type, item_size = self._car_array()
+        if not 0 <= index < MAX_CARS:
+            raise IndexError("car index out of range")
+        return PacketView(item_type, self._buffer, self._offset + offset + index * item_size)
+
+    def column(self, name, array=None):
+        """Returns ``name`` for every car (or every item of the ``array`` field) as a list"""
+        return self.field(array or self._car_array()[0]).column(name)
+
+    def _car_array(self):
+        layout = _car_array(self.packet_type)
+        if layout is None:
+            raise TypeError(f"{self.packet_type.__name__} has no per-car array")
+        return layout
+
+    def unpack(self):
+        """Decodes the whole packet into its ctypes structure"""
+        return self.packet_type.from_buffer_copy(self._buffer, self._offset)
+
+    def to_dict(self):
+        return self.unpack().to_dict()
+
+    def __repr__(self):
+        return f"<{self.packet_type.__name__} view at {self._offset}>"
+
+
+class ArrayView(object):
+    """A lazy array of structures inside a ``PacketView``"""
+
+    __slots__ = ("item_type", "_buffer", "_offset", "_length", "_item_size")
+
+    def __init__(self, item_type, buffer, offset, length):
+        self.item_type = item_type
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+        self._item_size = ctypes.sizeof(item_type)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("array index out of range")
+        return PacketView(self.item_type, self._buffer, self._offset + index * self._item_size)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def column(self, name):
+        """Returns field ``name`` of every item as a list, without creating item views"""
+        reader = _view_readers(self.item_type)[name]
+        buffer, offset, size = self._buffer, self._offset, self._item_size
+        return [reader(buffer, offset + index * size) for index in range(self._length)]
+
+    def to_list(self):
+        return [item.to_dict() for item in self]
+
+
+# class -> (field name, offset, item class, item size) of the per-car array, or None
+_CAR_ARRAYS = {}
+
+
+def _car_array(cls):
+    if cls not in _CAR_ARRAYS:
+        _CAR_ARRAYS[cls] = None
+        for name, field_type in cls._fields_:
+            if (issubclass(field_type, ctypes.Array) and field_type._length_ == MAX_CARS
+                    and hasattr(field_type._type_, "_fields_")):
+                item_type = field_type._type_
+                _CAR_ARRAYS[cls] = (name, getattr(cls, name).offset, item_type, ctypes.sizeof(item_type))
+                break
+    return _CAR_ARRAYS[cls]
+
+
+# class -> {field name: reader(buffer, offset)}
+_VIEW_READERS = {}
+
+
+def _view_readers(cls):
+    readers = _VIEW_READERS.get(cls)
+    if readers is None:
+        readers = _VIEW_READERS[cls] = {
+            name: _view_reader(field_type, getattr(cls, name).offset)
+            for name, field_type in cls._fields_
+        }
+    return readers
+
+
+def _struct_code(field_type):
+    """The ``struct`` format character of a ctypes scalar type"""
+    code = field_type._type_
+    if code in "c?":
+        return code
+    size = ctypes.sizeof(field_type)
+    if code in "fdg":
+        return {4: "f", 8: "d"}[size]
+    signed = {1: "b", 2: "h", 4: "i", 8: "q"}[size]
+    return signed if code.islower() else signed.upper()
+
+
+def _view_reader(field_type, offset):
+    """Builds a function reading one field at ``offset`` the way ``to_dict`` formats it"""
+    if issubclass(field_type, ctypes.Array):
+        item_type, length = field_type._type_, field_type._length_
+        if item_type is ctypes.c_char:
+            end = offset + length
+
+            def read_chars(buffer, base):
+                # ctypes stops char arrays at the first NUL
+                return bytes(buffer[base + offset:base + end]).split(b"\0", 1)[0].decode()
+            return read_chars
+        if hasattr(item_type, "_fields_"):
+            return lambda buffer, base: ArrayView(item_type, buffer, base + offset, length)
+        if issubclass(item_type, ctypes.Array):
+            size = ctypes.sizeof(item_type)
+            item_reader = _view_reader(item_type, 0)
+            return lambda buffer, base: [
+                item_reader(buffer, base + offset + index * size) for index in range(length)
+            ]
+        code = _struct_code(item_type)
+        unpack_items = struct.Struct(f"<{length}{code}").unpack_from
+        if code in "fd":
+            return lambda buffer, base: [round(value, 3) for value in unpack_items(buffer, base + offset)]
+        if code == "c":
+            return lambda buffer, base: [value.decode() for value in unpack_items(buffer, base + offset)]
+        return lambda buffer, base: list(unpack_items(buffer, base + offset))
+    if hasattr(field_type, "_fields_"):
+        return lambda buffer, base: PacketView(field_type, buffer, base + offset)
+    code = _struct_code(field_type)
+    unpack = struct.Struct(f"<{code}").unpack_from
+    if code in "fd":
+        return lambda buffer, base: round(unpack(buffer, base + offset)[0], 3)
+    if code == "c":
+        return lambda buffer, base: unpack(buffer, base + offset)[0].decode()
+    return lambda buffer, base: unpack(buffer, base + offset)[0]
+
+
+def _assign_array(array, values):
+    """Copies a list from ``to_dict`` into a ctypes array, recursing into structures"""
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        item = array[index]
+        if isinstance(item, ctypes.Array):
+            _assign_array(item, value)
+        elif isinstance(item, PacketMixin):
+            item.assign(value)
+        else:
+            array[index] = value
+
+
 class Packet(ctypes.LittleEndianStructure, PacketMixin):
     _pack_ = 1
 
@@ -532,6 +910,16 @@ class PacketEventData(Packet):
         # Temizlenmiş ve düzenlenmiş sözlüğü geri döndürüyoruz.
         return base_dict
 
+    # to_dict'in tersi: yalnızca olay koduna karşılık gelen birleşim (union) alanı doldurulur.
+    def assign(self, values):
+        details = values.get("m_event_details")
+        super().assign({k: v for k, v in values.items() if k != "m_event_details"})
+        if not isinstance(details, dict) or not isinstance(details.get("details"), dict):
+            return
+        field_name = EVENT_STRING_CODE_TO_FIELD.get(details.get("event_type", "").encode())
+        if field_name:
+            getattr(self.m_event_details, field_name).assign(details["details"])
+
 
 class ParticipantData(Packet):
     _fields_ = [
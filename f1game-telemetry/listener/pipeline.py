@@ -0,0 +1,334 @@
+# listener/pipeline.py
+"""
+Alma / çözme / yazma aşamalarını birbirinden ayıran dinleyici hattı.
+
+    soket -> [alıcı thread] -> çözme kuyruğu -> [N işçi] -> yazma kuyruğu -> [ana döngü]
+
+Alıcı thread soketi yalnızca boşaltır; paketlerin çözülmesi ve kayda
+dönüştürülmesi işçi thread'lerinde ya da süreçlerinde yapılır. Veritabanı ve
+dosya yazımı (``TelemetryRecorder``) ana döngüde, tek noktadan yürütülür.
+İşçiler paketleri farklı sürede çözebildiği için alıcı her datagrama bir sıra
+numarası verir ve ana döngü kayıtları bu sırayla işler.
+
+Her işçi son aldığı paketlerin sıra numaralarını ve çözme hatalarını
+paylaşılan bellekte tutar. Bitiş işareti göndermeden ölen bir işçi (ör. çöken
+bir süreç) bitmiş sayılır ve ana döngüye ulaşmamış sıra numaraları atlanır;
+hat diğer işçilerle devam eder. Atlanan bir kayıt sonradan gelirse sırası
+geçmiş olsa da yazılır.
+
+Alıcı bir ``PacketRing`` ile çalışıyorsa thread işçilerine datagramın kopyası
+değil halka slotu gönderilir; slot, işçi paketi kodladıktan (ya da paket
+düşürüldükten) sonra serbest bırakılır. Süreç işçilerine yine kopya gider.
+"""
+
+import heapq
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+
+from listener.ring import RingSlot
+
+DROP_POLICIES = ('block', 'drop-newest', 'drop-oldest')
+WORKER_MODES = ('threads', 'processes')
+# Ölen işçilerin denetlenme aralığı (saniye)
+WORKER_CHECK_INTERVAL = 0.5
+# İşçi başına hatırlanan son sıra numarası sayısı. Ölen bir süreç işçisinin
+# kuyruğa koyduğu ama gönderilemeden kaybolan kayıtlar da bunların içindedir.
+RECENT_SEQS = 64
+
+
+class _WorkerState:
+    """Bir çözme işçisinin ana döngüyle paylaştığı sayaçlar; her birine yalnızca işçi yazar."""
+
+    def __init__(self):
+        self.recent = multiprocessing.RawArray('q', [-1] * RECENT_SEQS)
+        self.errors = multiprocessing.RawValue('q', 0)
+        self.done = multiprocessing.RawValue('b', 0)
+
+
+def _decode_worker(encoder, in_queue, out_queue, ignore_sigint, state):
+    if ignore_sigint:
+        # Ctrl+C'yi yalnızca ana süreç yakalar; işçiler kuyruğu boşaltıp çıkar.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    taken = 0
+    while True:
+        item = in_queue.get()
+        if item is None:
+            break
+        seq, data, received_at, rig = item
+        state.recent[taken % RECENT_SEQS] = seq
+        taken += 1
+        try:
+            encoded = encoder(data, received_at, rig)
+        except Exception:
+            state.errors.value += 1
+            encoded = None
+        if type(data) is RingSlot:
+            # Kayıt slotun belleğine referans tutmaz; slot alıcıya geri verilir.
+            data.release()
+        # Kaydedilmeyecek paketler de sıra numarasıyla bildirilir; yoksa ana döngü onları bekler.
+        out_queue.put((seq, encoded))
+    state.done.value = 1
+    # Ana döngü, bu işaretlerden işçi sayısı kadar aldığında hattın boşaldığını anlar.
+    out_queue.put(None)
+
+
+class QueueMetrics:
+    """Bir aşama kuyruğunun anlık ve en yüksek doluluğunu izler."""
+
+    def __init__(self, q, capacity):
+        self._queue = q
+        self.capacity = capacity
+        self.depth = 0
+        self.max_depth = 0
+
+    def sample(self):
+        try:
+            depth = self._queue.qsize()
+        except NotImplementedError:
+            # macOS'ta multiprocessing.Queue.qsize desteklenmiyor.
+            return
+        self.depth = depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def as_dict(self):
+        return {'depth': self.depth, 'max_depth': self.max_depth, 'capacity': self.capacity}
+
+
+class ListenerPipeline:
+    """
+    ``workers`` adet çözme işçisiyle çalışan, sınırlı kuyruklu dinleyici hattı.
+
+    Çözme kuyruğu dolduğunda ``drop_policy`` uygulanır:
+      - ``block``: alıcı bekler (geri basınç); soket tamponu dolarsa çekirdek düşürür.
+      - ``drop-newest``: yeni gelen paket atılır.
+      - ``drop-oldest``: kuyruktaki en eski paket atılıp yenisine yer açılır.
+    """
+
+    def __init__(self, receiver, encoder, recorder, workers=2, mode='threads',
+                 queue_size=4096, drop_policy='drop-oldest', forwarder=None, log=None):
+        if mode not in WORKER_MODES:
+            raise ValueError(f"Geçersiz işçi modu: {mode}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Geçersiz düşürme politikası: {drop_policy}")
+
+        self.receiver = receiver
+        self.recorder = recorder
+        # Süreç işçileri halkanın belleğini göremez; onlara datagramın kopyası gönderilir.
+        self.ring = getattr(receiver, 'ring', None)
+        self._share_slots = self.ring is not None and mode == 'threads'
+        self.forwarder = forwarder
+        self.drop_policy = drop_policy
+        self.log = log or (lambda message, style=None: None)
+        self.received = 0
+        self.dropped = 0
+        self.backpressure_waits = 0
+        self.committed = 0
+        self.reorder_max = 0
+        self.dead_workers = 0
+        self._stop = threading.Event()
+        self._next_seq = 0
+        # Düşürme politikası nedeniyle hiç işlenmeyecek sıra numaraları.
+        self._skipped = set()
+        self._reorder = []
+        self._commit_seq = 0
+
+        if mode == 'processes':
+            context = multiprocessing.get_context()
+            self._in_queue = context.Queue(queue_size)
+            self._out_queue = context.Queue(queue_size)
+            worker_factory = context.Process
+        else:
+            self._in_queue = queue.Queue(queue_size)
+            self._out_queue = queue.Queue(queue_size)
+            worker_factory = threading.Thread
+
+        self._worker_states = [_WorkerState() for _ in range(max(1, workers))]
+        self._workers = [
+            worker_factory(
+                target=_decode_worker,
+                args=(encoder, self._in_queue, self._out_queue, mode == 'processes', state),
+                daemon=True,
+            )
+            for state in self._worker_states
+        ]
+        self._receiver = threading.Thread(target=self._receive_loop, daemon=True)
+        self.decode_queue = QueueMetrics(self._in_queue, queue_size)
+        self.write_queue = QueueMetrics(self._out_queue, queue_size)
+
+    def run(self, should_stop):
+        """
+        Hattı başlatır ve ``should_stop()`` True dönene kadar yazma aşamasını
+        çalıştırır. Durdurulduktan sonra kuyruklarda kalan paketler de yazılır.
+        """
+        for worker in self._workers:
+            worker.start()
+        self._receiver.start()
+
+        finished = 0
+        closing = False
+        # Bitiş işaretini göndermeden ölen işçiler; diğer işçiler kayıt ürettikçe
+        # kuyruk hiç boşalmayabileceğinden periyodik olarak denetlenir.
+        dead = set()
+        next_check = time.monotonic() + WORKER_CHECK_INTERVAL
+        try:
+            while finished < len(self._workers):
+                if not closing and should_stop():
+                    closing = True
+                    threading.Thread(target=self._close_inputs, daemon=True).start()
+                if time.monotonic() >= next_check:
+                    next_check = time.monotonic() + WORKER_CHECK_INTERVAL
+                    finished += self._reap_dead_workers(dead)
+                    self._commit_in_order()
+                try:
+                    item = self._out_queue.get(timeout=WORKER_CHECK_INTERVAL)
+                except queue.Empty:
+                    self.recorder.tick()
+                    continue
+                if item is None:
+                    finished += 1
+                    continue
+                self.write_queue.sample()
+                heapq.heappush(self._reorder, item)
+                if len(self._reorder) > self.reorder_max:
+                    self.reorder_max = len(self._reorder)
+                self._commit_in_order()
+                self.recorder.tick()
+            # Tüm işçiler bittiğinde sırası gelmemiş kayıt kalmaz; kalanlar sırayla yazılır.
+            while self._reorder:
+                self._commit(heapq.heappop(self._reorder)[1])
+        finally:
+            self._stop.set()
+            for worker in self._workers:
+                if isinstance(worker, multiprocessing.process.BaseProcess) and worker.is_alive():
+                    worker.terminate()
+
+    def _reap_dead_workers(self, dead):
+        """
+        Bitiş işareti göndermeden ölen işçileri bulur, ana döngüye ulaşmamış
+        sıra numaralarını atlanacaklara ekler ve kaç işçinin yeni bittiğini döndürür.
+        """
+        reaped = 0
+        for number, (worker, state) in enumerate(zip(self._workers, self._worker_states)):
+            # Bitiş işaretini gönderip çıkan işçinin işareti kuyrukta olabilir.
+            if number in dead or state.done.value or worker.is_alive():
+                continue
+            dead.add(number)
+            reaped += 1
+            self.dead_workers += 1
+            waiting = {item[0] for item in self._reorder}
+            self._skipped.update(
+                seq for seq in state.recent if seq >= self._commit_seq and seq not in waiting
+            )
+            exitcode = getattr(worker, 'exitcode', None)
+            self.log(f"Çözme işçisi {number + 1} beklenmedik şekilde durdu (çıkış kodu {exitcode}); "
+                     "hat kalan işçilerle devam ediyor.", 'ERROR')
+        return reaped
+
+    def _commit_in_order(self):
+        reorder = self._reorder
+        while True:
+            if reorder and reorder[0][0] < self._commit_seq:
+                # Ölen işçiye atfedilip atlanan, ancak yine de ulaşmış kayıt
+                self._commit(heapq.heappop(reorder)[1])
+                continue
+            if reorder and reorder[0][0] == self._commit_seq:
+                self._commit(heapq.heappop(reorder)[1])
+            elif self._commit_seq in self._skipped:
+                self._skipped.discard(self._commit_seq)
+            else:
+                return
+            self._commit_seq += 1
+
+    def _commit(self, encoded):
+        if encoded is not None:
+            self.recorder.commit(encoded)
+            self.committed += 1
+
+    def metrics(self):
+        return {
+            'received': self.received,
+            'dropped': self.dropped,
+            'backpressure_waits': self.backpressure_waits,
+            'committed': self.committed,
+            'decode_errors': sum(state.errors.value for state in self._worker_states),
+            'dead_workers': self.dead_workers,
+            'reorder_max': self.reorder_max,
+            'ring': self.ring.stats() if self.ring is not None else None,
+            'decode_queue': self.decode_queue.as_dict(),
+            'write_queue': self.write_queue.as_dict(),
+        }
+
+    def _close_inputs(self):
+        # Alıcı durduktan sonra her işçiye bir bitiş işareti gönderiyoruz.
+        # Bu adım ayrı thread'de yürür; böylece ana döngü yazma kuyruğunu
+        # boşaltmaya devam eder ve kuyruklar dolu olsa bile kilitlenme olmaz.
+        self._stop.set()
+        self._receiver.join()
+        for _ in self._workers:
+            self._in_queue.put(None)
+
+    def _receive_loop(self):
+        while not self._stop.is_set():
+            try:
+                batch = self.receiver.receive(timeout=0.5)
+            except (OSError, ValueError):
+                break
+            received_at = time.time()
+            forward = self.forwarder.forward if self.forwarder is not None else None
+            ring, share_slots = self.ring, self._share_slots
+            for packet_data, rig in batch:
+                self.received += 1
+                if ring is not None:
+                    slot = packet_data
+                    packet_data = slot.data
+                if forward is not None:
+                    forward(packet_data)
+                if share_slots:
+                    data = slot
+                else:
+                    # Alıcının tamponları yeniden kullanıldığından kuyruğa kopya gönderilir.
+                    data = bytes(packet_data)
+                    if ring is not None:
+                        slot.release()
+                self._enqueue((self._next_seq, data, received_at, rig))
+                self._next_seq += 1
+            if batch:
+                self.decode_queue.sample()
+            elif ring is not None and not ring.available:
+                # Tüm slotlar işçilerde; soket okunabilir olsa da boş dönülür, kısa bir bekleme yeterli.
+                time.sleep(0.001)
+
+    def _enqueue(self, item):
+        if self.drop_policy == 'block':
+            while not self._stop.is_set():
+                try:
+                    self._in_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    self.backpressure_waits += 1
+            self._drop(item)
+        elif self.drop_policy == 'drop-newest':
+            try:
+                self._in_queue.put_nowait(item)
+            except queue.Full:
+                self._drop(item)
+        else:
+            while True:
+                try:
+                    self._in_queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        self._drop(self._in_queue.get_nowait())
+                    except queue.Empty:
+                        pass
+
+    def _drop(self, item):
+        self.dropped += 1
+        self._skipped.add(item[0])
+        if type(item[1]) is RingSlot:
+            item[1].release()
@@ -0,0 +1,90 @@
+# listener/recorder.py
+
+import time
+
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE
+from listener.sessions import rig_conflict_message
+
+# Kayıp/jitter özetlerinin veritabanına en fazla hangi sıklıkla yazılacağı (saniye).
+CAPTURE_STATS_INTERVAL = 30.0
+
+
+class TelemetryRecorder:
+    """
+    ``DatagramEncoder`` çıktısını seans kaydına ve yazıcı havuzuna işler.
+
+    Veritabanına ve dosyalara dokunan tek aşama burasıdır; bu yüzden her zaman
+    tek bir iş parçacığından (ana döngüden) çağrılmalıdır.
+    """
+
+    def __init__(self, writer_pool, session_registry, sequence_tracker=None, log=None,
+                 listener_stats=None, reporter=None, verbose=False, ingestor=None):
+        self.writer_pool = writer_pool
+        self.session_registry = session_registry
+        self.sequence_tracker = sequence_tracker
+        self.log = log or (lambda message, style=None: None)
+        self.listener_stats = listener_stats
+        self.reporter = reporter
+        # Paket başına konsol satırı yalnızca ayrıntılı (hata ayıklama) modda yazılır.
+        self.verbose = verbose
+        # Canlı aktarım açıksa tur/telemetri verisi seans sürerken veritabanına yazılır.
+        self.ingestor = ingestor
+        self._stats_saved_at = time.monotonic()
+
+    def commit(self, encoded):
+        session_uid = encoded.session_uid
+        # Aynı UID'yi bildiren ikinci bir rig'in paketleri ayrı bir akışa yazılır;
+        # seansın veritabanı kaydına ve canlı aktarımına karışmaz.
+        stream_key = self.session_registry.stream_key(session_uid, encoded.rig)
+        own_stream = stream_key == session_uid
+        if own_stream:
+            _, created = self.session_registry.resolve(session_uid, encoded.rig)
+            if created:
+                rig = f" [{encoded.rig}]" if encoded.rig else ""
+                self.log(f"Yeni seans (ID: {session_uid}){rig} veritabanına kaydedildi!", 'SUCCESS')
+
+            if encoded.track_id is not None and self.session_registry.apply_track(session_uid, encoded.track_id):
+                self.log(f"Seans (ID: {session_uid}) için pist ID ({encoded.track_id}) güncellendi.", 'SUCCESS')
+        for conflict in self.session_registry.pop_rig_conflicts():
+            self.log(rig_conflict_message(*conflict), 'WARNING')
+
+        if self.sequence_tracker is not None:
+            self.sequence_tracker.observe(
+                stream_key, encoded.packet_id, encoded.frame_id, encoded.session_time, encoded.received_at
+            )
+
+        if self.ingestor is not None and own_stream and encoded.datagram is not None:
+            if self.ingestor.feed(session_uid, encoded.packet_id, encoded.datagram):
+                self.ingestor.flush()
+
+        # Filtreyle kaydedilmeyen paketler yalnızca seans kaydı ve canlı aktarım için gelir; yükleri yoktur.
+        if encoded.payload is None:
+            return
+        # Dosya her pakette açılıp kapanmıyor; havuz tamponlayıp toplu yazıyor.
+        self.writer_pool.write(stream_key, encoded.payload)
+        if self.listener_stats is not None:
+            self.listener_stats.record(encoded.packet_id, len(encoded.payload))
+        if self.verbose:
+            packet_name = HEADER_FIELD_TO_PACKET_TYPE[encoded.packet_id].__name__
+            self.log(f'Paket {packet_name} -> {self.writer_pool.path_for(stream_key)} dosyasına kaydedildi.')
+
+    def tick(self):
+        self.writer_pool.tick()
+        if self.reporter is not None:
+            self.reporter.maybe_report()
+        if time.monotonic() - self._stats_saved_at >= CAPTURE_STATS_INTERVAL:
+            self.save_capture_stats()
+
+    def save_capture_stats(self):
+        self._stats_saved_at = time.monotonic()
+        if self.sequence_tracker is None:
+            return
+        for session_uid in self.sequence_tracker.sessions():
+            self.session_registry.save_capture_stats(session_uid, self.sequence_tracker.summary(session_uid))
+
+    def close(self):
+        if self.ingestor is not None:
+            self.ingestor.finish()
+        # Tamponlarda bekleyen kayıtları diske yazıp dosyaları kapatıyoruz.
+        self.writer_pool.close_all()
+        self.save_capture_stats()
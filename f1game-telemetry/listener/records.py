@@ -0,0 +1,133 @@
+# listener/records.py
+"""
+Datagramların diske yazılacak kayıtlara dönüştürülmesi.
+
+Bu modül bilerek Django'ya bağımlı değildir; ``DatagramEncoder`` hem ana
+süreçte hem de ayrı işçi süreçlerinde (pipeline modu) aynı şekilde çalışır.
+"""
+
+import json
+import time
+from collections import namedtuple
+
+from listener.capture import FLAG_PLAYER_ONLY, encode_record
+from listener.filters import compact_player_car, player_car_dict, player_index
+from listener.frames import SESSION_PACKET_ID
+from listener.parser24 import PacketHeader, PacketSessionData
+from listener.ring import RingSlot
+from listener.schemas import HEADER_SIZE, SCHEMAS
+
+# track_id yalnızca seans paketlerinde dolu gelir, diğerlerinde None'dır.
+# frame_id (m_overall_frame_identifier), session_time ve received_at kayıp/jitter takibi içindir.
+# datagram yalnızca ``forward_ids`` içindeki paketlerde (ör. canlı aktarım için) dolu gelir.
+# rig, paketin geldiği simülatörün etiketidir (tek kaynaklı dinlemede None).
+EncodedPacket = namedtuple('EncodedPacket', [
+    'session_uid', 'packet_id', 'track_id', 'payload', 'frame_id', 'session_time', 'received_at', 'datagram',
+    'rig',
+], defaults=[None, None])
+
+
+class DatagramEncoder:
+    """
+    Ham datagramı çözer ve seçilen biçimde (ikili kayıt ya da JSON satırı)
+    yazılmaya hazır hale getirir. Kaydedilmeyecek paketler için None döner;
+    ancak seans paketleri ve ``forward_ids`` türleri filtreyle kaydedilmese de
+    ``payload`` değeri None olan bir kayıtla döner, böylece seans kaydı, pist
+    bilgisi ve canlı aktarım filtreden etkilenmez.
+
+    ``data`` bir ``RingSlot`` ise başlık ve paket, slota bindirilmiş nesnelerden
+    kopyalanmadan okunur. Dönen kayıt slotun belleğine referans tutmaz; slot
+    çağrıdan hemen sonra serbest bırakılabilir.
+
+    Paket sınıfı ``schemas`` kayıt defterinden (oyun yılı, paket sürümü, paket
+    ID) anahtarıyla bulunur; bilinmeyen anahtarlı ya da beklenen boyutta
+    olmayan datagramlar çözülmeden sayılıp atılır.
+    """
+
+    def __init__(self, binary=True, packet_filter=None, forward_ids=None, schemas=SCHEMAS):
+        self.binary = binary
+        self.schemas = schemas
+        # Şeması bilinmeyen (başka oyun yılı/sürümü) ve boyutu tutmayan datagramlar.
+        self.unknown_schema = 0
+        self.malformed = 0
+        # Filtre yoksa ya da hiçbir kural tanımlı değilse paketler olduğu gibi kaydedilir.
+        self.packet_filter = packet_filter if packet_filter is not None and packet_filter.active else None
+        # Bu türlerin ham datagramı da kayda eklenir; ana döngüdeki tüketiciler yeniden okuyabilir.
+        self.forward_ids = frozenset(forward_ids or ())
+
+    def __call__(self, data, received_at, rig=None):
+        slot = data if type(data) is RingSlot else None
+        if slot is not None:
+            data = slot.data
+        if len(data) < HEADER_SIZE:
+            self.malformed += 1
+            return None
+        # Yıl/sürüm/ID anahtarı ve boyut, başlık çözülmeden önce denetlenir.
+        schema = self.schemas.resolve(data)
+        if schema is None:
+            self.unknown_schema += 1
+            return None
+        if len(data) != schema.size:
+            self.malformed += 1
+            return None
+        header = slot.header if slot is not None else PacketHeader.from_buffer_copy(data)
+        if header.m_session_uid == 0:
+            return None
+
+        packet_id = schema.packet_id
+        packet_type = schema.packet_type
+        packet_filter = self.packet_filter
+        if packet_filter is None:
+            payload = self.encode(packet_id, packet_type, data, received_at, trim=False, slot=slot)
+        else:
+            payload = self._encode_filtered(packet_filter, packet_id, packet_type, data, received_at, slot)
+            if payload is None and packet_id != SESSION_PACKET_ID and packet_id not in self.forward_ids:
+                return None
+
+        # Tam çözme yalnızca pist bilgisini taşıyan seans paketi için gerekli.
+        track_id = None
+        if packet_id == SESSION_PACKET_ID:
+            track_id = self._decode(PacketSessionData, data, slot).m_track_id
+
+        return EncodedPacket(
+            header.m_session_uid, packet_id, track_id, payload,
+            header.m_overall_frame_identifier, header.m_session_time, received_at,
+            bytes(data) if packet_id in self.forward_ids else None, rig,
+        )
+
+    def stats(self):
+        return {'unknown_schema': self.unknown_schema, 'malformed': self.malformed}
+
+    @staticmethod
+    def _decode(packet_type, data, slot):
+        return slot.overlay(packet_type) if slot is not None else packet_type.from_buffer_copy(data)
+
+    def encode(self, packet_id, packet_type, data, received_at, trim, slot=None):
+        if self.binary:
+            if trim:
+                return encode_record(received_at, compact_player_car(data, packet_id), FLAG_PLAYER_ONLY)
+            return encode_record(received_at, data)
+
+        packet = self._decode(packet_type, data, slot)
+        packet_dict = player_car_dict(packet, player_index(data)) if trim else packet.to_dict()
+        return (json.dumps(packet_dict) + "\n").encode()
+
+    def _encode_filtered(self, packet_filter, packet_id, packet_type, data, received_at, slot=None):
+        accepted = packet_filter.accepts(packet_id)
+        trim = accepted and packet_filter.trims(packet_id, data)
+        if not accepted or trim:
+            # Tasarruf tahmini için ara sıra filtresiz yolun maliyetini ölçüyoruz.
+            if packet_filter.should_sample(packet_id):
+                started = time.perf_counter()
+                full_payload = self.encode(packet_id, packet_type, data, received_at, trim=False, slot=slot)
+                packet_filter.record_full_cost(packet_id, time.perf_counter() - started, len(full_payload))
+        if not accepted:
+            packet_filter.record_skip(packet_id)
+            return None
+        if not trim:
+            return self.encode(packet_id, packet_type, data, received_at, trim=False, slot=slot)
+
+        started = time.perf_counter()
+        payload = self.encode(packet_id, packet_type, data, received_at, trim=True, slot=slot)
+        packet_filter.record_trim(packet_id, time.perf_counter() - started, len(payload))
+        return payload
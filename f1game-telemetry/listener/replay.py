@@ -0,0 +1,126 @@
+# listener/replay.py
+"""
+Kaydedilmiş seansların UDP üzerinden yeniden oynatılması.
+
+Seans klasöründeki ikili kayıt ya da JSONL log okunur, her paket parser24
+yapısına çevrilip ``pack()`` ile oyunun gönderdiği ikili biçime geri
+dönüştürülür ve ``m_session_time`` değerine göre zamanlanarak gönderilir.
+Dinleyici ve canlı aktarım ölçümleri oyun çalıştırmadan bu araçla yapılır.
+"""
+
+import json
+import socket
+import time
+
+from listener.capture import CAPTURE_FILENAME, read_packets
+from listener.schemas import SCHEMAS
+from listener.session_files import session_log_paths
+
+# Bu kadar saniyeden kısa beklemelerde uyumak yerine hemen gönderilir.
+MIN_SLEEP = 0.0005
+
+
+def iter_session_packets(session_dir, packet_ids=None):
+    """Seansın paketlerini, kayıt biçiminden bağımsız olarak parser24 nesneleri halinde üretir."""
+    for path in session_log_paths(session_dir):
+        if path.endswith(CAPTURE_FILENAME):
+            yield from read_packets(path, packet_ids)
+            continue
+        with open(path, 'r') as f:
+            for line in f:
+                values = json.loads(line)
+                header = values.get('m_header', {})
+                packet_id = header.get('m_packet_id')
+                if packet_ids is not None and packet_id not in packet_ids:
+                    continue
+                schema = SCHEMAS.get(header.get('m_packet_format'), packet_id, header.get('m_packet_version'))
+                if schema is None:
+                    continue
+                yield schema.packet_type.from_dict(values)
+
+
+def iter_datagrams(packets):
+    """Paketleri ``(m_session_time, ikili datagram)`` çiftlerine dönüştürür."""
+    for packet in packets:
+        yield packet.m_header.m_session_time, packet.pack()
+
+
+class ReplayStats:
+    def __init__(self):
+        self.sent = 0
+        self.bytes_sent = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.session_seconds = 0.0
+        self.max_behind = 0.0
+
+    def as_dict(self):
+        elapsed = self.elapsed or 1e-9
+        return {
+            'sent': self.sent,
+            'bytes_sent': self.bytes_sent,
+            'errors': self.errors,
+            'elapsed': round(self.elapsed, 3),
+            'session_seconds': round(self.session_seconds, 3),
+            'packets_per_second': round(self.sent / elapsed, 1),
+            'megabytes_per_second': round(self.bytes_sent / elapsed / (1024 * 1024), 3),
+            'max_behind_ms': round(self.max_behind * 1000, 2),
+        }
+
+
+class Replayer:
+    """
+    Datagramları hedef adrese gönderir.
+
+    ``speed`` 1.0 ise gerçek zamanlı, 4.0 ise dört kat hızlı oynatılır; None
+    ise beklemeden, olabildiğince hızlı gönderilir. Seans zamanı geri giderse
+    (flashback ya da tekrarlı oynatma) zamanlama o noktadan yeniden başlatılır.
+    """
+
+    def __init__(self, host, port, speed=1.0, udp_socket=None, clock=time.perf_counter, sleep=time.sleep):
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Geçersiz oynatma hızı: {speed}")
+        self.target = (host, port)
+        self.speed = speed
+        self.udp_socket = udp_socket or socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = ReplayStats()
+
+    def run(self, datagrams, should_stop=None):
+        """``(m_session_time, datagram)`` çiftlerini gönderir ve ``ReplayStats`` döndürür."""
+        stats = self.stats
+        clock, sleep, speed = self.clock, self.sleep, self.speed
+        sendto, target = self.udp_socket.sendto, self.target
+        started = clock()
+        anchor_wall = anchor_time = last_time = None
+        try:
+            for session_time, datagram in datagrams:
+                if should_stop is not None and should_stop():
+                    break
+                if last_time is None or session_time < last_time:
+                    if last_time is not None:
+                        stats.session_seconds += last_time - anchor_time
+                    anchor_wall, anchor_time = clock(), session_time
+                last_time = session_time
+
+                if speed is not None:
+                    delay = anchor_wall + (session_time - anchor_time) / speed - clock()
+                    if delay > MIN_SLEEP:
+                        sleep(delay)
+                    elif -delay > stats.max_behind:
+                        stats.max_behind = -delay
+
+                try:
+                    sendto(datagram, target)
+                except OSError:
+                    # Tam hızda çekirdek tamponu dolabilir (ENOBUFS); paket sayılıp geçilir.
+                    stats.errors += 1
+                    continue
+                stats.sent += 1
+                stats.bytes_sent += len(datagram)
+        finally:
+            if last_time is not None:
+                stats.session_seconds += last_time - anchor_time
+            stats.elapsed = clock() - started
+        return stats
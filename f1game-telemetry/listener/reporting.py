@@ -0,0 +1,122 @@
+# listener/reporting.py
+"""
+Dinleyici sayaçları ve periyodik durum satırı.
+
+Her paket için konsola satır yazmak yerine sayaçlar ``ListenerStats`` içinde
+toplanır ve ``StatusReporter`` bunları belirli aralıklarla tek satır olarak
+özetler. Aynı anlık görüntü (``snapshot``) diğer araçlar tarafından doğrudan
+ya da ``--status-file`` ile yazılan JSON dosyasından okunabilir.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE
+
+
+def short_packet_name(packet_id):
+    """'PacketCarTelemetryData' -> 'CarTelemetry'"""
+    name = HEADER_FIELD_TO_PACKET_TYPE[packet_id].__name__
+    name = name[len('Packet'):] if name.startswith('Packet') else name
+    return name[:-len('Data')] if name.endswith('Data') else name
+
+
+def format_gauge(value):
+    """Sözlük döndüren göstergeleri (ör. rig başına paket) 'A 120, B 80' biçiminde yazar."""
+    if isinstance(value, dict):
+        return ", ".join(f"{key} {item}" for key, item in value.items()) or '-'
+    return value
+
+
+class ListenerStats:
+    """
+    Dinleyicinin programatik olarak okunabilen sayaçları.
+
+    Paket ve bayt sayaçları kayıt aşamasında artırılır. Diğer bileşenlerin
+    değerleri (aktif seans, düşürülen paket vb.) ``add_gauge`` ile kaydedilen
+    fonksiyonlardan anlık görüntü alınırken okunur.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.started_at = clock()
+        self.packets = Counter()
+        self.bytes = 0
+        self._gauges = {}
+        self.labels = {}
+
+    def record(self, packet_id, nbytes):
+        self.packets[packet_id] += 1
+        self.bytes += nbytes
+
+    def add_gauge(self, name, func, label=None):
+        """``name`` anlık görüntüdeki anahtar, ``label`` durum satırındaki etikettir."""
+        self._gauges[name] = func
+        self.labels[name] = label or name
+
+    def snapshot(self):
+        return {
+            'uptime': round(self.clock() - self.started_at, 3),
+            'packets': sum(self.packets.values()),
+            'packets_by_type': {short_packet_name(pid): count for pid, count in sorted(self.packets.items())},
+            'bytes': self.bytes,
+            **{name: func() for name, func in self._gauges.items()},
+        }
+
+
+class StatusReporter:
+    """``interval`` saniyede bir, son aralığın hızlarını içeren tek bir durum satırı yazar."""
+
+    def __init__(self, stats, write, interval=2.0, status_file=None, clock=time.monotonic):
+        self.stats = stats
+        self.write = write
+        self.interval = interval
+        self.status_file = status_file
+        self.clock = clock
+        self._last_at = clock()
+        self._last_packets = Counter()
+        self._last_bytes = 0
+
+    def maybe_report(self):
+        now = self.clock()
+        elapsed = now - self._last_at
+        if self.interval <= 0 or elapsed < self.interval:
+            return
+        self.report(now, elapsed)
+
+    def report(self, now=None, elapsed=None):
+        now = self.clock() if now is None else now
+        elapsed = (now - self._last_at if elapsed is None else elapsed) or 1e-9
+        snapshot = self.stats.snapshot()
+
+        packets = self.stats.packets
+        rates = {pid: (packets[pid] - self._last_packets[pid]) / elapsed for pid in packets}
+        total_rate = sum(rates.values())
+        byte_rate = (self.stats.bytes - self._last_bytes) / elapsed
+        self._last_at = now
+        self._last_packets = Counter(packets)
+        self._last_bytes = self.stats.bytes
+
+        by_type = ", ".join(
+            f"{short_packet_name(pid)} {rate:.0f}" for pid, rate in sorted(rates.items()) if rate >= 0.5
+        )
+        extras = " | ".join(f"{label}: {format_gauge(snapshot[name])}" for name, label in self.stats.labels.items())
+        line = f"[{time.strftime('%H:%M:%S')}] {total_rate:.0f} paket/s ({by_type or '-'}) | {byte_rate / 1024:.1f} KB/s"
+        self.write(f"{line} | {extras}" if extras else line)
+
+        if self.status_file:
+            snapshot['rates'] = {
+                'packets_per_second': round(total_rate, 2),
+                'bytes_per_second': round(byte_rate, 2),
+                'by_type': {short_packet_name(pid): round(rate, 2) for pid, rate in sorted(rates.items())},
+            }
+            self._write_status_file(snapshot)
+
+    def _write_status_file(self, snapshot):
+        # Okuyucuların yarım yazılmış dosya görmemesi için önce geçici dosyaya yazıyoruz.
+        tmp_path = f"{self.status_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.status_file)
@@ -0,0 +1,88 @@
+# listener/rigs.py
+"""
+Tek dinleyici sürecinde birden fazla simülatör (rig) kaynağı.
+
+Her rig ya kendi UDP portundan (``--rig A=20777``) ya da ortak bir porta
+gönderdiği kaynak adresinden (``--rig-source A=192.168.1.21``) tanınır. Tüm
+kaynaklar aynı yazıcı havuzunu ve veritabanı yazıcısını paylaşır; rig etiketi
+seans ilk kez kaydedilirken ``RaceSession.rig`` alanına yazılır.
+"""
+
+import time
+
+# Etiketi belirlenemeyen (eşlenmemiş adresten ortak porta gelen) paketlerin sayaç anahtarı.
+UNKNOWN_RIG = '-'
+
+
+def parse_rig_port(value):
+    """'A=20777' ya da 'A=0.0.0.0:20777' biçimini ``(etiket, host ya da None, port)`` olarak döndürür."""
+    label, _, address = value.partition('=')
+    host, _, port = address.rpartition(':')
+    if not label or not port.isdigit():
+        raise ValueError(f"Geçersiz rig tanımı: {value} (beklenen ETİKET=[host:]port)")
+    return label, host or None, int(port)
+
+
+def parse_rig_source(value):
+    """'A=192.168.1.21' biçimini ``(etiket, kaynak adres)`` olarak döndürür."""
+    label, _, address = value.partition('=')
+    if not label or not address:
+        raise ValueError(f"Geçersiz rig kaynağı: {value} (beklenen ETİKET=adres)")
+    return label, address
+
+
+class RigStats:
+    """Tek bir rig'in alınan paket ve bayt sayaçları."""
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes = 0
+        self.last_seen = None
+
+    def as_dict(self):
+        return {'packets': self.packets, 'bytes': self.bytes, 'last_seen': self.last_seen}
+
+
+class RigRouter:
+    """
+    Datagramın geldiği soketin etiketinden ve kaynak adresinden rig etiketini
+    belirler, rig başına sayaçları tutar.
+
+    Kaynak adres eşlemesi soket etiketinden önceliklidir. Hiç kaynak eşlemesi
+    yoksa alıcı adres okumaz (``recv_into``), etiket yalnızca soketten gelir.
+    """
+
+    def __init__(self, sources=None, labels=(), clock=time.time):
+        # Kaynak IP -> rig etiketi
+        self.sources = dict((address, label) for label, address in (sources or ()))
+        self.clock = clock
+        self.rigs = {}
+        for label in [*labels, *self.sources.values()]:
+            self.add_label(label)
+
+    @property
+    def needs_address(self):
+        return bool(self.sources)
+
+    def add_label(self, label):
+        if label is not None and label not in self.rigs:
+            self.rigs[label] = RigStats()
+
+    def route(self, label, address, nbytes):
+        """Paketi sayar ve rig etiketini döndürür (belirlenemezse None)."""
+        if address is not None:
+            label = self.sources.get(address[0], label)
+        stats = self.rigs.get(label if label is not None else UNKNOWN_RIG)
+        if stats is None:
+            stats = self.rigs[UNKNOWN_RIG] = RigStats()
+        stats.packets += 1
+        stats.bytes += nbytes
+        stats.last_seen = self.clock()
+        return label
+
+    def packets(self):
+        """Durum satırı için rig başına alınan paket sayıları."""
+        return {label: stats.packets for label, stats in self.rigs.items()}
+
+    def stats(self):
+        return {label: stats.as_dict() for label, stats in self.rigs.items()}
@@ -0,0 +1,114 @@
+# listener/ring.py
+"""
+Datagramların kopyalanmadan çözülmesi için önceden ayrılmış halka tampon.
+
+Tüm slotlar tek bir ``bytearray`` üzerindedir ve soketten ``recv_into`` ile
+doğrudan slota okunur. Paket sınıfları slotun belleğine ``from_buffer`` ile
+bindirilir (overlay); bu nesneler slot başına ve paket türü başına yalnızca bir
+kez oluşturulup sonraki paketlerde yeniden kullanılır. CPython'da her pakette
+``from_buffer`` çağırmak ``from_buffer_copy``'den ucuz değildir (maliyet bellek
+kopyası değil nesne oluşturmadır); kazanç bu önbellekten gelir.
+
+Slotun ömrü açıkça yönetilir: ``acquire`` ile alınan slot, tüketici
+``release`` çağırana kadar yeniden kullanılmaz. Paketi daha uzun saklaması
+gereken tüketici ``copy`` ile kendi kopyasını alır.
+"""
+
+from collections import deque
+
+from listener.parser24 import PacketHeader
+from listener.udp import MAX_DATAGRAM_SIZE
+
+
+class RingSlot:
+    """Halkadaki tek bir slot; ``data`` yalnızca slot serbest bırakılana kadar geçerlidir."""
+
+    __slots__ = ('ring', 'index', 'view', 'data', 'nbytes', '_overlays')
+
+    def __init__(self, ring, index, view):
+        self.ring = ring
+        self.index = index
+        # Slotun tamamı; recv_into buraya okur.
+        self.view = view
+        # Son okunan datagram (view'in ilk nbytes baytı).
+        self.data = view[:0]
+        self.nbytes = 0
+        self._overlays = {}
+
+    def fill(self, nbytes):
+        self.nbytes = nbytes
+        self.data = self.view[:nbytes]
+
+    def overlay(self, packet_type):
+        """Slotun belleğine bindirilmiş ``packet_type`` nesnesi; uzunluk kontrolü çağırana aittir."""
+        packet = self._overlays.get(packet_type)
+        if packet is None:
+            packet = self._overlays[packet_type] = packet_type.view(self.view)
+        return packet
+
+    @property
+    def header(self):
+        return self.overlay(PacketHeader)
+
+    def copy(self):
+        """Datagramın slottan bağımsız kopyası (kuyrukta ya da süreçler arasında saklamak için)."""
+        return bytes(self.data)
+
+    def release(self):
+        self.ring.release(self)
+
+
+class PacketRing:
+    """
+    ``slots`` adet ``slot_size`` baytlık slottan oluşan halka.
+
+    ``acquire`` ve ``release`` farklı thread'lerden çağrılabilir (alıcı thread
+    alır, çözme işçisi bırakır); serbest slotlar ``deque`` içinde tutulur ve
+    bırakılma sırasıyla yeniden kullanılır.
+    """
+
+    def __init__(self, slots=1024, slot_size=MAX_DATAGRAM_SIZE):
+        self.slot_size = slot_size
+        self._buffer = bytearray(slots * slot_size)
+        memory = memoryview(self._buffer)
+        self.slots = [
+            RingSlot(self, index, memory[index * slot_size:(index + 1) * slot_size])
+            for index in range(slots)
+        ]
+        self._free = deque(self.slots)
+        self.acquired = 0
+        self.exhausted = 0
+        self.max_in_use = 0
+
+    @property
+    def capacity(self):
+        return len(self.slots)
+
+    @property
+    def available(self):
+        return len(self._free)
+
+    def acquire(self):
+        """Boş bir slot döndürür; tüm slotlar kullanımdaysa None döner (ve sayılır)."""
+        try:
+            slot = self._free.popleft()
+        except IndexError:
+            self.exhausted += 1
+            return None
+        self.acquired += 1
+        in_use = len(self.slots) - len(self._free)
+        if in_use > self.max_in_use:
+            self.max_in_use = in_use
+        return slot
+
+    def release(self, slot):
+        self._free.append(slot)
+
+    def stats(self):
+        return {
+            'capacity': self.capacity,
+            'in_use': self.capacity - self.available,
+            'max_in_use': self.max_in_use,
+            'acquired': self.acquired,
+            'exhausted': self.exhausted,
+        }
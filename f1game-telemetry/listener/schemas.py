@@ -0,0 +1,100 @@
+# listener/schemas.py
+"""
+Oyun yılına göre paket şemaları.
+
+Farklı yıllarda aynı paket ID'si farklı yapı taşıyabilir; datagramı yanlış
+yılın sınıfıyla çözmek hata vermeden anlamsız değerler üretir. Şemalar
+``(m_packet_format, m_packet_version, m_packet_id)`` anahtarıyla kaydedilir ve
+çözümleme, başlıktan tek ``unpack_from`` ile okunan bu anahtar üzerinden tek
+bir sözlük aramasıdır. Anahtar alanlarının başlıktaki yeri F1 23'ten bu yana
+aynıdır.
+
+Sonraki bir yıl önceki yıldan türetilir; yalnızca değişen paketler verilir::
+
+    SCHEMAS.register(2025, {2: PacketLapData25}, base=2024)
+
+Şu an ağaçta yalnızca F1 24 (``parser24``) yapıları bulunur.
+"""
+
+import struct
+from collections import namedtuple
+
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE, PacketHeader
+
+# m_packet_format (0), m_packet_version (5), m_packet_id (6)
+PACKET_KEY = struct.Struct('<H3xBB')
+HEADER_SIZE = PacketHeader.size()
+DEFAULT_PACKET_VERSION = 1
+# parser24 yapılarının oyun yılı
+DEFAULT_PACKET_FORMAT = 2024
+
+# size, datagramın beklenen tam boyutudur; farklı boyuttaki datagram çözülmeden reddedilir.
+PacketSchema = namedtuple('PacketSchema', ['packet_format', 'packet_version', 'packet_id', 'packet_type', 'size'])
+
+
+class SchemaRegistry:
+    """``(biçim, sürüm, paket ID)`` -> ``PacketSchema`` kayıt defteri."""
+
+    def __init__(self):
+        self._schemas = {}
+        # Biçim -> {paket ID: PacketSchema}; türetme için yıl başına tablo.
+        self._formats = {}
+
+    def register(self, packet_format, packet_types, base=None, versions=None, removed=()):
+        """
+        ``packet_format`` yılının paketlerini kaydeder. ``base`` verilirse o
+        yılın tüm paketleri (``removed`` dışındakiler) sürümleriyle birlikte
+        devralınır ve ``packet_types`` yalnızca farkları taşır. ``versions``
+        paket ID -> ``m_packet_version`` eşlemesidir (varsayılan 1).
+        """
+        versions = versions or {}
+        table = {}
+        if base is not None:
+            if base not in self._formats:
+                raise ValueError(f"Temel alınacak paket biçimi kayıtlı değil: {base}")
+            table = {
+                packet_id: schema._replace(packet_format=packet_format)
+                for packet_id, schema in self._formats[base].items()
+                if packet_id not in removed
+            }
+        for packet_id, packet_type in packet_types.items():
+            table[packet_id] = PacketSchema(
+                packet_format, versions.get(packet_id, DEFAULT_PACKET_VERSION),
+                packet_id, packet_type, packet_type.size(),
+            )
+        for packet_id, schema in self._formats.pop(packet_format, {}).items():
+            del self._schemas[(packet_format, schema.packet_version, packet_id)]
+        self._formats[packet_format] = table
+        for packet_id, schema in table.items():
+            self._schemas[(packet_format, schema.packet_version, packet_id)] = schema
+
+    def resolve(self, data):
+        """Başlıktaki anahtarın şemasını döndürür (boyut denetlenmez). ``data`` en az başlık boyutunda olmalıdır."""
+        return self._schemas.get(PACKET_KEY.unpack_from(data))
+
+    def lookup(self, data):
+        """Datagramın şemasını döndürür; bilinmeyen anahtar ya da beklenmeyen boyutta None döner."""
+        if len(data) < HEADER_SIZE:
+            return None
+        schema = self._schemas.get(PACKET_KEY.unpack_from(data))
+        if schema is None or len(data) != schema.size:
+            return None
+        return schema
+
+    def get(self, packet_format, packet_id, packet_version=DEFAULT_PACKET_VERSION):
+        return self._schemas.get((packet_format, packet_version, packet_id))
+
+    def packet_types(self, packet_format):
+        """Yılın paket ID -> paket sınıfı tablosu."""
+        return {packet_id: schema.packet_type for packet_id, schema in self._formats.get(packet_format, {}).items()}
+
+    @property
+    def formats(self):
+        return sorted(self._formats)
+
+    def __iter__(self):
+        return iter(self._schemas.values())
+
+
+SCHEMAS = SchemaRegistry()
+SCHEMAS.register(DEFAULT_PACKET_FORMAT, HEADER_FIELD_TO_PACKET_TYPE)
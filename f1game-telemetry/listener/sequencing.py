@@ -0,0 +1,144 @@
+# listener/sequencing.py
+"""
+Çerçeve kimliklerinden (``m_overall_frame_identifier``) paket kaybı, sıra dışı
+varış ve varış titreşimi (jitter) tespiti.
+
+Oyun her paket türünü kendi hızında gönderir (ör. 60 Hz oyunda 20 Hz UDP
+ayarıyla her 3 çerçevede bir). Bu yüzden her akışın çerçeve adımı, görülen en
+küçük pozitif farktan öğrenilir; adımın katı kadar atlama kayıp sayılır.
+``m_frame_identifier`` flashback sonrası geri sardığı için ``overall`` değeri
+kullanılır.
+"""
+
+from listener.parser24 import HEADER_FIELD_TO_PACKET_TYPE
+
+# Düzenli aralıklarla gönderilen türler. Olay (3), final sınıflandırma (8),
+# lobi (9), tur geçmişi (11) ve lastik setleri (12) olay güdümlü ya da
+# araçlar arasında dönerek gönderildiği için sıra takibine alınmaz.
+SEQUENCED_PACKET_IDS = frozenset({0, 1, 2, 4, 5, 6, 7, 10, 13, 14})
+
+# RFC 3550'deki gibi jitter tahmini için yumuşatma katsayısı.
+JITTER_GAIN = 1 / 16
+
+
+class StreamStats:
+    """Tek bir (seans, paket türü) akışının sayaçları."""
+
+    __slots__ = ('received', 'lost', 'out_of_order', 'duplicates', 'stride',
+                 'last_frame', 'last_arrival', 'last_transit', 'jitter', 'max_gap')
+
+    def __init__(self):
+        self.received = 0
+        self.lost = 0
+        self.out_of_order = 0
+        self.duplicates = 0
+        self.stride = None
+        self.last_frame = None
+        self.last_arrival = None
+        self.last_transit = None
+        self.jitter = 0.0
+        self.max_gap = 0.0
+
+    def observe(self, frame_id, session_time, received_at):
+        self.received += 1
+
+        # Jitter: gönderim zamanı olarak m_session_time kullanılır.
+        transit = received_at - session_time
+        if self.last_transit is not None:
+            self.jitter += (abs(transit - self.last_transit) - self.jitter) * JITTER_GAIN
+        self.last_transit = transit
+
+        if self.last_arrival is not None:
+            gap = received_at - self.last_arrival
+            if gap > self.max_gap:
+                self.max_gap = gap
+        self.last_arrival = received_at
+
+        if self.last_frame is None:
+            self.last_frame = frame_id
+            return
+
+        delta = frame_id - self.last_frame
+        if delta == 0:
+            self.duplicates += 1
+            return
+        if delta < 0:
+            # Geç gelen paket daha önce kayıp sayılmış olabilir.
+            self.out_of_order += 1
+            if self.lost:
+                self.lost -= 1
+            return
+
+        if self.stride is None or delta < self.stride:
+            self.stride = delta
+        self.lost += delta // self.stride - 1
+        self.last_frame = frame_id
+
+    def as_dict(self):
+        expected = self.received + self.lost
+        return {
+            'received': self.received,
+            'lost': self.lost,
+            'out_of_order': self.out_of_order,
+            'duplicates': self.duplicates,
+            'loss_ratio': round(self.lost / expected, 5) if expected else 0.0,
+            'frame_stride': self.stride,
+            'jitter_ms': round(self.jitter * 1000, 3),
+            'max_gap_ms': round(self.max_gap * 1000, 3),
+        }
+
+
+class SequenceTracker:
+    """
+    Seans ve paket türü başına kayıp/jitter sayaçlarını tutar. Seans anahtarı
+    ``SessionRegistry.stream_key`` değeridir; aynı UID'yi bildiren rig'ler ayrı
+    sayılır ve birbirlerinin kare sırasını kayıp ya da sıra dışı göstermez.
+    """
+
+    def __init__(self):
+        self._streams = {}
+        self.received = 0
+        self.lost = 0
+        self.out_of_order = 0
+
+    def observe(self, session_uid, packet_id, frame_id, session_time, received_at):
+        if packet_id not in SEQUENCED_PACKET_IDS:
+            return
+        key = (session_uid, packet_id)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = StreamStats()
+
+        lost, out_of_order = stream.lost, stream.out_of_order
+        stream.observe(frame_id, session_time, received_at)
+        self.received += 1
+        self.lost += stream.lost - lost
+        self.out_of_order += stream.out_of_order - out_of_order
+
+    def sessions(self):
+        return {session_uid for session_uid, _ in self._streams}
+
+    def summary(self, session_uid):
+        """Seansın kalıcı olarak saklanacak özetini döndürür."""
+        # Anahtarlar UID ya da (UID, rig) olabildiğinden önce seçilip paket ID'sine göre sıralanır.
+        streams = sorted((packet_id, stream) for (uid, packet_id), stream in self._streams.items() if uid == session_uid)
+        by_type = {HEADER_FIELD_TO_PACKET_TYPE[packet_id].__name__: stream.as_dict() for packet_id, stream in streams}
+        received = sum(s['received'] for s in by_type.values())
+        lost = sum(s['lost'] for s in by_type.values())
+        return {
+            'received': received,
+            'lost': lost,
+            'out_of_order': sum(s['out_of_order'] for s in by_type.values()),
+            'duplicates': sum(s['duplicates'] for s in by_type.values()),
+            'loss_ratio': round(lost / (received + lost), 5) if received + lost else 0.0,
+            'by_type': by_type,
+        }
+
+    def totals(self):
+        expected = self.received + self.lost
+        return {
+            'received': self.received,
+            'lost': self.lost,
+            'out_of_order': self.out_of_order,
+            'loss_ratio': round(self.lost / expected, 5) if expected else 0.0,
+        }
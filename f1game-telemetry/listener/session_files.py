@@ -0,0 +1,62 @@
+# listener/session_files.py
+"""
+``data/`` altındaki seans klasörlerinin düzeni.
+
+Dinleyici her seansı ``session_<UID>/`` klasörüne yazar; aynı UID'yi bildiren
+ikinci bir rig'in akışı bu klasörün altındaki ``rig_<etiket>/`` klasörüne
+gider. Aktarım, kanal çıkarma ve yeniden oynatma log dosyalarını buradaki
+yardımcılarla bulur.
+"""
+
+import os
+
+from listener.capture import CAPTURE_FILENAME
+from listener.writers import RIG_DIR_PREFIX, rig_dir_name
+
+JSONL_FILENAME = 'telemetry_log.jsonl'
+SESSION_DIR_PREFIX = 'session_'
+
+
+def session_dirs(data_dir):
+    """``data_dir`` altındaki seans klasörlerini ada göre sıralı döndürür."""
+    if not os.path.isdir(data_dir):
+        return []
+    return sorted(
+        os.path.join(data_dir, name) for name in os.listdir(data_dir)
+        if name.startswith(SESSION_DIR_PREFIX) and os.path.isdir(os.path.join(data_dir, name))
+    )
+
+
+def find_session_dir(data_dir, key):
+    """Seans klasörünü tam ada, seans UID'sine ya da UID'nin başına göre bulur."""
+    key = key[len(SESSION_DIR_PREFIX):] if key.startswith(SESSION_DIR_PREFIX) else key
+    matches = [path for path in session_dirs(data_dir) if os.path.basename(path)[len(SESSION_DIR_PREFIX):].startswith(key)]
+    exact = [path for path in matches if os.path.basename(path) == SESSION_DIR_PREFIX + key]
+    if exact:
+        return exact[0]
+    if len(matches) != 1:
+        return None
+    return matches[0]
+
+
+def rig_stream_dir(session_dir, rig):
+    """
+    Seansla aynı UID'yi bildiren ikinci bir rig'in akış klasörü. Klasör, seans
+    klasörüyle aynı log dosyalarını içerir; bu yüzden seans klasörü bekleyen
+    her fonksiyona verilebilir.
+    """
+    return os.path.join(session_dir, rig_dir_name(rig))
+
+
+def session_rigs(session_dir):
+    """Seans klasöründeki ikinci rig akışlarının (klasör adındaki) etiketleri."""
+    return sorted(
+        name[len(RIG_DIR_PREFIX):] for name in os.listdir(session_dir)
+        if name.startswith(RIG_DIR_PREFIX) and os.path.isdir(os.path.join(session_dir, name))
+    )
+
+
+def session_log_paths(session_dir):
+    """Seans klasöründeki log dosyalarını (önce eski JSONL, sonra ikili kayıt) döndürür."""
+    candidates = [os.path.join(session_dir, JSONL_FILENAME), os.path.join(session_dir, CAPTURE_FILENAME)]
+    return [path for path in candidates if os.path.exists(path)]
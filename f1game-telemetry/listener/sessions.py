@@ -0,0 +1,147 @@
+# listener/sessions.py
+
+from dashboard.models import RaceSession
+
+
+def rig_conflict_message(session_uid, owner, rig, separated):
+    """``SessionRegistry.pop_rig_conflicts`` çakışması için konsol uyarısı."""
+    if separated:
+        return (f"Uyarı: {rig} rig'i, {owner} rig'ine ait seansla aynı UID'yi ({session_uid}) bildiriyor; "
+                f"paketleri seansa karıştırılmadan ayrı bir kayda (rig_ klasörü) yazılıyor.")
+    return (f"Uyarı: Seans (ID: {session_uid}) daha önce {owner} rig'iyle kaydedilmiş; "
+            f"şimdi {rig} rig'inden geliyor, etiket değiştirilmedi.")
+
+
+class SessionRegistry:
+    """
+    Dinleyici içinde ``m_session_uid`` -> ``RaceSession`` eşlemesini bellekte tutar.
+
+    Her seans veritabanından yalnızca ilk paketinde okunur (ya da oluşturulur);
+    sonraki paketler sözlükten çözülür. Pist bilgisi de seans başına bir kez
+    uygulanır ve yalnızca değer gerçekten değiştiğinde kaydedilir. Birden fazla
+    rig dinlenirken seansın rig etiketi de ilk pakette kaydedilir.
+
+    Aynı çok oyunculu lobideki rig'ler aynı ``m_session_uid`` değerini
+    bildirebilir. Seans, o UID ile dinleyiciye ilk paketi gelen rig'indir;
+    diğer rig'lerin paketleri ``stream_key`` ile ``(UID, rig)`` anahtarlı ayrı
+    bir akışa yönlendirilir ve seansın kaydına karıştırılmaz.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._track_applied = set()
+        # UID -> seansın sahibi olan rig; (UID, rig) ayrı akışları
+        self._owners = {}
+        self._foreign = set()
+        # Henüz bildirilmemiş çakışmalar: (UID, sahip rig, diğer rig, ayrı akışa alındı mı)
+        self._conflicts = []
+        self.hits = 0
+        self.misses = 0
+        self.db_writes = 0
+
+    def cached(self, session_uid):
+        """Seans önbellekteyse döndürür (isabet sayılır), değilse None döner."""
+        session_obj = self._sessions.get(session_uid)
+        if session_obj is not None:
+            self.hits += 1
+        return session_obj
+
+    def stream_key(self, session_uid, rig=None):
+        """
+        Paketin kayıt dosyası ve sıra takibi anahtarını döndürür: seansın kendi
+        paketleri için UID, aynı UID'yi bildiren başka bir rig için ``(UID,
+        rig)``. Veritabanına dokunmaz; etiketsiz paketler her zaman seansındır.
+        """
+        if rig is None:
+            return session_uid
+        owner = self._owners.setdefault(session_uid, rig)
+        if owner == rig:
+            return session_uid
+        key = (session_uid, rig)
+        if key not in self._foreign:
+            self._foreign.add(key)
+            self._conflicts.append((session_uid, owner, rig, True))
+        return key
+
+    def pop_rig_conflicts(self):
+        """Son çağrıdan bu yana görülen çakışmaları ``rig_conflict_message`` ile yazılacak biçimde döndürür."""
+        conflicts, self._conflicts = self._conflicts, []
+        return conflicts
+
+    def needs_track(self, session_uid):
+        return session_uid not in self._track_applied
+
+    def resolve(self, session_uid, rig=None):
+        """``(RaceSession, created)`` döndürür; ``created`` yalnızca yeni kayıtta True olur."""
+        session_obj = self._sessions.get(session_uid)
+        if session_obj is not None:
+            self.hits += 1
+            return session_obj, False
+
+        self.misses += 1
+        session_obj, created = RaceSession.objects.get_or_create(
+            session_uid=str(session_uid), defaults={'rig': rig or ''},
+        )
+        if created:
+            self.db_writes += 1
+        elif rig and not session_obj.rig:
+            # Etiketsiz kaydedilmiş (ör. tek rig'li dinleyiciden kalan) seansa etiket ekleniyor.
+            session_obj.rig = rig
+            session_obj.save(update_fields=['rig'])
+            self.db_writes += 1
+        elif rig and session_obj.rig != rig:
+            # Önceki bir dinlemede başka rig'le kaydedilmiş seans; sessizce birleştirilmez.
+            self._conflicts.append((session_uid, session_obj.rig, rig, False))
+        self._sessions[session_uid] = session_obj
+        return session_obj, created
+
+    def rig_of(self, session_uid):
+        if isinstance(session_uid, tuple):
+            # stream_key ile ayrılmış (UID, rig) akışı
+            return session_uid[1]
+        session_obj = self._sessions.get(session_uid)
+        return (session_obj.rig or None) if session_obj is not None else None
+
+    def apply_track(self, session_uid, track_id):
+        """
+        ``PacketSessionData`` içindeki pist ID'sini seansa uygular.
+        Veritabanına yazma yapıldıysa True döndürür.
+        """
+        if session_uid in self._track_applied:
+            return False
+        self._track_applied.add(session_uid)
+
+        session_obj = self._sessions.get(session_uid) or self.resolve(session_uid)[0]
+        # Eski davranışla uyumlu olarak yalnızca bilinmeyen pist ID'sini dolduruyoruz.
+        if session_obj.track_id is not None:
+            return False
+        session_obj.track_id = track_id
+        session_obj.save(update_fields=['track_id'])
+        self.db_writes += 1
+        return True
+
+    def save_capture_stats(self, session_uid, capture_stats):
+        """Dinleyicinin ölçtüğü kayıp/jitter özetini seansa yazar (değiştiyse)."""
+        session_obj = self._sessions.get(session_uid)
+        if session_obj is None or session_obj.capture_stats == capture_stats:
+            return False
+        session_obj.capture_stats = capture_stats
+        session_obj.save(update_fields=['capture_stats'])
+        self.db_writes += 1
+        return True
+
+    def sessions_by_rig(self):
+        counts = {}
+        for session_obj in self._sessions.values():
+            counts[session_obj.rig or None] = counts.get(session_obj.rig or None, 0) + 1
+        for _, rig in self._foreign:
+            counts[rig] = counts.get(rig, 0) + 1
+        return counts
+
+    def stats(self):
+        return {
+            'sessions': len(self._sessions),
+            'hits': self.hits,
+            'misses': self.misses,
+            'db_writes': self.db_writes,
+        }
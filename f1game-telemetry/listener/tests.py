@@ -1,3 +1,177 @@
-from django.test import TestCase
+import io
+import os
+import random
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from dashboard.models import Lap, RaceSession, TelemetryData
+from listener import parser24
+from listener.capture import CAPTURE_FILENAME, CAPTURE_MAGIC, encode_record
+from listener.intervals import IntervalIndex
+
+
+def _packet(packet_type, packet_id, session_uid, session_time, frame):
+    packet = packet_type()
+    header = packet.m_header
+    header.m_packet_format = 2024
+    header.m_game_year = 24
+    header.m_packet_version = 1
+    header.m_packet_id = packet_id
+    header.m_session_uid = session_uid
+    header.m_session_time = session_time
+    header.m_frame_identifier = frame
+    header.m_overall_frame_identifier = frame
+    return packet
+
+
+def session_capture(session_uid, laps=3, lap_seconds=4.0, hz=10, speed_offset=0):
+    """Oyuncu aracı 0 olan, ``laps`` turluk bir seansın kayıt dosyası baytları."""
+    records = [CAPTURE_MAGIC]
+    for frame in range(int(laps * lap_seconds * hz) + hz):
+        session_time = frame / hz
+        lap_number = int(session_time // lap_seconds) + 1
+        packets = []
+        if frame % hz == 0:
+            session = _packet(parser24.PacketSessionData, 1, session_uid, session_time, frame)
+            session.m_track_id, session.m_session_type, session.m_game_mode = 10, 15, 3
+            packets.append(session)
+        lap = _packet(parser24.PacketLapData, 2, session_uid, session_time, frame)
+        lap.m_lap_data[0].m_current_lap_num = lap_number
+        lap.m_lap_data[0].m_last_lap_time_in_ms = int(lap_seconds * 1000) if lap_number > 1 else 0
+        packets.append(lap)
+        telemetry = _packet(parser24.PacketCarTelemetryData, 6, session_uid, session_time, frame)
+        car = telemetry.m_car_telemetry_data[0]
+        car.m_speed, car.m_throttle, car.m_gear, car.m_drs = 100 + frame + speed_offset, 0.5, 5, frame % 2
+        packets.append(telemetry)
+        status = _packet(parser24.PacketCarStatusData, 7, session_uid, session_time, frame)
+        car = status.m_car_status_data[0]
+        car.m_fuel_in_tank, car.m_visual_tyre_compound, car.m_ers_deploy_mode = 100 - session_time, 16, lap_number % 4
+        packets.append(status)
+        records.extend(encode_record(session_time, bytes(packet)) for packet in packets)
+    return b''.join(records)
+
+
+class IncrementalImportTests(TestCase):
+    """Büyüyen, değişen ve silinen loglardan sonra artımlı aktarım tam aktarımla aynı sonucu vermeli."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+
+    def write_log(self, session_uid, data):
+        session_dir = os.path.join('data', f'session_{session_uid}')
+        os.makedirs(session_dir, exist_ok=True)
+        with open(os.path.join(session_dir, CAPTURE_FILENAME), 'wb') as f:
+            f.write(data)
+
+    def run_import(self, *args, **options):
+        call_command('import_sessions', *args, stdout=io.StringIO(), **options)
+        return self.snapshot()
+
+    def snapshot(self):
+        sessions = []
+        for session in RaceSession.objects.order_by('session_uid'):
+            laps = list(Lap.objects.filter(session=session).order_by('lap_number').values_list(
+                'lap_number', 'lap_time_ms', 'start_time', 'end_time', 'tyre_compound', 'ers_deploy_mode', 'drs_ratio',
+            ))
+            points = list(TelemetryData.objects.filter(session=session).order_by('session_time').values_list(
+                'lap__lap_number', 'session_time', 'lap_time', 'speed', 'throttle', 'brake', 'gear', 'fuel_in_tank',
+                'rpm', 'drs', 'ers_store_energy', 'ers_deploy_mode',
+            ))
+            sessions.append((session.session_uid, session.track_id, session.session_type, session.game_mode, laps, points))
+        return sessions
+
+    def assert_matches_full_import(self, incremental):
+        self.assertEqual(incremental, self.run_import(full=True))
+
+    def test_growing_log(self):
+        data = session_capture(111)
+        other = session_capture(222)
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                # Kesimler kayıt ortalarına da düşer; yarım kayıt bir sonraki aktarımda okunur.
+                for cut in (len(CAPTURE_MAGIC) + 1, len(data) // 5, len(data) // 2 + 7, len(data) - 3, len(data)):
+                    self.write_log(111, data[:cut])
+                    self.write_log(222, other[:cut])
+                    incremental = self.run_import(workers=workers)
+                self.assertEqual(len(incremental[0][4]), 3)
+                self.assert_matches_full_import(incremental)
+                RaceSession.objects.all().delete()
+
+    def test_modified_log(self):
+        self.write_log(111, session_capture(111))
+        self.run_import()
+        # Aynı boyutta, farklı içerikli kayıt
+        self.write_log(111, session_capture(111, speed_offset=50))
+        self.assert_matches_full_import(self.run_import())
+
+        # Kesilip daha kısa bir seansla yeniden yazılan kayıt
+        self.write_log(111, session_capture(111, laps=2))
+        incremental = self.run_import()
+        self.assertEqual(len(incremental[0][4]), 2)
+        self.assert_matches_full_import(incremental)
+
+    def test_deleted_log(self):
+        self.write_log(111, session_capture(111))
+        self.write_log(222, session_capture(222))
+        self.run_import()
+        shutil.rmtree(os.path.join('data', 'session_222'))
+        incremental = self.run_import()
+        self.assertEqual([session[0] for session in incremental], ['111'])
+        self.assert_matches_full_import(incremental)
+
+
+class IntervalIndexTests(SimpleTestCase):
+    """``IntervalIndex.find`` aralıkları öncelik ve ekleme sırasıyla tek tek denemekle aynı sonucu vermeli."""
+
+    def linear_find(self, intervals, time):
+        ordered = sorted(enumerate(intervals), key=lambda item: (item[1][3], item[0]))
+        for _, (start, end, value, _) in ordered:
+            if start is not None and end is not None and start <= time < end:
+                return value
+        return None
+
+    def random_intervals(self, rng):
+        intervals = []
+        for value in range(rng.randint(0, 12)):
+            start = rng.choice([None, rng.randint(0, 20) + rng.choice([0, 0.5])])
+            if start is None or rng.random() < 0.1:
+                end = rng.choice([None, rng.randint(0, 20) + rng.choice([0, 0.5])])
+            else:
+                # Boş, ters ve birbirine taşan aralıklar da üretilir.
+                end = start + rng.randint(-2, 8)
+            intervals.append((start, end, value, rng.randint(0, 4)))
+        return intervals
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        # Sınırların kendisi, aralarındaki değerler ve tüm aralıkların dışı denenir.
+        times = [quarter / 4 for quarter in range(-8, 120)]
+        for _ in range(1000):
+            intervals = self.random_intervals(rng)
+            index = IntervalIndex()
+            for start, end, value, priority in intervals:
+                index.add(start, end, value, priority=priority)
+            for time in times:
+                self.assertEqual(index.find(time), self.linear_find(intervals, time), (intervals, time))
+            self.assertIsNone(index.find(float('nan')))
+
+    def test_overlapping_laps_added_while_searching(self):
+        # Canlı aktarımda olduğu gibi turlar arama yapılırken eklenir; tur süresinden
+        # geri hesaplanan başlangıç önceki turun bitişinden önce kalabilir.
+        rng = random.Random(11)
+        for _ in range(200):
+            index, intervals, start = IntervalIndex(), [], 0.0
+            for lap_number in range(1, rng.randint(2, 8)):
+                end = start + rng.uniform(1, 5)
+                intervals.append((start, end, lap_number, lap_number))
+                index.add(start, end, lap_number, priority=lap_number)
+                for time in (start, end, rng.uniform(start - 1, end + 1)):
+                    self.assertEqual(index.find(time), self.linear_find(intervals, time))
+                start = end - rng.choice([0, 0, rng.uniform(0, 0.5)])
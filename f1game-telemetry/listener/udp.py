@@ -0,0 +1,115 @@
+# listener/udp.py
+"""
+UDP soketi kurulumu ve toplu (batch) datagram alma.
+
+``BatchReceiver`` her uyanışta soketteki tüm hazır datagramları önceden
+ayrılmış tamponlara ``recv_into`` ile okur. Böylece paket başına bir
+``poll`` + ``recvfrom`` çifti yerine, bekleme başına bir ``select`` ve
+paket başına tek bir ``recv_into`` çağrısı yapılır.
+"""
+
+import select
+import socket
+
+MAX_DATAGRAM_SIZE = 2048
+
+
+def open_udp_socket(host, port, rcvbuf=None, blocking=False):
+    """
+    Dinleme soketini açar. ``rcvbuf`` verilirse SO_RCVBUF bind'dan önce
+    ayarlanır; çekirdeğin gerçekte uyguladığı değer ``effective_rcvbuf`` ile
+    okunabilir (Linux istenen değeri iki katına çıkarır ve rmem_max ile sınırlar).
+    """
+    udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    if rcvbuf:
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    udp_socket.bind((host, port))
+    udp_socket.setblocking(blocking)
+    return udp_socket
+
+
+def effective_rcvbuf(udp_socket):
+    return udp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+
+class BatchReceiver:
+    """
+    Önceden ayrılmış ``batch_size`` adet tampondan oluşan havuza toplu okuma.
+
+    ``receive`` en fazla ``timeout`` saniye bekler ve okunan datagramları
+    ``(memoryview dilimi, rig etiketi)`` çiftleri olarak döndürür. Dilimler bir
+    sonraki ``receive`` çağrısına kadar geçerlidir; daha uzun saklanacaksa
+    ``bytes()`` ile kopyalanmalıdır.
+
+    Birden fazla soket verilebilir: ``udp_socket`` tek bir soket ya da
+    ``(soket, rig etiketi)`` çiftlerinin listesidir. Tüm soketler tek bir
+    ``select`` ile beklenir ve tampon havuzu hazır soketler arasında eşit
+    paylaştırılır; yoğun bir rig diğerlerini bekletmez. ``router`` verilirse
+    etiket ve rig başına sayaçlar ``RigRouter`` üzerinden belirlenir.
+
+    ``ring`` (``PacketRing``) verilirse datagramlar doğrudan halka slotlarına
+    okunur ve memoryview yerine ``RingSlot`` döner. Slotlar bir sonraki
+    ``receive`` çağrısında değil, tüketici ``release`` çağırdığında geri
+    kazanılır; bu sayede paketler kopyalanmadan başka thread'lere aktarılabilir.
+    Boş slot kalmazsa okuma durur ve datagramlar çekirdek tamponunda bekler.
+    """
+
+    def __init__(self, udp_socket, batch_size=64, datagram_size=MAX_DATAGRAM_SIZE, router=None, ring=None):
+        sources = [(udp_socket, None)] if isinstance(udp_socket, socket.socket) else list(udp_socket)
+        self._labels = {}
+        for sock, label in sources:
+            sock.setblocking(False)
+            self._labels[sock] = label
+            if router is not None:
+                router.add_label(label)
+        self.udp_socket = sources[0][0]
+        self.sockets = [sock for sock, _ in sources]
+        self.router = router
+        self.ring = ring
+        self.batch_size = batch_size
+        self._views = [memoryview(bytearray(datagram_size)) for _ in range(batch_size)] if ring is None else []
+        self.wakeups = 0
+        self.received = 0
+
+    def receive(self, timeout):
+        readable, _, _ = select.select(self.sockets, [], [], timeout)
+        if not readable:
+            return []
+        self.wakeups += 1
+
+        batch = []
+        views, ring = self._views, self.ring
+        route = self.router.route if self.router is not None else None
+        with_address = route is not None and self.router.needs_address
+        for index, sock in enumerate(readable):
+            label = self._labels[sock]
+            # Kalan tamponlar, okunmayı bekleyen soketler arasında eşit bölünür.
+            limit = len(batch) + (self.batch_size - len(batch)) // (len(readable) - index)
+            recv_into = sock.recvfrom_into if with_address else sock.recv_into
+            while len(batch) < limit:
+                if ring is None:
+                    buffer = views[len(batch)]
+                else:
+                    slot = ring.acquire()
+                    if slot is None:
+                        break
+                    buffer = slot.view
+                try:
+                    result = recv_into(buffer)
+                except BlockingIOError:
+                    if ring is not None:
+                        ring.release(slot)
+                    break
+                nbytes, address = result if with_address else (result, None)
+                rig = route(label, address, nbytes) if route is not None else label
+                if ring is None:
+                    batch.append((buffer[:nbytes], rig))
+                else:
+                    slot.fill(nbytes)
+                    batch.append((slot, rig))
+        self.received += len(batch)
+        return batch
+
+    @property
+    def average_batch(self):
+        return self.received / self.wakeups if self.wakeups else 0.0
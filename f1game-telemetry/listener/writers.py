@@ -0,0 +1,189 @@
+# listener/writers.py
+
+import os
+import re
+import time
+from collections import OrderedDict
+
+RIG_DIR_PREFIX = 'rig_'
+
+
+def rig_dir_name(rig):
+    """Aynı UID'yi bildiren ikinci bir rig'in akışının, seans klasörü altındaki klasör adı."""
+    return RIG_DIR_PREFIX + re.sub(r'[^\w.-]+', '_', rig)
+
+
+class WriterStats:
+    """Yazıcı havuzunun toplam sayaçlarını tutar."""
+
+    def __init__(self):
+        self.bytes_written = 0
+        self.packets_written = 0
+        self.flushes = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_max = 0.0
+        self.files_opened = 0
+        self.files_evicted = 0
+        self.files_closed_idle = 0
+
+    def record_flush(self, nbytes, elapsed):
+        self.bytes_written += nbytes
+        self.flushes += 1
+        self.flush_seconds_total += elapsed
+        if elapsed > self.flush_seconds_max:
+            self.flush_seconds_max = elapsed
+
+    @property
+    def flush_seconds_avg(self):
+        return self.flush_seconds_total / self.flushes if self.flushes else 0.0
+
+    def as_dict(self):
+        return {
+            'bytes_written': self.bytes_written,
+            'packets_written': self.packets_written,
+            'flushes': self.flushes,
+            'flush_ms_avg': round(self.flush_seconds_avg * 1000, 3),
+            'flush_ms_max': round(self.flush_seconds_max * 1000, 3),
+            'files_opened': self.files_opened,
+            'files_evicted': self.files_evicted,
+            'files_closed_idle': self.files_closed_idle,
+        }
+
+
+class SessionLogWriter:
+    """
+    Tek bir seansın log dosyasını açık tutar ve gelen kayıtları bellekte
+    biriktirerek toplu halde diske yazar.
+    """
+
+    def __init__(self, path, stats, buffer_size, now, file_header=b''):
+        self.path = path
+        self.stats = stats
+        self.buffer_size = buffer_size
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        # Tamponu kendimiz yönettiğimiz için dosyayı tamponsuz açıyoruz.
+        self._file = open(path, 'ab', buffering=0)
+        if is_new and file_header:
+            self._file.write(file_header)
+        self._chunks = []
+        self._pending = 0
+        self.last_write = now
+        self.last_flush = now
+
+    def write(self, data, now):
+        self._chunks.append(data)
+        self._pending += len(data)
+        self.stats.packets_written += 1
+        self.last_write = now
+        if self._pending >= self.buffer_size:
+            self.flush(now)
+
+    def flush(self, now):
+        self.last_flush = now
+        if not self._chunks:
+            return
+        started = time.perf_counter()
+        self._file.write(b''.join(self._chunks))
+        self.stats.record_flush(self._pending, time.perf_counter() - started)
+        self._chunks = []
+        self._pending = 0
+
+    def close(self, now):
+        self.flush(now)
+        self._file.close()
+
+
+class LogWriterPool:
+    """
+    Seans başına açık dosya tutamaçlarını LRU düzeninde saklayan yazıcı havuzu.
+
+    Her paket için dosya açıp kapatmak yerine en son kullanılan ``max_open``
+    seansın dosyası açık tutulur. Tampon ``buffer_size`` bayta ulaştığında ya
+    da son boşaltmanın üzerinden ``flush_interval`` saniye geçtiğinde diske
+    yazılır; ``idle_timeout`` saniye boyunca yazılmayan seanslar kapatılır.
+    ``file_header`` verilirse yeni oluşturulan her dosyanın başına yazılır.
+    """
+
+    def __init__(self, data_dir, filename, max_open=8, buffer_size=64 * 1024,
+                 flush_interval=1.0, idle_timeout=30.0, clock=time.monotonic,
+                 file_header=b''):
+        self.data_dir = data_dir
+        self.filename = filename
+        self.file_header = file_header
+        self.max_open = max_open
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.stats = WriterStats()
+        self._writers = OrderedDict()
+        self._last_tick = clock()
+
+    def path_for(self, session_uid):
+        """
+        Seansın kayıt dosyası. ``SessionRegistry.stream_key``'in ``(UID, rig)``
+        anahtarları, aynı UID'yi bildiren ikinci bir rig'in akışıdır; bu akış
+        seans klasörü altında ``rig_<etiket>`` klasörüne yazılır.
+        """
+        if isinstance(session_uid, tuple):
+            session_uid, rig = session_uid
+            return os.path.join(self.data_dir, f"session_{session_uid}", rig_dir_name(rig), self.filename)
+        return os.path.join(self.data_dir, f"session_{session_uid}", self.filename)
+
+    def write(self, session_uid, data):
+        """``data`` baytlarını ilgili seansın tamponuna ekler."""
+        now = self.clock()
+        writer = self._writers.get(session_uid)
+        if writer is None:
+            writer = self._open(session_uid, now)
+        else:
+            self._writers.move_to_end(session_uid)
+        writer.write(data, now)
+        if now - writer.last_flush >= self.flush_interval:
+            writer.flush(now)
+
+    def tick(self):
+        """
+        Ana döngüden düzenli olarak çağrılır. Süresi dolan tamponları boşaltır
+        ve uzun süredir yazılmayan seansların dosyalarını kapatır.
+        """
+        now = self.clock()
+        if now - self._last_tick < min(self.flush_interval, self.idle_timeout):
+            return
+        self._last_tick = now
+        for session_uid, writer in list(self._writers.items()):
+            if now - writer.last_write >= self.idle_timeout:
+                writer.close(now)
+                del self._writers[session_uid]
+                self.stats.files_closed_idle += 1
+            elif now - writer.last_flush >= self.flush_interval:
+                writer.flush(now)
+
+    def flush_all(self):
+        now = self.clock()
+        for writer in self._writers.values():
+            writer.flush(now)
+
+    def close_all(self):
+        now = self.clock()
+        while self._writers:
+            _, writer = self._writers.popitem(last=False)
+            writer.close(now)
+
+    @property
+    def open_sessions(self):
+        return list(self._writers)
+
+    def _open(self, session_uid, now):
+        # Havuz doluysa en uzun süredir kullanılmayan seansı kapatıyoruz.
+        while len(self._writers) >= self.max_open:
+            _, evicted = self._writers.popitem(last=False)
+            evicted.close(now)
+            self.stats.files_evicted += 1
+
+        path = self.path_for(session_uid)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        writer = SessionLogWriter(path, self.stats, self.buffer_size, now, self.file_header)
+        self._writers[session_uid] = writer
+        self.stats.files_opened += 1
+        return writer